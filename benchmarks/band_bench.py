@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Microbenchmark: choose_band vs the per-crop scorer it replaced, BandPreprocessor vs preprocess_band_for_ocr
+
+Usage:
+    python -m benchmarks.band_bench                      # timing at 720p-1440p
+    python -m benchmarks.band_bench --check              # equivalence check only
+
+--check compares choose_band against choose_band_reference (score_white_text on
+every candidate crop, the original implementation) on random-noise frames and on
+rendered frames with white text in the carousel band, on BGR and on BGRA (the mss
+layout) input. It also compares BandPreprocessor output and thumb_diff against
+preprocess_band_for_ocr and the original numpy thumbnail diff on successive bands,
+and checks that detached buffers are recycled instead of reallocated.
+"""
+
+import os
+import sys
+import time
+import argparse
+from typing import Callable, Iterator, List, Tuple
+import numpy as np
+import cv2
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ocr.image_processing import (  # noqa: E402
+    BandPreprocessor, band_candidates, choose_band, preprocess_band_for_ocr, score_white_text,
+)
+
+RESOLUTIONS = [(1280, 720), (1600, 900), (1920, 1080), (2560, 1440)]
+
+
+def choose_band_reference(frame: np.ndarray) -> Tuple[int, int, int, int]:
+    """Original choose_band: score_white_text on each candidate crop"""
+    h, w = frame.shape[:2]
+    x1 = int(w * (28.0 / 100.0))
+    x2 = int(w * (72.0 / 100.0))
+    best = (-1.0, 0, 0)
+    for T, B in band_candidates(h, (62.0, 6.5), (52.0, 70.0), steps=9):
+        y1 = int(h * (T / 100.0))
+        y2 = int(h * (B / 100.0))
+        if y2 - y1 < 24:
+            continue
+        sc = score_white_text(frame[y1:y2, x1:x2])
+        if sc > best[0]:
+            best = (sc, y1, y2)
+    y1, y2 = (int(h * 0.58), int(h * 0.66)) if best[0] < 0 else (best[1], best[2])
+    return x1, y1, x2, y2
+
+
+def rendered_frame(rng: np.random.Generator, w: int, h: int) -> np.ndarray:
+    """Dark noisy background with a white skin-name-like line somewhere in the candidate span"""
+    frame = rng.integers(0, 90, (h, w, 3), dtype=np.uint8)
+    frame = cv2.GaussianBlur(frame, (0, 0), 3)
+    y = int(h * rng.uniform(0.54, 0.68))
+    x = int(w * rng.uniform(0.32, 0.45))
+    scale = h / 720.0 * rng.uniform(0.7, 1.3)
+    cv2.putText(frame, "Goth Annie", (x, y), cv2.FONT_HERSHEY_SIMPLEX, scale, (255, 255, 255),
+                max(1, int(2 * scale)), cv2.LINE_AA)
+    return frame
+
+
+def frames(seed: int, per_resolution: int) -> Iterator[Tuple[str, np.ndarray]]:
+    rng = np.random.default_rng(seed)
+    for w, h in RESOLUTIONS:
+        for i in range(per_resolution):
+            if i % 2:
+                yield f"{w}x{h} noise", rng.integers(0, 256, (h, w, 3), dtype=np.uint8)
+            else:
+                yield f"{w}x{h} text", rendered_frame(rng, w, h)
+
+
+def check_choose_band(seed: int, per_resolution: int) -> List[str]:
+    """Frames where choose_band (on BGR or BGRA) and choose_band_reference pick different bands"""
+    bad = []
+    for label, frame in frames(seed, per_resolution):
+        ref = choose_band_reference(frame)
+        if choose_band(frame) != ref:
+            bad.append(label)
+        elif choose_band(cv2.cvtColor(frame, cv2.COLOR_BGR2BGRA)) != ref:
+            bad.append(f"{label} (BGRA)")
+    return bad
+
+
+def thumb_diff_reference(cur: np.ndarray, prev: np.ndarray) -> float:
+    """Original OCR-thread change metric on two binarized bands"""
+    small = cv2.resize(cur, (96, 20), interpolation=cv2.INTER_AREA)
+    last_small = cv2.resize(prev, (96, 20), interpolation=cv2.INTER_AREA)
+    return float(np.mean(np.abs(small.astype(np.int16) - last_small.astype(np.int16))) / 255.0)
+
+
+def check_preprocessor(seed: int, per_resolution: int) -> List[str]:
+    """Bands where BandPreprocessor output or thumb_diff differ from the originals"""
+    bad = []
+    for bgra in (False, True):
+        prep = BandPreprocessor()
+        prev = None
+        for label, frame in frames(seed, per_resolution):
+            x1, y1, x2, y2 = choose_band(frame)
+            band = frame[y1:y2, x1:x2]
+            ref = preprocess_band_for_ocr(band)
+            if bgra:
+                label += " (BGRA)"
+                band = cv2.cvtColor(band, cv2.COLOR_BGR2BGRA)
+            out = prep.process(band)
+            if out.shape != ref.shape or not np.array_equal(out, ref):
+                bad.append(f"{label} pixels")
+            d = prep.thumb_diff()
+            if prev is not None and prev.shape == ref.shape:
+                if d is None or abs(d - thumb_diff_reference(ref, prev)) > 1e-9:
+                    bad.append(f"{label} thumb_diff")
+            prev = ref
+            # Consumer round trip: what is released comes back instead of new allocations
+            prep.release(prep.detach())
+    return bad
+
+
+def check_recycling(rounds: int = 200) -> List[str]:
+    """A steady detach/release cycle must reuse a handful of buffers"""
+    prep = BandPreprocessor()
+    band = np.zeros((60, 400, 3), np.uint8)
+    seen = {}  # id -> buffer (kept alive so ids are never reused)
+    held = []
+    for _ in range(rounds):
+        prep.process(band)
+        held.append(prep.detach())
+        seen[id(held[-1])] = held[-1]
+        if len(held) > 2:
+            prep.release(held.pop(0))
+    return [] if len(seen) <= 4 else [f"{len(seen)} distinct buffers for {rounds} bands"]
+
+
+def per_call_ms(fn: Callable[[np.ndarray], object], frame: np.ndarray, repeat: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn(frame)
+    return (time.perf_counter() - t0) / repeat * 1000.0
+
+
+def run_check(seed: int, per_resolution: int) -> int:
+    """Equivalence check; returns the process exit code"""
+    n = len(RESOLUTIONS) * per_resolution
+    failed = 0
+    for name, count, mismatches in (("choose_band", n, check_choose_band(seed, per_resolution)),
+                                    ("preprocessor", 2 * n, check_preprocessor(seed, per_resolution)),
+                                    ("recycling", 200, check_recycling(200))):
+        failed += len(mismatches)
+        status = "ok" if not mismatches else f"{len(mismatches)} differ, e.g. {mismatches[0]}"
+        print(f"{name:<14} {count:>6} bands   {status}")
+    return 1 if failed else 0
+
+
+def main():
+    ap = argparse.ArgumentParser(description="choose_band microbenchmark")
+    ap.add_argument("--repeat", type=int, default=50)
+    ap.add_argument("--frames", type=int, default=50, help="Frames per resolution for --check")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--check", action="store_true", help="Equivalence check only")
+    opts = ap.parse_args()
+    if opts.check:
+        sys.exit(run_check(opts.seed, opts.frames))
+
+    rng = np.random.default_rng(opts.seed)
+    print(f"{'size':<10} {'ref ms':>8} {'new ms':>8} {'x':>6}")
+    for w, h in RESOLUTIONS:
+        frame = rendered_frame(rng, w, h)
+        ref = per_call_ms(choose_band_reference, frame, opts.repeat)
+        new = per_call_ms(choose_band, frame, opts.repeat)
+        print(f"{w}x{h:<5} {ref:>8.3f} {new:>8.3f} {ref / new:>5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
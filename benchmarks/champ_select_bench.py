@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Microbenchmark: incremental ChampSelectModel vs compute_locked on every session push
+
+Usage:
+    python -m benchmarks.champ_select_bench              # timing over random drafts
+    python -m benchmarks.champ_select_bench --check      # equivalence check only
+
+Random drafts (2 or 10 players, picks and bans in two rounds) are played as a
+sequence of session pushes: champion changes, pick intents, actions completing or
+reverting, and pushes with hidden teams. --check compares the model's locks after
+every push with compute_locked on the same session.
+"""
+
+import os
+import sys
+import copy
+import time
+import random
+import argparse
+from typing import Any, Dict, Iterator, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lcu.champ_select_model import ChampSelectModel  # noqa: E402
+from lcu.utils import compute_locked  # noqa: E402
+
+
+def drafts(seed: int, count: int, pushes: int) -> Iterator[List[Dict[str, Any]]]:
+    """count drafts, each a list of successive session payloads"""
+    rng = random.Random(seed)
+    for game in range(count):
+        n = rng.choice([2, 10])
+        players = [{"cellId": i, "championId": 0, "championPickIntent": 0, "isPickIntenting": False} for i in range(n)]
+        actions = [[{"id": r * 10 + i, "actorCellId": i, "type": rng.choice(["pick", "ban"]), "completed": False,
+                     "championId": 0} for i in range(n)] for r in range(2)]
+        sessions = []
+        for _ in range(pushes):
+            x = rng.random()
+            if x < 0.3:
+                rng.choice(players)["championId"] = rng.choice([0, 1, 2, 3])
+            elif x < 0.5:
+                p = rng.choice(players)
+                p["championPickIntent"] = rng.choice([0, 5])
+                p["isPickIntenting"] = rng.random() < 0.3
+            else:
+                a = rng.choice(rng.choice(actions))
+                a["completed"] = rng.random() < 0.7
+                a["championId"] = rng.choice([0, 4, 7])
+            hide = rng.random() < 0.1
+            sessions.append(copy.deepcopy({
+                "gameId": game, "localPlayerCellId": 0,
+                "myTeam": [] if hide else players[:n // 2], "theirTeam": [] if hide else players[n // 2:],
+                "actions": actions, "timer": {"phase": "BAN_PICK"},
+            }))
+        yield sessions
+
+
+def run_check(seed: int, count: int, pushes: int) -> int:
+    """Equivalence check; returns the process exit code"""
+    mismatches = 0
+    first = None
+    for sessions in drafts(seed, count, pushes):
+        model = ChampSelectModel()
+        for sess in sessions:
+            model.apply(sess)
+            expected = compute_locked(sess)
+            if model.locks != expected:
+                mismatches += 1
+                if first is None:
+                    first = (dict(model.locks), expected)
+    status = "ok" if not mismatches else f"{mismatches} differ, e.g. model={first[0]} compute_locked={first[1]}"
+    print(f"{'locks':<8} {count * pushes:>8} pushes  {status}")
+    return 1 if mismatches else 0
+
+
+def main():
+    ap = argparse.ArgumentParser(description="ChampSelectModel microbenchmark")
+    ap.add_argument("--drafts", type=int, default=300)
+    ap.add_argument("--pushes", type=int, default=40, help="Session pushes per draft")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--check", action="store_true", help="Equivalence check only")
+    opts = ap.parse_args()
+    if opts.check:
+        sys.exit(run_check(opts.seed, opts.drafts, opts.pushes))
+
+    games = list(drafts(opts.seed, opts.drafts, opts.pushes))
+    n = sum(len(g) for g in games)
+    t0 = time.perf_counter()
+    for sessions in games:
+        for sess in sessions:
+            compute_locked(sess)
+    ref = (time.perf_counter() - t0) / n * 1e6
+    t0 = time.perf_counter()
+    for sessions in games:
+        model = ChampSelectModel()
+        for sess in sessions:
+            model.apply(sess)
+    new = (time.perf_counter() - t0) / n * 1e6
+    print(f"compute_locked {ref:.2f} us/push, ChampSelectModel.apply {new:.2f} us/push (events included)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Microbenchmark: normalize_text vs the original implementation over DataDragon catalogs
+
+Usage:
+    python -m benchmarks.normalize_bench                 # all supported languages
+    python -m benchmarks.normalize_bench --langs ko_KR,el_GR --repeat 20
+    python -m benchmarks.normalize_bench --check         # offline equivalence check only
+
+Every champion and skin label of each language is checked for identical output first,
+then timed with the reference, the fast path without memo, and the memoized function.
+--check needs no DataDragon access: it compares both functions on every Unicode code
+point (alone and between letters, spaces and combining marks) and on a fixed sample of
+skin names covering the supported scripts.
+"""
+
+import os
+import sys
+import time
+import argparse
+from typing import Callable, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.name_db import NameDB  # noqa: E402
+from database.multilang_db import SUPPORTED_LANGUAGES  # noqa: E402
+from utils.normalization import normalize_text, normalize_text_reference  # noqa: E402
+
+
+# Skin names as DataDragon spells them, plus the OCR-side oddities normalize_text has to absorb
+SAMPLE_LABELS = [
+    "Goth Annie", "PROJECT: Ashe", "K/DA ALL OUT Ahri", "Dark Star Jhin", "Annie  au\tpays\ndes merveilles",
+    "Élise Victorieuse", "Señor Gangplank", "Ezreal Pulsefire (Édition prestige)", "Jinx Ćwiczebna",
+    "Karthus Träumer", "Ahri Ordem Lunar", "Ahri İnkaz", "Kayle ŞAHANE", "Вуконг из Нового года",
+    "Ахри из Звездных защитниц", "Αρχαγγελική Λεμπλάνκ", "ΆΝΝΑ ΤΗΣ ΑΓΡΙΑΣ ΔΎΣΗΣ", "구미호 아리", "별 수호자 징크스",
+    "ᄀ\u1161ᆨ 조합형", "秘術射手 艾希", "星之守护者 金克丝", "K／DA アーリ", "プロジェクト：アッシュ", "アーリ　ネオン",
+    "อาห์รี นักเวทย์", "Ahri Tiên Hồ Ly", "e\u0301lise", "\u00a0Annie\u00a0", "Annie\x00\x1f\x7f\x9fGoth",
+    "", " ", "\u2003\u3000",
+]
+
+
+def check_equivalence(labels: List[str]) -> List[str]:
+    """Inputs where normalize_text and normalize_text_reference disagree"""
+    fast = normalize_text.__wrapped__
+    return [s for s in labels if fast(s) != normalize_text_reference(s)]
+
+
+def code_point_labels() -> List[str]:
+    """Every code point (surrogates excluded) alone and in a few contexts"""
+    labels = []
+    for cp in range(0x110000):
+        if 0xD800 <= cp < 0xE000:
+            continue
+        c = chr(cp)
+        labels.extend((c, f"A{c}b", f"e{c}\u0301 x", f" {c}  {c}\u00c9"))
+    return labels
+
+
+def run_check() -> int:
+    """Offline equivalence check; returns the process exit code"""
+    failed = 0
+    for name, labels in (("sample", SAMPLE_LABELS), ("code points", code_point_labels())):
+        mismatches = check_equivalence(labels)
+        failed += len(mismatches)
+        status = "ok" if not mismatches else f"{len(mismatches)} differ, e.g. {mismatches[0]!r}"
+        print(f"{name:<12} {len(labels):>8} inputs  {status}")
+    return 1 if failed else 0
+
+
+def catalog_labels(lang: str) -> List[str]:
+    """Every champion name, skin name and 'champion skin' label of a language"""
+    db = NameDB(lang=lang)
+    db.global_index()
+    labels = []
+    for entries in db.entries_by_champ.values():
+        labels.extend(e.key for e in entries)
+    labels.extend(db.skin_name_by_id.values())
+    return labels
+
+
+def per_call_us(fn: Callable[[str], str], labels: List[str], repeat: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for s in labels:
+            fn(s)
+    return (time.perf_counter() - t0) / (repeat * len(labels)) * 1e6
+
+
+def main():
+    ap = argparse.ArgumentParser(description="normalize_text microbenchmark over DataDragon catalogs")
+    ap.add_argument("--langs", default="all", help="Comma-separated languages, or 'all'")
+    ap.add_argument("--repeat", type=int, default=10)
+    ap.add_argument("--check", action="store_true", help="Offline equivalence check only (no DataDragon access)")
+    opts = ap.parse_args()
+    if opts.check:
+        sys.exit(run_check())
+
+    langs = SUPPORTED_LANGUAGES if opts.langs == "all" else [x.strip() for x in opts.langs.split(",") if x.strip()]
+    fast = normalize_text.__wrapped__
+    print(f"{'lang':<7} {'labels':>7} {'ref us':>8} {'fast us':>8} {'memo us':>8} {'x fast':>7} {'x memo':>7}")
+    total_ref = total_fast = total_memo = 0.0
+    for lang in langs:
+        labels = catalog_labels(lang)
+        if not labels:
+            print(f"{lang:<7} (no data)")
+            continue
+        mismatches = check_equivalence(labels)
+        if mismatches:
+            print(f"{lang}: {len(mismatches)} outputs differ, e.g. {mismatches[0]!r}")
+            sys.exit(1)
+        ref = per_call_us(normalize_text_reference, labels, opts.repeat)
+        fst = per_call_us(fast, labels, opts.repeat)
+        normalize_text.cache_clear()
+        memo = per_call_us(normalize_text, labels, opts.repeat)
+        total_ref, total_fast, total_memo = total_ref + ref, total_fast + fst, total_memo + memo
+        print(f"{lang:<7} {len(labels):>7} {ref:>8.2f} {fst:>8.2f} {memo:>8.2f} {ref / fst:>6.1f}x {ref / memo:>6.1f}x")
+    if total_fast:
+        print(f"{'mean':<7} {'':>7} {'':>8} {'':>8} {'':>8} {total_ref / total_fast:>6.1f}x {total_ref / total_memo:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Offline OCR benchmark: replays recorded champ-select datasets through the real OCR thread
+
+Usage:
+    python -m benchmarks.replay_bench datasets/fr_FR_ahri datasets/ko_KR_lux --json out.json
+    python -m benchmarks.replay_bench datasets/* --baseline before.json
+
+Each dataset directory holds frames (or a video) and a ground_truth.json
+(see utils.replay_capture.load_ground_truth). No League client or display is needed.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+from collections import defaultdict
+from typing import Dict, List, Optional, Any
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import build_arg_parser, get_ocr_language  # noqa: E402
+from ocr.backend import OCR, OCRPool  # noqa: E402
+from database.name_db import NameDB  # noqa: E402
+from state.shared_state import SharedState  # noqa: E402
+from threads.ocr_thread import OCRSkinThread, OCRRead  # noqa: E402
+from utils.replay_capture import ReplayCapture, load_ground_truth  # noqa: E402
+from utils.logging import setup_logging  # noqa: E402
+
+# Metrics compared against --baseline (lower is better unless listed in HIGHER_IS_BETTER)
+COMPARED = ["latency_p50_ms", "latency_p90_ms", "latency_p99_ms", "ocr_p50_ms",
+            "ocr_calls_per_hover", "time_to_correct_ms", "accuracy", "hover_accuracy"]
+HIGHER_IS_BETTER = {"accuracy", "hover_accuracy"}
+
+
+def _segments(frames: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Consecutive ground-truth frames with the same hovered skin (None = nothing hovered)"""
+    segs: List[Dict[str, Any]] = []
+    for fr in frames:
+        sid = fr.get("skin_id")
+        t = float(fr["t"])
+        if segs and segs[-1]["skin_id"] == sid:
+            segs[-1]["end"] = t
+        else:
+            if segs:
+                segs[-1]["end"] = t
+            segs.append({"skin_id": sid, "start": t, "end": t})
+    return [s for s in segs if s["skin_id"] is not None]
+
+
+def _segment_at(segs: List[Dict[str, Any]], t: float) -> Optional[Dict[str, Any]]:
+    for s in segs:
+        if s["start"] <= t <= s["end"]:
+            return s
+    return None
+
+
+def _matched_id(read: OCRRead) -> Optional[int]:
+    """Skin id of a read (champion name = base skin id champ_id * 1000)"""
+    if read.match is None:
+        return None
+    e = read.match.entry
+    return e.skin_id if e.kind == "skin" else e.champ_id * 1000
+
+
+def _pct(values: List[float], q: float) -> float:
+    return round(float(np.percentile(values, q)) * 1000.0, 1) if values else 0.0
+
+
+def run_dataset(path: str, opts) -> Dict[str, Any]:
+    """Replay one dataset and return its metrics"""
+    gt = load_ground_truth(os.path.join(path, "ground_truth.json"))
+    lang = gt.get("lang", "en_US")
+    ocr_lang = gt.get("ocr_lang") or get_ocr_language(lang)
+
+    args = build_arg_parser().parse_args([])
+    args.capture = "screen"
+    args.ocr_workers = opts.ocr_workers
+    args.constrained_ocr = opts.constrained_ocr
+    if opts.ocr_cache_size is not None:
+        args.ocr_cache_size = opts.ocr_cache_size
+
+    db = NameDB(lang=lang)
+    if args.ocr_workers > 1:
+        ocr = OCRPool(workers=args.ocr_workers, lang=ocr_lang, psm=args.psm, tessdata_dir=opts.tessdata)
+    else:
+        ocr = OCR(lang=ocr_lang, psm=args.psm, tessdata_dir=opts.tessdata)
+    state = SharedState()
+    state.phase = "ChampSelect"
+    state.locked_champ_id = gt.get("champion_id")
+
+    capture = ReplayCapture(path, speed=opts.speed, gt=gt)
+    reads: List[OCRRead] = []
+    lock = threading.Lock()
+
+    def on_read(read: OCRRead):
+        with lock:
+            reads.append(read)
+
+    thread = OCRSkinThread(state, db, ocr, args, capture_factory=lambda: capture, on_read=on_read)
+    t0 = time.time()
+    thread.start()
+    while not capture.finished and thread.is_alive():
+        time.sleep(0.05)
+    time.sleep(opts.drain_s)
+    state.stop = True
+    thread.join(timeout=3.0)
+    wall_s = time.time() - t0
+    if isinstance(ocr, OCRPool):
+        ocr.close()
+
+    segs = _segments(gt.get("frames") or [])
+    calls = defaultdict(int)
+    first_correct: Dict[int, float] = {}
+    last_id: Dict[int, Optional[int]] = {}
+    judged = correct = 0
+    for r in reads:
+        seg = _segment_at(segs, capture.to_replay_time(r.t_capture))
+        if seg is None:
+            continue
+        key = id(seg)
+        if not r.cached:
+            calls[key] += 1
+        mid = _matched_id(r)
+        if mid is None:
+            continue
+        judged += 1
+        last_id[key] = mid
+        if mid == seg["skin_id"]:
+            correct += 1
+            if key not in first_correct:
+                first_correct[key] = capture.to_replay_time(r.t_done) - seg["start"]
+
+    lat = [r.t_done - r.t_capture for r in reads if not r.cached]
+    ocr_s = [r.ocr_s for r in reads if not r.cached]
+    ttc = list(first_correct.values())
+    return {
+        "dataset": os.path.basename(os.path.normpath(path)),
+        "lang": lang,
+        "ocr_lang": ocr_lang,
+        "frames": len(capture.times),
+        "wall_s": round(wall_s, 2),
+        "reads": len(reads),
+        "cached_reads": sum(1 for r in reads if r.cached),
+        "latency_p50_ms": _pct(lat, 50),
+        "latency_p90_ms": _pct(lat, 90),
+        "latency_p99_ms": _pct(lat, 99),
+        "ocr_p50_ms": _pct(ocr_s, 50),
+        "ocr_calls_per_hover": round(sum(calls.values()) / len(segs), 2) if segs else 0.0,
+        "time_to_correct_ms": _pct(ttc, 50),
+        "hovers": len(segs),
+        "hovers_detected": len(first_correct),
+        "accuracy": round(correct / judged, 4) if judged else 0.0,
+        "hover_accuracy": round(sum(1 for s in segs if last_id.get(id(s)) == s["skin_id"]) / len(segs), 4) if segs else 0.0,
+    }
+
+
+def summarize(results: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    """Per-language mean of the compared metrics"""
+    by_lang: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for r in results:
+        by_lang[r["lang"]].append(r)
+    return {
+        lang: {k: round(float(np.mean([r[k] for r in rs])), 4) for k in COMPARED}
+        for lang, rs in sorted(by_lang.items())
+    }
+
+
+def print_report(results: List[Dict[str, Any]], summary: Dict[str, Dict[str, float]],
+                 baseline: Optional[Dict[str, Dict[str, float]]] = None) -> None:
+    for r in results:
+        print(f"{r['dataset']} [{r['lang']}] frames={r['frames']} reads={r['reads']} (cached {r['cached_reads']}) "
+              f"lat p50/p90/p99={r['latency_p50_ms']}/{r['latency_p90_ms']}/{r['latency_p99_ms']}ms "
+              f"ocr/hover={r['ocr_calls_per_hover']} ttc={r['time_to_correct_ms']}ms "
+              f"acc={r['accuracy']:.1%} hover_acc={r['hover_accuracy']:.1%}")
+    print()
+    for lang, m in summary.items():
+        parts = []
+        for k in COMPARED:
+            s = f"{k}={m[k]}"
+            base = (baseline or {}).get(lang, {}).get(k)
+            if base is not None:
+                delta = m[k] - base
+                better = delta > 0 if k in HIGHER_IS_BETTER else delta < 0
+                s += f" ({delta:+.3g}{' ✓' if better else (' ✗' if delta else '')})"
+            parts.append(s)
+        print(f"{lang}: " + " ".join(parts))
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Replay recorded champ-select datasets through the OCR thread")
+    ap.add_argument("datasets", nargs="+", help="Dataset directories (frames/video + ground_truth.json)")
+    ap.add_argument("--speed", type=float, default=1.0, help="Playback speed (1.0 = real time)")
+    ap.add_argument("--json", dest="json_out", default=None, help="Write results to this JSON file")
+    ap.add_argument("--baseline", default=None, help="Previous --json output to compare against")
+    ap.add_argument("--ocr-workers", type=int, default=1)
+    ap.add_argument("--ocr-cache-size", type=int, default=None)
+    ap.add_argument("--constrained-ocr", action="store_true", default=True)
+    ap.add_argument("--no-constrained-ocr", action="store_false", dest="constrained_ocr")
+    ap.add_argument("--tessdata", default=None, help="Path to tessdata directory")
+    ap.add_argument("--drain-s", type=float, default=0.5, help="Time left for in-flight OCR after the last frame")
+    ap.add_argument("--verbose", action="store_true")
+    opts = ap.parse_args()
+
+    setup_logging(opts.verbose)
+
+    results = [run_dataset(p, opts) for p in opts.datasets]
+    summary = summarize(results)
+    baseline = None
+    if opts.baseline:
+        with open(opts.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f).get("summary")
+    print_report(results, summary, baseline)
+
+    if opts.json_out:
+        with open(opts.json_out, "w", encoding="utf-8") as f:
+            json.dump({"results": results, "summary": summary}, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
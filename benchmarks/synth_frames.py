@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Synthetic champ-select frame generator (labelled datasets for benchmarks.replay_bench)
+
+Usage:
+    python -m benchmarks.synth_frames --out datasets/synth --langs fr_FR,ko_KR --champions 1,103
+    python -m benchmarks.synth_frames --out datasets/synth --langs all --champions all --resolutions 1600x900
+
+Every skin name of the requested champions is rendered into the carousel band of a
+full-size frame (same place choose_band looks at), over background art, with text
+scale jitter, window scaling, blur and JPEG noise. One dataset directory is written
+per (language, champion, resolution), each with a ground_truth.json.
+"""
+
+import os
+import sys
+import glob
+import json
+import argparse
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import cv2
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import get_ocr_language  # noqa: E402
+from database.name_db import NameDB  # noqa: E402
+from database.multilang_db import SUPPORTED_LANGUAGES  # noqa: E402
+from utils.logging import get_logger, setup_logging  # noqa: E402
+
+log = get_logger()
+
+# Fonts tried per script when --font is not given (first existing file wins)
+FONT_CANDIDATES = {
+    "cjk_ko": ["C:/Windows/Fonts/malgun.ttf", "/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc",
+               "/usr/share/fonts/noto-cjk/NotoSansCJK-Regular.ttc"],
+    "cjk_ja": ["C:/Windows/Fonts/meiryo.ttc", "C:/Windows/Fonts/msgothic.ttc",
+               "/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc", "/usr/share/fonts/noto-cjk/NotoSansCJK-Regular.ttc"],
+    "cjk_zh": ["C:/Windows/Fonts/msyh.ttc", "C:/Windows/Fonts/simsun.ttc",
+               "/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc", "/usr/share/fonts/noto-cjk/NotoSansCJK-Regular.ttc"],
+    "latin": ["C:/Windows/Fonts/arialbd.ttf", "C:/Windows/Fonts/arial.ttf",
+              "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+              "/usr/share/fonts/TTF/DejaVuSans.ttf", "/Library/Fonts/Arial.ttf"],
+}
+
+
+@dataclass
+class SynthConfig:
+    """Rendering parameters (ranges are sampled uniformly per skin)"""
+    resolutions: List[Tuple[int, int]] = field(default_factory=lambda: [(1280, 720), (1600, 900), (1920, 1080)])
+    text_height_pct: float = 2.6          # glyph height relative to frame height
+    text_scale: Tuple[float, float] = (0.9, 1.15)
+    window_scale: Tuple[float, float] = (0.75, 1.0)   # render smaller then upscale (scaled client)
+    blur_sigma: Tuple[float, float] = (0.0, 1.2)
+    jpeg_quality: Tuple[int, int] = (55, 95)
+    band_centre_pct: float = 62.0        # vertical text position (see ocr.image_processing.choose_band)
+    hold_frames: int = 12                 # frames each skin stays hovered
+    gap_frames: int = 3                   # blank frames between skins (carousel scrolling)
+    fps: float = 30.0
+
+
+def _font_for(lang: str, font: Optional[str]) -> Optional[str]:
+    """TrueType font able to draw the language's script"""
+    if font:
+        return font
+    script = {"ko_KR": "cjk_ko", "ja_JP": "cjk_ja", "zh_CN": "cjk_zh", "zh_TW": "cjk_zh"}.get(lang, "latin")
+    for path in FONT_CANDIDATES[script]:
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+class Backgrounds:
+    """Background art: crops of user images, or procedural colour fields"""
+
+    def __init__(self, rng: np.random.Generator, directory: Optional[str] = None):
+        self.rng = rng
+        self.images: List[np.ndarray] = []
+        if directory:
+            for p in sorted(glob.glob(os.path.join(directory, "*"))):
+                img = cv2.imread(p, cv2.IMREAD_COLOR)
+                if img is not None:
+                    self.images.append(img)
+
+    def make(self, w: int, h: int) -> np.ndarray:
+        if self.images:
+            img = self.images[int(self.rng.integers(len(self.images)))]
+            ih, iw = img.shape[:2]
+            s = max(w / iw, h / ih) * float(self.rng.uniform(1.0, 1.4))
+            img = cv2.resize(img, (max(w, int(iw * s)), max(h, int(ih * s))), interpolation=cv2.INTER_LINEAR)
+            y = int(self.rng.integers(img.shape[0] - h + 1))
+            x = int(self.rng.integers(img.shape[1] - w + 1))
+            return np.ascontiguousarray(img[y:y + h, x:x + w])
+        # Smooth random colour field with some detail, mostly mid/dark like splash art
+        small = self.rng.integers(10, 150, size=(6, 10, 3), dtype=np.uint8)
+        bg = cv2.resize(small, (w, h), interpolation=cv2.INTER_CUBIC)
+        noise = self.rng.normal(0, 12, size=(h // 4, w // 4, 3)).astype(np.float32)
+        bg = bg.astype(np.float32) + cv2.resize(noise, (w, h), interpolation=cv2.INTER_LINEAR)
+        return np.clip(bg, 0, 255).astype(np.uint8)
+
+
+def _draw_text(img: np.ndarray, text: str, cx: int, cy: int, px: int, font_path: Optional[str]) -> bool:
+    """Draw near-white text centred at (cx, cy) with glyph height ~px; False if it cannot be drawn"""
+    if font_path:
+        from PIL import Image, ImageDraw, ImageFont
+        font = ImageFont.truetype(font_path, px)
+        pil = Image.fromarray(cv2.cvtColor(img, cv2.COLOR_BGR2RGB))
+        draw = ImageDraw.Draw(pil)
+        l, t, r, b = draw.textbbox((0, 0), text, font=font)
+        x, y = cx - (r - l) // 2 - l, cy - (b - t) // 2 - t
+        draw.text((x + 2, y + 2), text, font=font, fill=(10, 10, 10))
+        draw.text((x, y), text, font=font, fill=(240, 235, 225))
+        img[:] = cv2.cvtColor(np.asarray(pil), cv2.COLOR_RGB2BGR)
+        return True
+    # Hershey fonts only cover ASCII
+    if not text.isascii():
+        return False
+    scale = px / 22.0
+    thick = max(1, int(round(px / 12)))
+    (tw, th), _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_DUPLEX, scale, thick)
+    org = (cx - tw // 2, cy + th // 2)
+    cv2.putText(img, text, (org[0] + 2, org[1] + 2), cv2.FONT_HERSHEY_DUPLEX, scale, (10, 10, 10), thick, cv2.LINE_AA)
+    cv2.putText(img, text, org, cv2.FONT_HERSHEY_DUPLEX, scale, (225, 235, 240), thick, cv2.LINE_AA)
+    return True
+
+
+def render_frame(text: Optional[str], size: Tuple[int, int], cfg: SynthConfig, rng: np.random.Generator,
+                 bgs: Backgrounds, font_path: Optional[str]) -> Optional[np.ndarray]:
+    """One full frame with the skin name in the carousel band (text=None: no name shown)"""
+    w, h = size
+    ws = float(rng.uniform(*cfg.window_scale))
+    rw, rh = max(64, int(w * ws)), max(36, int(h * ws))
+    img = bgs.make(rw, rh)
+    # Darker strip behind the name, like the carousel's gradient
+    y0, y1 = int(rh * 0.55), int(rh * 0.69)
+    img[y0:y1] = (img[y0:y1].astype(np.float32) * 0.45).astype(np.uint8)
+    if text:
+        px = max(8, int(rh * cfg.text_height_pct / 100.0 * float(rng.uniform(*cfg.text_scale))))
+        cy = int(rh * cfg.band_centre_pct / 100.0 + rng.uniform(-0.004, 0.004) * rh)
+        if not _draw_text(img, text, rw // 2, cy, px, font_path):
+            return None
+    if (rw, rh) != (w, h):
+        img = cv2.resize(img, (w, h), interpolation=cv2.INTER_LINEAR)
+    sigma = float(rng.uniform(*cfg.blur_sigma))
+    if sigma > 0.05:
+        img = cv2.GaussianBlur(img, (0, 0), sigma)
+    return img
+
+
+def skins_for_champ(db: NameDB, champ_id: int) -> List[Tuple[int, str]]:
+    """(skin_id, carousel name) for a champion, base skin first (shown as the champion name)"""
+    out: List[Tuple[int, str]] = []
+    cname = db.champ_name_by_id.get(champ_id)
+    if cname:
+        out.append((champ_id * 1000, cname))
+    seen = set()
+    for e in db.candidates_for_champ(champ_id):
+        if e.kind == "skin" and e.skin_id and e.skin_id not in seen:
+            seen.add(e.skin_id)
+            name = db.skin_name_by_id.get(e.skin_id)
+            if name:
+                out.append((e.skin_id, name))
+    return out
+
+
+def generate_dataset(out_dir: str, lang: str, champ_id: int, skins: List[Tuple[int, str]], size: Tuple[int, int],
+                     cfg: SynthConfig, rng: np.random.Generator, bgs: Backgrounds, font_path: Optional[str]) -> int:
+    """Write one dataset directory; returns the number of skins rendered"""
+    os.makedirs(out_dir, exist_ok=True)
+    frames: List[Dict] = []
+    rendered = 0
+    n = 0
+
+    def emit(img: np.ndarray, skin_id: Optional[int], q: int):
+        nonlocal n
+        name = f"{n:06d}.jpg"
+        cv2.imwrite(os.path.join(out_dir, name), img, [cv2.IMWRITE_JPEG_QUALITY, q])
+        frames.append({"file": name, "t": round(n / cfg.fps, 4), "skin_id": skin_id})
+        n += 1
+
+    for sid, name in skins:
+        q = int(rng.integers(cfg.jpeg_quality[0], cfg.jpeg_quality[1] + 1))
+        img = render_frame(name, size, cfg, rng, bgs, font_path)
+        if img is None:
+            log.debug(f"[synth] cannot draw '{name}' without a font for {lang}")
+            continue
+        rendered += 1
+        # Hover: the same composition held for hold_frames (sensor noise per frame)
+        for _ in range(cfg.hold_frames):
+            noisy = np.clip(img.astype(np.int16) + rng.integers(-2, 3, size=img.shape, dtype=np.int16), 0, 255)
+            emit(noisy.astype(np.uint8), sid, q)
+        for _ in range(cfg.gap_frames):
+            emit(render_frame(None, size, cfg, rng, bgs, font_path), None, q)
+
+    gt = {
+        "lang": lang,
+        "ocr_lang": get_ocr_language(lang),
+        "champion_id": champ_id,
+        "fps": cfg.fps,
+        "synthetic": True,
+        "resolution": f"{size[0]}x{size[1]}",
+        "font": font_path,
+        "frames": frames,
+    }
+    with open(os.path.join(out_dir, "ground_truth.json"), "w", encoding="utf-8") as f:
+        json.dump(gt, f, ensure_ascii=False, indent=1)
+    return rendered
+
+
+def _parse_resolutions(spec: str) -> List[Tuple[int, int]]:
+    out = []
+    for part in spec.split(","):
+        w, h = part.lower().strip().split("x")
+        out.append((int(w), int(h)))
+    return out
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Render labelled synthetic champ-select datasets")
+    ap.add_argument("--out", required=True, help="Output directory (one sub-directory per dataset)")
+    ap.add_argument("--langs", default="en_US", help="Comma-separated DataDragon languages, or 'all'")
+    ap.add_argument("--champions", default="1", help="Comma-separated champion ids, or 'all'")
+    ap.add_argument("--resolutions", default="1280x720,1600x900,1920x1080")
+    ap.add_argument("--hold-frames", type=int, default=12)
+    ap.add_argument("--gap-frames", type=int, default=3)
+    ap.add_argument("--fps", type=float, default=30.0)
+    ap.add_argument("--font", default=None, help="TrueType font for every language (default: per-script system font)")
+    ap.add_argument("--backgrounds", default=None, help="Directory of background images (default: procedural)")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--verbose", action="store_true")
+    opts = ap.parse_args()
+
+    setup_logging(opts.verbose)
+    rng = np.random.default_rng(opts.seed)
+    cfg = SynthConfig(resolutions=_parse_resolutions(opts.resolutions), hold_frames=max(1, opts.hold_frames),
+                      gap_frames=max(0, opts.gap_frames), fps=opts.fps)
+    bgs = Backgrounds(rng, opts.backgrounds)
+    langs = SUPPORTED_LANGUAGES if opts.langs == "all" else [x.strip() for x in opts.langs.split(",") if x.strip()]
+
+    total = 0
+    for lang in langs:
+        db = NameDB(lang=lang)
+        font_path = _font_for(lang, opts.font)
+        if font_path is None:
+            log.info(f"[synth] no font found for {lang}; only ASCII names will be drawn (use --font)")
+        champ_ids = sorted(db.slug_by_id) if opts.champions == "all" else [int(x) for x in opts.champions.split(",") if x.strip()]
+        for cid in champ_ids:
+            skins = skins_for_champ(db, cid)
+            if not skins:
+                continue
+            for size in cfg.resolutions:
+                name = f"{lang}_{db.slug_by_id.get(cid, cid)}_{size[0]}x{size[1]}"
+                n = generate_dataset(os.path.join(opts.out, name), lang, cid, skins, size, cfg, rng, bgs, font_path)
+                total += n
+                log.info(f"[synth] {name}: {n}/{len(skins)} skins")
+    log.info(f"[synth] {total} skin renders written to {opts.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Versioned on-disk skin catalog (SQLite), shared by every NameDB instance
+"""
+
+import os
+import sqlite3
+import threading
+from typing import Dict, List, Tuple
+from utils.normalization import normalize_text
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS langs (
+    lang TEXT PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS champions (
+    lang TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    slug TEXT NOT NULL,
+    name TEXT NOT NULL,
+    norm TEXT NOT NULL,
+    PRIMARY KEY (lang, id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS skins (
+    lang TEXT NOT NULL,
+    champ_id INTEGER NOT NULL,
+    id INTEGER NOT NULL,
+    num INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    norm TEXT NOT NULL,
+    full_name TEXT NOT NULL,
+    full_norm TEXT NOT NULL,
+    PRIMARY KEY (lang, champ_id, id)
+) WITHOUT ROWID;
+"""
+
+# Read through the OS page cache instead of copying pages into SQLite's own cache
+MMAP_SIZE = 256 * 1024 * 1024
+
+
+class SkinCatalog:
+    """All champions and skins of one DataDragon version, per language, with normalized keys
+
+    One file per version (catalog_<ver>.sqlite); a language is filled once from
+    championFull.json and then served by indexed queries, so NameDB no longer
+    fetches or parses per-champion JSON.
+    """
+
+    _open: Dict[str, "SkinCatalog"] = {}
+    _open_lock = threading.Lock()
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._langs = {row[0] for row in self._conn.execute("SELECT lang FROM langs")}
+
+    @classmethod
+    def for_version(cls, ver: str, directory: str) -> "SkinCatalog":
+        """Process-wide catalog for a DataDragon version"""
+        path = os.path.join(directory, f"catalog_{ver}.sqlite")
+        with cls._open_lock:
+            cat = cls._open.get(path)
+            if cat is None:
+                cat = cls(path)
+                cls._open[path] = cat
+            return cat
+
+    def has_lang(self, lang: str) -> bool:
+        return lang in self._langs
+
+    def add_lang(self, lang: str, champion_full: dict) -> None:
+        """Store one language from DataDragon championFull.json (single transaction)"""
+        champs: List[Tuple] = []
+        skins: List[Tuple] = []
+        for slug, obj in (champion_full.get("data") or {}).items():
+            try:
+                cid = int(obj.get("key"))
+            except Exception:
+                continue
+            cname = obj.get("name") or slug
+            champs.append((lang, cid, slug, cname, normalize_text(cname)))
+            for s in obj.get("skins") or []:
+                try:
+                    sid = int(s.get("id"))
+                    num = int(s.get("num") or 0)
+                except Exception:
+                    continue
+                sname = (s.get("name") or "").strip()
+                full = f"{cname} {sname}"
+                skins.append((lang, cid, sid, num, sname, normalize_text(sname), full, normalize_text(full)))
+
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM champions WHERE lang = ?", (lang,))
+            self._conn.execute("DELETE FROM skins WHERE lang = ?", (lang,))
+            self._conn.executemany("INSERT INTO champions VALUES (?, ?, ?, ?, ?)", champs)
+            self._conn.executemany("INSERT INTO skins VALUES (?, ?, ?, ?, ?, ?, ?, ?)", skins)
+            self._conn.execute("INSERT OR REPLACE INTO langs VALUES (?)", (lang,))
+        self._langs.add(lang)
+
+    def champions(self, lang: str) -> List[Tuple[int, str, str, str]]:
+        """(id, slug, name, norm) of every champion"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT id, slug, name, norm FROM champions WHERE lang = ? ORDER BY slug", (lang,)
+            ).fetchall()
+
+    def skins(self, lang: str, champ_id: int) -> List[Tuple[int, int, str, str, str, str]]:
+        """(id, num, name, norm, full_name, full_norm) of a champion's skins, in DataDragon order"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT id, num, name, norm, full_name, full_norm FROM skins WHERE lang = ? AND champ_id = ? ORDER BY num",
+                (lang, champ_id),
+            ).fetchall()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Versioned DataDragon disk cache (atomic writes, per-version manifests, pruning)
+"""
+
+import os
+import re
+import json
+import time
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+CACHE = os.path.join(os.path.expanduser("~"), ".cache", "lcu-all-in-one")
+
+# Unversioned index files (versions.json, languages.json) are re-fetched after this long
+INDEX_TTL_S = 6 * 3600
+
+# DataDragon version embedded in cache file names: champ_Ahri_14.1.1_en_US.json, catalog_14.1.1.sqlite...
+_VERSION_RE = re.compile(r"_(\d+\.\d+\.\d+)(?=[_.])")
+
+
+def _version_key(ver: str) -> tuple:
+    try:
+        return tuple(int(x) for x in ver.split("."))
+    except ValueError:
+        return (0,)
+
+
+class DDCache:
+    """Cache directory where every file belongs to a DataDragon version (or is an index file)
+
+    Files are written to a temp file and renamed into place, so a crash never leaves a
+    half-written JSON behind; unreadable files are treated as missing. Each version has a
+    manifest_<ver>.json listing its files, and versions older than the newest keep_versions
+    are deleted. Manifest updates are written at once, or once at the end of a batch().
+    """
+
+    def __init__(self, root: str = CACHE, keep_versions: int = 2):
+        self.root = root
+        self.keep_versions = max(1, int(keep_versions))
+        self._lock = threading.Lock()
+        self._manifests: Dict[str, Dict[str, Any]] = {}
+        self._pruned_for: Optional[str] = None
+        self._dirty: set = set()
+        self._batch_depth = 0
+        os.makedirs(root, exist_ok=True)
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.root, name)
+
+    def age(self, name: str) -> Optional[float]:
+        """Seconds since the file was written, or None if missing"""
+        try:
+            return time.time() - os.path.getmtime(self.path(name))
+        except OSError:
+            return None
+
+    def read_json(self, name: str, ttl_s: Optional[float] = None) -> Optional[Any]:
+        """Cached JSON, or None if missing, older than ttl_s or unreadable (then removed)"""
+        age = self.age(name)
+        if age is None or (ttl_s is not None and age > ttl_s):
+            return None
+        try:
+            with open(self.path(name), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception:
+            self.discard(name)
+            return None
+
+    def read_stale(self, name: str) -> Optional[Any]:
+        """Cached JSON regardless of age (offline fallback)"""
+        return self.read_json(name, None)
+
+    def write_json(self, name: str, data: Any, ver: Optional[str] = None) -> None:
+        """Write atomically (temp file + rename) and record the file in the version manifest"""
+        fd, tmp = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=self.root)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, self.path(name))
+        except Exception:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+        if ver:
+            self.record(ver, name)
+
+    def discard(self, name: str) -> None:
+        try:
+            os.remove(self.path(name))
+        except OSError:
+            pass
+
+    def _manifest(self, ver: str) -> Dict[str, Any]:
+        m = self._manifests.get(ver)
+        if m is None:
+            m = self.read_stale(f"manifest_{ver}.json") or {}
+            m.setdefault("version", ver)
+            m.setdefault("created", time.time())
+            m.setdefault("files", [])
+            self._manifests[ver] = m
+        return m
+
+    def record(self, ver: str, name: str) -> None:
+        """Add a file to a version's manifest (written now, or when the current batch ends)"""
+        with self._lock:
+            m = self._manifest(ver)
+            if name in m["files"]:
+                return
+            m["files"].append(name)
+            self._dirty.add(ver)
+            if self._batch_depth:
+                return
+        self.flush()
+
+    def flush(self) -> None:
+        """Write every manifest changed since the last flush"""
+        with self._lock:
+            for ver in sorted(self._dirty):
+                m = self._manifests.get(ver)
+                if m is not None:
+                    self.write_json(f"manifest_{ver}.json", dict(m, files=list(m["files"])))
+            self._dirty.clear()
+
+    @contextmanager
+    def batch(self):
+        """Defer manifest writes until the outermost batch exits (bulk downloads)"""
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                done = self._batch_depth == 0
+            if done:
+                self.flush()
+
+    def versions(self) -> List[str]:
+        """Versions with files on disk, oldest first"""
+        found = set()
+        for name in os.listdir(self.root):
+            mt = _VERSION_RE.search(name)
+            if mt:
+                found.add(mt.group(1))
+        return sorted(found, key=_version_key)
+
+    def prune(self, current: str) -> List[str]:
+        """Delete every version except current and the newest others up to keep_versions; returns removed versions"""
+        with self._lock:
+            if self._pruned_for == current:
+                return []
+            self._pruned_for = current
+        keep = {current}
+        for ver in reversed(self.versions()):
+            if len(keep) >= self.keep_versions:
+                break
+            if _version_key(ver) < _version_key(current):
+                keep.add(ver)
+
+        removed = []
+        for name in os.listdir(self.root):
+            mt = _VERSION_RE.search(name)
+            if mt and mt.group(1) not in keep:
+                self.discard(name)
+                removed.append(mt.group(1))
+        # Leftovers of interrupted writes
+        for name in os.listdir(self.root):
+            if name.startswith(".") and name.endswith(".tmp") and (self.age(name) or 0) > 3600:
+                self.discard(name)
+        with self._lock:
+            for ver in removed:
+                self._manifests.pop(ver, None)
+        return sorted(set(removed), key=_version_key)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Precompiled skin match index (one per champion)
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, List, Tuple, Dict
+import numpy as np
+from rapidfuzz import process
+from rapidfuzz.distance import Levenshtein
+from utils.normalization import normalize_text
+
+if TYPE_CHECKING:
+    from .name_db import Entry
+
+
+def exact_map(names) -> Dict[str, int]:
+    """normalize_text(name) -> index of its first occurrence
+
+    A read whose normalized text equals a name's is taken as that name, ahead of the
+    Levenshtein pass (which would rank raw strings and could prefer a case/spacing variant).
+    """
+    out: Dict[str, int] = {}
+    for i, name in enumerate(names):
+        out.setdefault(normalize_text(name), i)
+    return out
+
+
+@dataclass(frozen=True)
+class MatchResult:
+    """Best candidate for an OCR string"""
+    entry: "Entry"
+    name: str
+    distance: int
+    score: float
+
+
+@dataclass(frozen=True)
+class SkinMatchIndex:
+    """Immutable candidate arrays for a single champion (or the global champion list)"""
+    entries: Tuple["Entry", ...]
+    names: Tuple[str, ...]
+    lengths: np.ndarray  # int32, len(name) per candidate
+    skin_ids: np.ndarray  # int64, 0 = base skin (champion entry)
+    exact: Dict[str, int]  # normalized name -> first candidate with that name
+
+    @classmethod
+    def build(cls, entries: List["Entry"], skin_name_by_id: dict, champ_name_by_id: dict) -> "SkinMatchIndex":
+        """Build index from entries, resolving the display name used for matching"""
+        kept: List["Entry"] = []
+        names: List[str] = []
+        seen: set = set()
+        for e in entries:
+            if e.kind == "skin":
+                name = skin_name_by_id.get(e.skin_id) or e.key
+            elif e.kind == "champion":
+                name = champ_name_by_id.get(e.champ_id) or e.key
+            else:
+                continue
+            # Same display name twice can never win over its first occurrence
+            if name in seen:
+                continue
+            seen.add(name)
+            kept.append(e)
+            names.append(name)
+        return cls(
+            entries=tuple(kept),
+            names=tuple(names),
+            lengths=np.fromiter((len(n) for n in names), dtype=np.int32, count=len(names)),
+            skin_ids=np.fromiter((e.skin_id or 0 for e in kept), dtype=np.int64, count=len(kept)),
+            exact=exact_map(names),
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def best(self, txt: str) -> Optional[MatchResult]:
+        """Exact normalized name if any, else lowest raw Levenshtein distance (first wins on ties); score = 1 - d / max_len"""
+        if not txt or not self.names:
+            return None
+        # Clean read (up to case, spacing and marks): O(1) hit at distance 0 on the normalized text
+        i = self.exact.get(normalize_text(txt))
+        if i is not None:
+            return self._result(txt, i, 0)
+        dists = process.cdist([txt], self.names, scorer=Levenshtein.distance, dtype=np.int32, workers=1)[0]
+        i = int(np.argmin(dists))
+        return self._result(txt, i, int(dists[i]))
+
+    def _result(self, txt: str, i: int, d: int) -> MatchResult:
+        max_len = max(len(txt), int(self.lengths[i]))
+        score = 1.0 - (d / max_len) if max_len > 0 else 0.0
+        return MatchResult(entry=self.entries[i], name=self.names[i], distance=d, score=score)
@@ -7,12 +7,36 @@ Handles language detection and mapping to English names
 
 import os
 import json
+import time
+import threading
 import requests
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, Union
+from rapidfuzz import fuzz, process
+from rapidfuzz.distance import Levenshtein
 from utils.normalization import normalize_text
 from .name_db import NameDB, Entry
 
+# Similarity scorers for the multilang matcher: name -> (scorer, value of a perfect match)
+SCORERS = {
+    "levenshtein": (Levenshtein.normalized_similarity, 1.0),  # 1 - d / max_len, same as the per-champion index
+    "ratio": (fuzz.ratio, 100.0),
+    "token_sort": (fuzz.token_sort_ratio, 100.0),
+    "partial": (fuzz.partial_ratio, 100.0),
+}
+
+class _Loading:
+    """Returned instead of a NameDB while that language is still loading in the background"""
+    def __repr__(self) -> str:
+        return "LOADING"
+
+
+LOADING = _Loading()
+
+# A language whose load failed is not retried before this many seconds
+RETRY_COOLDOWN_S = 45.0
+
 # League of Legends supported languages
 SUPPORTED_LANGUAGES = [
     "en_US",  # English (United States)
@@ -65,15 +89,22 @@ class LanguageMatch:
 class MultiLanguageDB:
     """Multi-language database with automatic language detection"""
     
-    def __init__(self, auto_detect: bool = True, fallback_lang: str = "en_US", lcu_client=None):
+    def __init__(self, auto_detect: bool = True, fallback_lang: str = "en_US", lcu_client=None,
+                 scorer: str = "levenshtein", min_similarity: float = 0.7):
         self.auto_detect = auto_detect
         self.fallback_lang = fallback_lang
         self.current_language = fallback_lang
         self.manual_language = None if auto_detect else fallback_lang
         self.lcu_client = lcu_client
+        self.scorer, self._score_max = SCORERS.get(scorer, SCORERS["levenshtein"])
+        self.min_similarity = float(min_similarity)
         
-        # Initialize only necessary databases
+        # Initialize only necessary databases (other languages load in the background)
         self.databases: Dict[str, NameDB] = {}
+        self._loading: Dict[str, Future] = {}
+        self._failed_at: Dict[str, float] = {}
+        self._load_lock = threading.Lock()
+        self._loader = ThreadPoolExecutor(max_workers=2, thread_name_prefix="lang-load")
         self._initialize_necessary_databases()
         
         # English database for final mapping
@@ -97,25 +128,69 @@ class MultiLanguageDB:
             # The LCU connection should be established by the time this is called
             lcu_lang = self._get_lcu_language()
             if lcu_lang and lcu_lang != "en_US":
-                try:
-                    self.databases[lcu_lang] = NameDB(lang=lcu_lang)
-                    self.current_language = lcu_lang
-                    print(f"[MULTILANG] Auto-detect mode: loaded LCU language '{lcu_lang}'")
-                except Exception as e:
-                    print(f"[MULTILANG] Failed to load LCU language '{lcu_lang}': {e}")
-                    print(f"[MULTILANG] Auto-detect mode: languages will be loaded on-demand")
+                self.current_language = lcu_lang
+                self.preload(lcu_lang)
+                print(f"[MULTILANG] Auto-detect mode: loading LCU language '{lcu_lang}' in background")
             else:
                 print(f"[MULTILANG] Auto-detect mode: LCU language not available, will load on-demand")
         else:
             # In manual mode, load the specified language
             if self.manual_language and self.manual_language != "en_US":
-                try:
-                    self.databases[self.manual_language] = NameDB(lang=self.manual_language)
-                    print(f"[MULTILANG] Initialized database for {self.manual_language}")
-                except Exception as e:
-                    print(f"[MULTILANG] Failed to initialize {self.manual_language}: {e}")
-                    # Fallback to English only
-                    self.manual_language = "en_US"
+                lang = self.manual_language
+                
+                def on_loaded(fut: Future):
+                    if fut.exception() is not None:
+                        print(f"[MULTILANG] Failed to initialize {lang}: {fut.exception()}")
+                        # Fallback to English only
+                        self.manual_language = "en_US"
+                    else:
+                        print(f"[MULTILANG] Initialized database for {lang}")
+                
+                self.preload(lang).add_done_callback(on_loaded)
+    
+    def _load(self, lang: str) -> NameDB:
+        """Loader task: build the database (champion list only) and publish it
+
+        Champion skin files load on demand, one per champion, when OCR first matches against it.
+        """
+        try:
+            db = NameDB(lang=lang)
+        except Exception:
+            with self._load_lock:
+                self._failed_at[lang] = time.monotonic()
+            raise
+        self.databases[lang] = db
+        return db
+    
+    def preload(self, lang: str) -> Future:
+        """Start loading a language in the background (no-op if loaded or already loading)
+
+        A failed load is returned as is until RETRY_COOLDOWN_S has passed since the failure.
+        """
+        with self._load_lock:
+            db = self.databases.get(lang)
+            if db is not None:
+                fut: Future = Future()
+                fut.set_result(db)
+                return fut
+            fut = self._loading.get(lang)
+            if fut is None or (fut.done() and fut.exception() is not None
+                               and time.monotonic() - self._failed_at.get(lang, 0.0) >= RETRY_COOLDOWN_S):
+                fut = self._loader.submit(self._load, lang)
+                self._loading[lang] = fut
+            return fut
+    
+    def get_database(self, lang: str) -> Union[NameDB, _Loading, None]:
+        """Loaded database, LOADING while it loads in the background, None if unsupported or failed"""
+        db = self.databases.get(lang)
+        if db is not None:
+            return db
+        if lang not in SUPPORTED_LANGUAGES:
+            return None
+        fut = self.preload(lang)
+        if fut.done():
+            return None if fut.exception() is not None else fut.result()
+        return LOADING
     
     def _get_lcu_language(self) -> Optional[str]:
         """Get client language from LCU API"""
@@ -196,20 +271,11 @@ class MultiLanguageDB:
             lang_match = self.detect_language(text)
             detected_lang = lang_match.language
         
-        # Get database for detected language
-        db = self.databases.get(detected_lang)
-        if not db:
-            # Try to load the detected language on-demand
-            if detected_lang in SUPPORTED_LANGUAGES:
-                try:
-                    self.databases[detected_lang] = NameDB(lang=detected_lang)
-                    db = self.databases[detected_lang]
-                    # print(f"[MULTILANG] Loaded database for {detected_lang} on-demand")  # Disabled for cleaner logs
-                except Exception as e:
-                    print(f"[MULTILANG] Failed to load {detected_lang}: {e}")
-                    db = self.databases.get(self.fallback_lang)
-            else:
-                db = self.databases.get(self.fallback_lang)
+        # Get database for detected language (never blocks: a missing language loads in the background
+        # and the fallback database answers meanwhile)
+        db = self.get_database(detected_lang)
+        if db is None or db is LOADING:
+            db = self.databases.get(self.fallback_lang) or self.databases.get("en_US")
         
         if not db:
             print(f"[MULTILANG] No fallback database available")
@@ -225,43 +291,35 @@ class MultiLanguageDB:
         return entry
     
     def _find_entry_in_db(self, db: NameDB, text: str, champ_id: Optional[int] = None) -> Optional[Entry]:
-        """Find entry in specific database"""
+        """Find entry in specific database (best score over the normalized keys, in one rapidfuzz call)"""
         norm_txt = normalize_text(text)
-        pairs = db.normalized_entries(champ_id) or []
-        
-        if not pairs:
+        if not norm_txt:
             return None
+        # Identical normalized key: taken as is, ahead of the scorer (with the ratio and
+        # levenshtein scorers it is also the scorer's pick; partial/token_sort can tie other keys)
+        entry = db.exact_entries(champ_id if champ_id in db.slug_by_id else None).get(norm_txt)
+        if entry is not None:
+            return entry
+        if champ_id and champ_id in db.slug_by_id:
+            entries, keys = db.normalized_keys(champ_id)
+        elif shortlist := db.search(text, k=16):
+            # Unknown champion: n-gram shortlist over every skin
+            entries = [r.entry for r in shortlist]
+            keys = [normalize_text(e.key) for e in entries]
+        else:
+            # ... champion names only while the index builds in the background
+            entries, keys = db.normalized_keys(None)
         
-        # Find best match
-        best_entry = None
-        best_score = 0.0
-        
-        for entry, norm_key in pairs:
-            # Calculate similarity score
-            if norm_txt == norm_key:
-                return entry  # Exact match
-            
-            # Fuzzy matching
-            similarity = self._calculate_similarity(norm_txt, norm_key)
-            if similarity > best_score and similarity > 0.7:  # Threshold
-                best_score = similarity
-                best_entry = entry
-        
-        return best_entry
-    
-    def _calculate_similarity(self, text1: str, text2: str) -> float:
-        """Calculate similarity between two texts"""
-        if not text1 or not text2:
-            return 0.0
-        
-        # Simple similarity based on common substrings
-        common_chars = sum(1 for c in text1 if c in text2)
-        max_len = max(len(text1), len(text2))
-        
-        if max_len == 0:
-            return 0.0
+        if not keys:
+            return None
         
-        return common_chars / max_len
+        # Highest score wins, first candidate on ties; keys are already normalized, so no
+        # processor (rapidfuzz 2.x would otherwise apply default_process)
+        best = process.extractOne(norm_txt, keys, scorer=self.scorer, processor=None,
+                                  score_cutoff=self.min_similarity * self._score_max)
+        if best is None:
+            return None
+        return entries[best[2]]
     
     def get_english_name(self, entry: Entry) -> Tuple[str, str]:
         """Get English names for champion and skin"""
@@ -302,22 +360,29 @@ class MultiLanguageDB:
         """Get list of currently loaded languages"""
         return list(self.databases.keys())
     
-    def set_language(self, language: str):
-        """Manually set language (disables auto-detection)"""
+    def set_language(self, language: str, wait: bool = False):
+        """Manually set language (disables auto-detection)
+
+        The switch happens once the language is loaded: immediately if it already is,
+        otherwise in the background unless wait is True, which blocks until it is loaded.
+        """
         if language in SUPPORTED_LANGUAGES:
-            # Load the language if not already loaded
-            if language not in self.databases:
-                try:
-                    self.databases[language] = NameDB(lang=language)
-                    print(f"[MULTILANG] Loaded database for {language}")
-                except Exception as e:
-                    print(f"[MULTILANG] Failed to load {language}: {e}")
+            def apply(fut: Future):
+                if fut.exception() is not None:
+                    print(f"[MULTILANG] Failed to load {language}: {fut.exception()}")
                     return
+                self.current_language = language
+                self.manual_language = language
+                self.auto_detect = False
+                # print(f"[MULTILANG] Language set to {language}")  # Disabled for cleaner logs
             
-            self.current_language = language
-            self.manual_language = language
-            self.auto_detect = False
-            # print(f"[MULTILANG] Language set to {language}")  # Disabled for cleaner logs
+            fut = self.preload(language)
+            if wait:
+                try:
+                    fut.result()
+                except Exception:
+                    pass
+            fut.add_done_callback(apply)
         else:
             print(f"[MULTILANG] Language {language} not supported")
     
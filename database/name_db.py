@@ -4,19 +4,43 @@
 Data Dragon name database
 """
 
-import os
-import json
+import time
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import Optional, List, Dict
+from typing import Callable, Optional, List, Dict, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from utils.normalization import normalize_text
+from .match_index import MatchResult, SkinMatchIndex
+from .ngram_index import NGramIndex
+from .catalog import SkinCatalog
+from .shared_tables import SharedTables, intern
+from .dd_cache import CACHE, INDEX_TTL_S, DDCache
 
+dd_cache = DDCache(CACHE)
 
-CACHE = os.path.join(os.path.expanduser("~"), ".cache", "lcu-all-in-one")
-os.makedirs(CACHE, exist_ok=True)
+# A language whose championFull.json download failed is not retried before this many seconds
+CATALOG_RETRY_COOLDOWN_S = 45.0
 
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
 
-@dataclass
+
+def dd_session(pool_size: int = 16) -> requests.Session:
+    """Shared DataDragon session (keep-alive connection pool, retries with backoff)"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            s = requests.Session()
+            retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+            s.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=retry))
+            _session = s
+        return _session
+
+
+@dataclass(slots=True)
 class Entry:
     key: str
     kind: str  # "skin" | "champion"
@@ -32,40 +56,56 @@ class NameDB:
         self.ver: Optional[str] = None
         self.langs: List[str] = self._resolve_langs_spec(lang)
         self.canonical_lang: Optional[str] = "en_US" if "en_US" in self.langs else (self.langs[0] if self.langs else "en_US")
-        self.slug_by_id: Dict[int, str] = {}
         self.champ_name_by_id_by_lang: Dict[str, Dict[int, str]] = {}
         self.champ_name_by_id: Dict[int, str] = {}
         self.entries_by_champ: Dict[str, List[Entry]] = {}
-        self.skin_name_by_id: Dict[int, str] = {}
         self._skins_loaded: set = set()
-        self._norm_cache: Dict[str, str] = {}
+        self.catalog: Optional[SkinCatalog] = None
         self._load_versions()
+        # Ids, names, entries and normalized keys live in per-version tables shared by all instances;
+        # a single-language instance's dicts are those tables themselves
+        self.shared = SharedTables.for_version(self.ver)
+        self.slug_by_id: Dict[int, str] = self.shared.slug_by_id
+        self._norm_cache: Dict[str, str] = self.shared.norm
+        if len(self.langs) == 1:
+            self.skin_name_by_id: Dict[int, str] = self.shared.lang(self.langs[0]).skin_name_by_id
+        else:
+            self.skin_name_by_id = {}
+        self._open_catalog()
         self._load_index()
         self.champ_name_by_id = self.champ_name_by_id_by_lang.get(self.canonical_lang, {})
 
-    def _cache_json(self, name: str, url: str):
-        """Cache JSON data locally"""
-        p = os.path.join(CACHE, name)
-        if os.path.isfile(p):
-            try: 
-                return json.load(open(p, "r", encoding="utf-8"))
-            except Exception: 
-                pass
+    def _cache_json(self, name: str, url: str, ttl_s: Optional[float] = None):
+        """Cache JSON data locally (versioned files never expire; index files after ttl_s)"""
+        data = dd_cache.read_json(name, ttl_s)
+        if data is not None:
+            return data
         
-        r = requests.get(url, timeout=8)
-        r.raise_for_status()
-        data = r.json()
-        json.dump(data, open(p, "w", encoding="utf-8"))
+        try:
+            r = dd_session().get(url, timeout=8)
+            r.raise_for_status()
+            data = r.json()
+        except Exception:
+            # Offline: an expired copy is better than nothing
+            data = dd_cache.read_stale(name)
+            if data is None:
+                raise
+            return data
+        dd_cache.write_json(name, data, ver=self.ver if ttl_s is None else None)
         return data
 
     def _load_versions(self):
-        """Load Data Dragon versions"""
-        versions = self._cache_json("versions.json", "https://ddragon.leagueoflegends.com/api/versions.json")
+        """Load Data Dragon versions, then drop cached data of old versions"""
+        versions = self._cache_json("versions.json", "https://ddragon.leagueoflegends.com/api/versions.json", INDEX_TTL_S)
         self.ver = versions[0]
+        try:
+            dd_cache.prune(self.ver)
+        except Exception:
+            pass
 
     def _fetch_languages(self) -> List[str]:
         """Fetch available languages"""
-        data = self._cache_json("languages.json", "https://ddragon.leagueoflegends.com/cdn/languages.json")
+        data = self._cache_json("languages.json", "https://ddragon.leagueoflegends.com/cdn/languages.json", INDEX_TTL_S)
         return [str(x) for x in data if isinstance(x, str)]
 
     def _resolve_langs_spec(self, spec: str) -> List[str]:
@@ -79,72 +119,195 @@ class NameDB:
             except Exception: 
                 return ["en_US", "fr_FR"]
         if "," in s:
-            return [x.strip() for x in s.split(",") if x.strip()]
+            return [x.strip() for x in s.split(",") if x.strip()] or ["fr_FR"]
         return [s]
 
+    def _open_catalog(self):
+        """Open the shared catalog for this DataDragon version (None: per-champion JSON fallback)"""
+        try:
+            self.catalog = SkinCatalog.for_version(self.ver, CACHE)
+        except Exception:
+            # Corrupt file (e.g. interrupted first build): rebuild once, without its WAL/shared-memory files
+            for sfx in ("", "-wal", "-shm"):
+                dd_cache.discard(f"catalog_{self.ver}.sqlite{sfx}")
+            try:
+                self.catalog = SkinCatalog.for_version(self.ver, CACHE)
+            except Exception:
+                self.catalog = None
+        if self.catalog is not None:
+            dd_cache.record(self.ver, f"catalog_{self.ver}.sqlite")
+
+    def _catalog_has(self, lang: str) -> bool:
+        """Make sure the catalog holds a language (one championFull.json download per version)"""
+        if self.catalog is None:
+            return False
+        if self.catalog.has_lang(lang):
+            return True
+        with self.shared.key_lock(("catalog", lang)):
+            if self.catalog.has_lang(lang):
+                return True
+            # Offline: one stalled download per cooldown, not one per NameDB built
+            failed_at = self.shared.catalog_failed_at.get(lang)
+            if failed_at is not None and time.monotonic() - failed_at < CATALOG_RETRY_COOLDOWN_S:
+                return False
+            try:
+                r = dd_session().get(f"https://ddragon.leagueoflegends.com/cdn/{self.ver}/data/{lang}/championFull.json", timeout=20)
+                r.raise_for_status()
+                self.catalog.add_lang(lang, r.json())
+            except Exception:
+                self.shared.catalog_failed_at[lang] = time.monotonic()
+                return False
+            self.shared.catalog_failed_at.pop(lang, None)
+            return True
+
+    def _champion_rows(self, lang: str) -> List[tuple]:
+        """(id, slug, name, norm) per champion, from the catalog or champion.json"""
+        if self._catalog_has(lang):
+            return self.catalog.champions(lang)
+        data = self._cache_json(
+            f"champion_{self.ver}_{lang}.json",
+            f"https://ddragon.leagueoflegends.com/cdn/{self.ver}/data/{lang}/champion.json"
+        )
+        rows = []
+        for slug, obj in (data.get("data") or {}).items():
+            try:
+                rows.append((int(obj.get("key")), slug, obj.get("name") or slug, None))
+            except Exception:
+                pass
+        return rows
+
+    def _skin_rows(self, lang: str, slug: str, champ_id: int) -> List[tuple]:
+        """(id, num, name, norm, full_name, full_norm) per skin, from the catalog or the champion's JSON"""
+        if self.catalog is not None and self.catalog.has_lang(lang):
+            return self.catalog.skins(lang, champ_id)
+        data = self._cache_json(
+            f"champ_{slug}_{self.ver}_{lang}.json",
+            f"https://ddragon.leagueoflegends.com/cdn/{self.ver}/data/{lang}/champion/{slug}.json",
+        )
+        champ = ((data.get("data") or {}).get(slug, {}) or {})
+        cname = (
+            self.champ_name_by_id_by_lang.get(lang, {}).get(champ_id)
+            or self.champ_name_by_id.get(champ_id)
+            or slug
+        )
+        rows = []
+        for s in champ.get("skins") or []:
+            try:
+                sname = (s.get("name") or "").strip()
+                rows.append((int(s.get("id")), int(s.get("num") or 0), sname, None, f"{cname} {sname}", None))
+            except Exception:
+                pass
+        return rows
+
     def _load_index(self):
         """Load champion index"""
         for lang in self.langs:
-            data = self._cache_json(
-                f"champion_{self.ver}_{lang}.json",
-                f"https://ddragon.leagueoflegends.com/cdn/{self.ver}/data/{lang}/champion.json"
-            )
-            lang_map: Dict[int, str] = self.champ_name_by_id_by_lang.setdefault(lang, {})
-            for slug, obj in (data.get("data") or {}).items():
-                try:
-                    cid = int(obj.get("key"))
-                    cname = obj.get("name") or slug
-                    self.slug_by_id[cid] = slug
-                    lang_map[cid] = cname
-                    self.entries_by_champ.setdefault(slug, [])
-                    self.entries_by_champ[slug].append(Entry(key=cname, kind="champion", champ_slug=slug, champ_id=cid))
-                except Exception:
-                    pass
+            lt = self.shared.lang(lang)
+            with self.shared.key_lock(("lang", lang)):
+                if lt.champion_entries is None:
+                    entries = []
+                    for cid, slug, cname, norm in self._champion_rows(lang):
+                        slug, cname = intern(slug), intern(cname)
+                        self.slug_by_id[cid] = slug
+                        lt.champ_name_by_id[cid] = cname
+                        entries.append(Entry(key=cname, kind="champion", champ_slug=slug, champ_id=cid))
+                        if norm is not None:
+                            self._norm_cache.setdefault(cname, intern(norm))
+                    lt.champion_entries = entries
+            self.champ_name_by_id_by_lang[lang] = lt.champ_name_by_id
+            for e in lt.champion_entries:
+                self.entries_by_champ.setdefault(e.champ_slug, []).append(e)
 
     def _ensure_champ(self, slug: str, champ_id: int) -> None:
         """Ensure champion data is loaded"""
         if slug in self._skins_loaded:
             return
-        
+        # Per-champion lock: a bulk load elsewhere never delays the champion being matched
+        with self.shared.key_lock(("champ", slug)):
+            if slug not in self._skins_loaded:
+                self._load_champ(slug, champ_id)
+
+    def _build_skins(self, slug: str, champ_id: int, rows: List[tuple]) -> Tuple[List[Entry], List[Tuple[int, str]]]:
+        """Skin entries (full and short label, deduplicated) and (skin id, name) pairs for one language"""
+        entries: List[Entry] = []
+        names: List[Tuple[int, str]] = []
+        seen: set = set()
+        for sid, num, sname, norm, full, full_norm in rows:
+            sname = intern(sname)
+            if sid:
+                names.append((sid, sname))
+            if num == 0 or not sname:
+                continue
+            for label, nk in ((intern(full), full_norm), (sname, norm)):
+                if label in seen:
+                    continue
+                seen.add(label)
+                entries.append(Entry(key=label, kind="skin", champ_slug=slug, champ_id=champ_id, skin_id=sid))
+                if nk is not None:
+                    self._norm_cache.setdefault(label, intern(nk))
+        return entries, names
+
+    def _load_champ(self, slug: str, champ_id: int) -> None:
+        """Build a champion's skin entries and match index"""
         out = self.entries_by_champ.setdefault(slug, [])
         keys_seen: set = set()
         
         for lang in self.langs:
-            try:
-                data = self._cache_json(
-                    f"champ_{slug}_{self.ver}_{lang}.json",
-                    f"https://ddragon.leagueoflegends.com/cdn/{self.ver}/data/{lang}/champion/{slug}.json",
-                )
-                champ = ((data.get("data") or {}).get(slug, {}) or {})
-                skins = champ.get("skins") or []
-                cname = (
-                    self.champ_name_by_id_by_lang.get(lang, {}).get(champ_id)
-                    or self.champ_name_by_id.get(champ_id)
-                    or slug
-                )
-                
-                for s in skins:
-                    try:
-                        sid = int(s.get("id"))
-                        sname = (s.get("name") or "").strip()
-                        num = int(s.get("num") or 0)
-                        if sid:
-                            self.skin_name_by_id[sid] = sname
-                        if num == 0 or not sname:
-                            continue
-                        full = f"{cname} {sname}"
-                        for label in (full, sname):
-                            if label in keys_seen:
-                                continue
-                            out.append(
-                                Entry(key=label, kind="skin", champ_slug=slug, champ_id=champ_id, skin_id=sid)
-                            )
-                            keys_seen.add(label)
-                    except Exception:
-                        pass
-            except Exception:
-                pass
+            lt = self.shared.lang(lang)
+            skins = lt.skins_by_champ.get(slug)
+            if skins is None:
+                try:
+                    rows = self._skin_rows(lang, slug, champ_id)
+                except Exception:
+                    continue
+                skins = self._build_skins(slug, champ_id, rows)
+                lt.skins_by_champ[slug] = skins
+                lt.skin_name_by_id.update(skins[1])
+            entries, names = skins
+            if lt.skin_name_by_id is not self.skin_name_by_id:
+                self.skin_name_by_id.update(names)
+            for e in entries:
+                if e.key not in keys_seen:
+                    keys_seen.add(e.key)
+                    out.append(e)
         self._skins_loaded.add(slug)
+        key = (tuple(self.langs), slug)
+        if key not in self.shared.match_index:
+            self.shared.match_index[key] = SkinMatchIndex.build(out, self.skin_name_by_id, self.champ_name_by_id)
+
+    def prefetch(self, workers: int = 8, progress: Optional[Callable[[int, int], None]] = None, warm: bool = False) -> int:
+        """Download every champion file the configured languages still need (in parallel)
+
+        Languages already in the catalog need nothing; otherwise each champion/{slug}.json
+        is fetched into the JSON cache. warm=True also loads every champion and builds the
+        n-gram index (costly: all entries of all languages in memory). Returns the number
+        of failed downloads.
+        """
+        jobs: List[Tuple[str, str]] = []
+        for lang in self.langs:
+            if self.catalog is not None and self.catalog.has_lang(lang):
+                continue
+            for slug in sorted(set(self.slug_by_id.values())):
+                name = f"champ_{slug}_{self.ver}_{lang}.json"
+                if dd_cache.age(name) is None:
+                    jobs.append((name, f"https://ddragon.leagueoflegends.com/cdn/{self.ver}/data/{lang}/champion/{slug}.json"))
+        
+        failed = 0
+        if jobs:
+            done = 0
+            # One manifest write for the whole download instead of one per file
+            with dd_cache.batch(), ThreadPoolExecutor(max_workers=max(1, int(workers)), thread_name_prefix="dd-prefetch") as ex:
+                futures = [ex.submit(self._cache_json, name, url) for name, url in jobs]
+                for f in as_completed(futures):
+                    done += 1
+                    if f.exception() is not None:
+                        failed += 1
+                    if progress is not None:
+                        progress(done, len(jobs))
+        
+        if warm:
+            self.global_index()
+        return failed
 
     def candidates_for_champ(self, champ_id: Optional[int]) -> List[Entry]:
         """Get candidates for a champion"""
@@ -155,15 +318,135 @@ class NameDB:
         
         if not hasattr(self, "_global_entries") or self._global_entries is None:
             glb = []
-            for lang, mp in self.champ_name_by_id_by_lang.items():
-                for cid, nm in mp.items():
-                    slug = self.slug_by_id.get(cid)
-                    if not slug: 
-                        continue
-                    glb.append(Entry(key=nm, kind="champion", champ_slug=slug, champ_id=cid))
+            for lang in self.langs:
+                glb.extend(self.shared.lang(lang).champion_entries or [])
             self._global_entries = glb
         return self._global_entries
 
+    def skin_vocabulary(self, champ_id: Optional[int]) -> List[str]:
+        """Distinct display names (champion + skins) for a champion, in every loaded language"""
+        if not champ_id or champ_id not in self.slug_by_id:
+            return []
+        out: List[str] = []
+        seen: set = set()
+        for e in self.candidates_for_champ(champ_id):
+            if e.key not in seen:
+                seen.add(e.key)
+                out.append(e.key)
+        return out
+
+    def match_index(self, champ_id: Optional[int]) -> SkinMatchIndex:
+        """Get the precompiled match index for a champion (global champion list if unknown)"""
+        if champ_id and champ_id in self.slug_by_id:
+            slug = self.slug_by_id[champ_id]
+            self._ensure_champ(slug, champ_id)
+            key = (tuple(self.langs), slug)
+            idx = self.shared.match_index.get(key)
+            if idx is None:
+                idx = SkinMatchIndex.build(self.entries_by_champ.get(slug, []), self.skin_name_by_id, self.champ_name_by_id)
+                self.shared.match_index[key] = idx
+            return idx
+        
+        key = (tuple(self.langs), "")
+        idx = self.shared.match_index.get(key)
+        if idx is None:
+            idx = SkinMatchIndex.build(self.candidates_for_champ(None), self.skin_name_by_id, self.champ_name_by_id)
+            self.shared.match_index[key] = idx
+        return idx
+
+    def global_index(self) -> NGramIndex:
+        """N-gram index over every champion and skin label of the loaded languages (loads all champions once)"""
+        key = tuple(self.langs)
+        idx = self.shared.ngram_index.get(key)
+        if idx is not None:
+            return idx
+        # Champions load one by one under their own locks, so a champion needed for
+        # matching is never stuck behind this bulk load
+        for cid, slug in list(self.slug_by_id.items()):
+            self._ensure_champ(slug, cid)
+        with self.shared.key_lock(("ngram", key)):
+            idx = self.shared.ngram_index.get(key)
+            if idx is None:
+                entries: List[Entry] = []
+                seen: set = set()
+                for slug in sorted(self.entries_by_champ):
+                    for e in self.entries_by_champ[slug]:
+                        if (e.key, e.champ_id) not in seen:
+                            seen.add((e.key, e.champ_id))
+                            entries.append(e)
+                keys = [self._norm_cache.get(e.key) or normalize_text(e.key) for e in entries]
+                idx = NGramIndex(entries, keys)
+                self.shared.ngram_index[key] = idx
+        return idx
+
+    def built_global_index(self) -> Optional[NGramIndex]:
+        """The n-gram index if it has already been built (never triggers the full load)"""
+        return self.shared.ngram_index.get(tuple(self.langs))
+
+    def warm_global_index(self) -> Optional[NGramIndex]:
+        """The n-gram index if built; otherwise start building it on a background thread and return None"""
+        idx = self.built_global_index()
+        if idx is not None:
+            return idx
+        key = tuple(self.langs)
+        with self.shared.lock:
+            if key in self.shared.ngram_building:
+                return None
+            self.shared.ngram_building.add(key)
+        threading.Thread(target=self._build_global_index, args=(key,), daemon=True, name="ngram-warm").start()
+        return None
+
+    def _build_global_index(self, key: Tuple[str, ...]) -> None:
+        try:
+            self.global_index()
+        except Exception as e:
+            print(f"[NameDB] n-gram index build failed: {e}")
+        finally:
+            with self.shared.lock:
+                self.shared.ngram_building.discard(key)
+
+    def search(self, txt: str, k: int = 5) -> List[MatchResult]:
+        """Best k labels for an OCR string across all champions (when the champion is unknown)
+
+        Never blocks on the full load: [] until the background build of the index is done.
+        """
+        idx = self.warm_global_index()
+        return idx.search(txt, k) if idx is not None else []
+
+    def normalized_keys(self, champ_id: Optional[int]) -> Tuple[Tuple[Entry, ...], List[str]]:
+        """Candidates and their normalized keys as parallel sequences, for batched scoring (cached)"""
+        key = (tuple(self.langs), self.slug_by_id.get(champ_id, "") if champ_id else "")
+        cached = self.shared.norm_keys.get(key)
+        if cached is None:
+            pairs = self.normalized_entries(champ_id)
+            cached = (tuple(e for e, _ in pairs), [nk for _, nk in pairs])
+            self.shared.norm_keys[key] = cached
+        return cached
+
+    def exact_entries(self, champ_id: Optional[int]) -> Dict[str, Entry]:
+        """normalize_text(key) -> first entry with that key: the champion's candidates, or every label if champ_id is unknown
+
+        Without a champion the table comes from the n-gram index once its background build
+        (see warm_global_index) is done; until then it is empty rather than loading every champion.
+        """
+        scope = self.slug_by_id.get(champ_id, "*") if champ_id else "*"
+        key = (tuple(self.langs), scope)
+        table = self.shared.exact.get(key)
+        if table is None:
+            if scope == "*":
+                idx = self.built_global_index()
+                if idx is None:
+                    return {}
+                table = {}
+                for e, nk in zip(idx.entries, idx.keys):
+                    table.setdefault(nk, e)
+            else:
+                table = {}
+                for e, nk in zip(*self.normalized_keys(champ_id)):
+                    table.setdefault(nk, e)
+            self.shared.exact[key] = table
+        return table
+
     def normalized_entries(self, champ_id: Optional[int]) -> List[tuple]:
         """Get normalized entries for a champion"""
         entries = self.candidates_for_champ(champ_id)
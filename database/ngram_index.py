@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Character n-gram inverted index for skin lookup without a known champion
+"""
+
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, List, Sequence
+import numpy as np
+from rapidfuzz.distance import Levenshtein
+from utils.normalization import normalize_text
+from .match_index import MatchResult
+
+if TYPE_CHECKING:
+    from .name_db import Entry
+
+
+def ngrams(s: str, n: int = 3) -> set:
+    """Distinct n-grams of a normalized string, padded so short names still produce grams"""
+    s = f" {s} "
+    if len(s) < n:
+        return {s}
+    return {s[i:i + n] for i in range(len(s) - n + 1)}
+
+
+class NGramIndex:
+    """Inverted index gram -> candidate ids over every label (all champions, all loaded languages)
+
+    search() counts shared grams over the ids in the query's posting lists,
+    keeps the best Dice overlaps and re-ranks only those by Levenshtein distance.
+    """
+
+    def __init__(self, entries: Sequence["Entry"], keys: Sequence[str], n: int = 3):
+        self.n = n
+        self.entries = tuple(entries)
+        self.names = tuple(e.key for e in self.entries)
+        postings: Dict[str, List[int]] = defaultdict(list)
+        counts = np.zeros(len(keys), dtype=np.int32)
+        for i, key in enumerate(keys):
+            grams = ngrams(key, n)
+            counts[i] = len(grams)
+            for g in grams:
+                postings[g].append(i)
+        self.postings: Dict[str, np.ndarray] = {g: np.asarray(ids, dtype=np.int32) for g, ids in postings.items()}
+        self.gram_counts = counts
+        self.keys = tuple(keys)
+        # Normalized key -> first id: a clean read skips the gram count and the re-rank
+        self.exact: Dict[str, int] = {}
+        for i, key in enumerate(self.keys):
+            self.exact.setdefault(key, i)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def search(self, txt: str, k: int = 5, shortlist: int = 32) -> List[MatchResult]:
+        """Top-k labels for an OCR string, best first (score = 1 - d / max_len on the raw strings)"""
+        if not txt or not self.entries:
+            return []
+        norm = normalize_text(txt)
+        if k == 1 and norm in self.exact:
+            # Clean read (up to case, spacing and marks): distance 0 on the normalized text
+            i = self.exact[norm]
+            return [MatchResult(entry=self.entries[i], name=self.names[i], distance=0, score=1.0)]
+        grams = ngrams(norm, self.n)
+        lists = [self.postings[g] for g in grams if g in self.postings]
+        if not lists:
+            return []
+        # Work on the touched ids only (a few thousand at most), not on every label
+        ids, shared = np.unique(np.concatenate(lists), return_counts=True)
+        dice = (2.0 * shared) / (len(grams) + self.gram_counts[ids])
+        m = max(k, shortlist)
+        cand = ids[np.argpartition(-dice, m - 1)[:m]] if m < len(ids) else ids
+
+        # Stable sort over ascending ids: ties keep index order
+        out = [self._result(txt, i) for i in np.sort(cand).tolist()]
+        out.sort(key=lambda r: -r.score)
+        return out[:k]
+
+    def _result(self, txt: str, i: int) -> MatchResult:
+        name = self.names[i]
+        d = Levenshtein.distance(txt, name)
+        max_len = max(len(txt), len(name))
+        score = 1.0 - (d / max_len) if max_len > 0 else 0.0
+        return MatchResult(entry=self.entries[i], name=name, distance=d, score=score)
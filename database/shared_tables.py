@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Name tables shared by every NameDB instance of a DataDragon version
+"""
+
+import sys
+import threading
+from typing import TYPE_CHECKING, Dict, Hashable, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from .name_db import Entry
+    from .match_index import SkinMatchIndex
+    from .ngram_index import NGramIndex
+
+
+def intern(s: str) -> str:
+    """One string object per distinct name across all languages and instances"""
+    return sys.intern(s) if s else s
+
+
+class LangTables:
+    """One language's champion/skin names and entries, built once and shared"""
+    __slots__ = ("champ_name_by_id", "skin_name_by_id", "champion_entries", "skins_by_champ")
+
+    def __init__(self):
+        self.champ_name_by_id: Dict[int, str] = {}
+        self.skin_name_by_id: Dict[int, str] = {}
+        # None until the language's champion list is loaded
+        self.champion_entries: Optional[List["Entry"]] = None
+        # slug -> (skin entries, [(skin_id, name)] of every skin incl. the base one)
+        self.skins_by_champ: Dict[str, Tuple[List["Entry"], List[Tuple[int, str]]]] = {}
+
+
+class SharedTables:
+    """Per-version id tables, normalized keys and per-language names that NameDB views point into"""
+
+    _by_version: Dict[str, "SharedTables"] = {}
+    _by_version_lock = threading.Lock()
+
+    def __init__(self, ver: str):
+        self.ver = ver
+        # Guards the dicts below; loading work runs under key_lock() instead
+        self.lock = threading.RLock()
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self.slug_by_id: Dict[int, str] = {}
+        self.norm: Dict[str, str] = {}
+        self.langs: Dict[str, LangTables] = {}
+        # (languages, slug) -> match index; identical for every NameDB with the same languages
+        self.match_index: Dict[Tuple[Tuple[str, ...], str], "SkinMatchIndex"] = {}
+        # (languages, slug) -> (entries, normalized keys) for batched scoring
+        self.norm_keys: Dict[Tuple[Tuple[str, ...], str], Tuple[tuple, List[str]]] = {}
+        # (languages, slug or "*" for every label) -> normalized key -> entry
+        self.exact: Dict[Tuple[Tuple[str, ...], str], Dict[str, "Entry"]] = {}
+        # languages -> n-gram index over every champion and skin label
+        self.ngram_index: Dict[Tuple[str, ...], "NGramIndex"] = {}
+        # languages whose n-gram index is being built in the background
+        self.ngram_building: Set[Tuple[str, ...]] = set()
+        # language -> monotonic time its catalog download last failed
+        self.catalog_failed_at: Dict[str, float] = {}
+
+    @classmethod
+    def for_version(cls, ver: str) -> "SharedTables":
+        with cls._by_version_lock:
+            tables = cls._by_version.get(ver)
+            if tables is None:
+                tables = cls(ver)
+                cls._by_version[ver] = tables
+            return tables
+
+    def key_lock(self, key: Hashable) -> threading.Lock:
+        """Lock for loading one item (a language's champion list, one champion's skins...)
+
+        Loads of different items run in parallel; only loads of the same item wait for each other.
+        """
+        with self.lock:
+            lk = self._key_locks.get(key)
+            if lk is None:
+                lk = threading.Lock()
+                self._key_locks[key] = lk
+            return lk
+
+    def lang(self, lang: str) -> LangTables:
+        with self.lock:
+            lt = self.langs.get(lang)
+            if lt is None:
+                lt = LangTables()
+                self.langs[lang] = lt
+            return lt
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Incremental champ-select model fed with successive session payloads
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+# Event kinds
+PLAYERS = "players"          # value = visible player count
+LOCK = "lock"                # cell_id locked champion_id (value = previous champion if it changed)
+UNLOCK = "unlock"            # cell_id lost its lock (champion_id = previous champion)
+HOVER = "hover"              # local player's pick intent changed to champion_id
+TIMER_PHASE = "timer_phase"  # value = new timer phase (PLANNING, BAN_PICK, FINALIZATION...)
+
+
+@dataclass
+class ChampSelectEvent:
+    kind: str
+    cell_id: Optional[int] = None
+    champion_id: int = 0
+    value: Any = None
+
+
+def _int(v: Any) -> int:
+    try:
+        return int(v or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+class ChampSelectModel:
+    """Champ-select state kept across session pushes
+
+    Every push still carries the whole session, but each player row and pick action is
+    compared against its previous signature and only the cells whose inputs changed get
+    their lock recomputed; nothing is rebuilt when a push only touches unrelated fields.
+    Lock rules are the ones of lcu.utils.compute_locked.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget everything (champ select left or a new game started)"""
+        self.game_id: Optional[int] = None
+        self.local_cell_id: Optional[int] = None
+        self.timer_phase: Optional[str] = None
+        self.players_visible = 0
+        # cellId -> (championId, pick intent, isPickIntenting)
+        self._players: Dict[int, Tuple[int, int, bool]] = {}
+        # action id -> (actorCellId, championId, position in the session) of completed pick actions
+        self._picks: Dict[Any, Tuple[int, int, int]] = {}
+        # action id -> actorCellId of every action (visible players fallback when teams are hidden)
+        self._actors: Dict[Any, int] = {}
+        self.locks: Dict[int, int] = {}
+
+    def apply(self, sess: Optional[Dict[str, Any]]) -> List[ChampSelectEvent]:
+        """Update from a session payload and return what changed"""
+        if not sess:
+            return []
+        game_id = sess.get("gameId")
+        if game_id != self.game_id:
+            if self.game_id is not None:
+                self.reset()
+            self.game_id = game_id
+        if sess.get("localPlayerCellId") is not None:
+            self.local_cell_id = _int(sess.get("localPlayerCellId"))
+
+        events: List[ChampSelectEvent] = []
+        dirty: Set[int] = set()
+        hover = self._apply_players(sess, dirty)
+        self._apply_actions(sess, dirty)
+
+        count = len(self._players) or len(set(self._actors.values()))
+        if count != self.players_visible and count > 0:
+            self.players_visible = count
+            events.append(ChampSelectEvent(PLAYERS, value=count))
+
+        for cid in sorted(dirty):
+            ch = self._lock_for(cid)
+            prev = self.locks.get(cid, 0)
+            if ch == prev:
+                continue
+            if ch:
+                self.locks[cid] = ch
+                events.append(ChampSelectEvent(LOCK, cid, ch, value=prev or None))
+            else:
+                del self.locks[cid]
+                events.append(ChampSelectEvent(UNLOCK, cid, prev))
+
+        if hover:
+            events.append(ChampSelectEvent(HOVER, self.local_cell_id, hover))
+
+        phase = str(((sess.get("timer") or {}).get("phase") or "")).upper() or None
+        if phase != self.timer_phase:
+            self.timer_phase = phase
+            events.append(ChampSelectEvent(TIMER_PHASE, value=phase))
+        return events
+
+    def _apply_players(self, sess: Dict[str, Any], dirty: Set[int]) -> int:
+        """Diff player rows; returns the local player's new pick intent (0 if unchanged)"""
+        hover = 0
+        seen: Set[int] = set()
+        for side in (sess.get("myTeam") or [], sess.get("theirTeam") or []):
+            for p in side or []:
+                cid = p.get("cellId")
+                if cid is None:
+                    continue
+                cid = int(cid)
+                seen.add(cid)
+                sig = (_int(p.get("championId")),
+                       _int(p.get("championPickIntent") or p.get("pickIntentChampionId")),
+                       bool(p.get("isPickIntenting") or False))
+                old = self._players.get(cid)
+                if sig == old:
+                    continue
+                self._players[cid] = sig
+                dirty.add(cid)
+                if cid == self.local_cell_id and sig[1] and (old is None or old[1] != sig[1]):
+                    hover = sig[1]
+        if len(seen) != len(self._players):
+            for cid in [c for c in self._players if c not in seen]:
+                del self._players[cid]
+                dirty.add(cid)
+        return hover
+
+    def _apply_actions(self, sess: Dict[str, Any], dirty: Set[int]) -> None:
+        seen: Set[Any] = set()
+        for rnd in (sess.get("actions") or []):
+            for a in rnd or []:
+                cid = a.get("actorCellId")
+                if cid is None:
+                    continue
+                cid = int(cid)
+                pos = len(seen)
+                aid = a.get("id", (cid, a.get("type"), pos))
+                seen.add(aid)
+                self._actors[aid] = cid
+                if a.get("type") == "pick" and a.get("completed"):
+                    sig = (cid, _int(a.get("championId")), pos)
+                    if self._picks.get(aid) != sig:
+                        old = self._picks.get(aid)
+                        if old is not None:
+                            dirty.add(old[0])
+                        self._picks[aid] = sig
+                        dirty.add(cid)
+                elif aid in self._picks:
+                    dirty.add(self._picks.pop(aid)[0])
+        if len(seen) != len(self._actors):
+            for aid in [a for a in self._actors if a not in seen]:
+                del self._actors[aid]
+                if aid in self._picks:
+                    dirty.add(self._picks.pop(aid)[0])
+
+    def _lock_for(self, cid: int) -> int:
+        """Locked champion of one cell (compute_locked restricted to that cell)"""
+        player = self._players.get(cid)
+        p_champ = player[0] if player else 0
+        if player and p_champ > 0 and player[1] == 0 and not player[2]:
+            return p_champ
+        # Last completed pick in session order wins
+        ch, last = 0, -1
+        for actor, champ, pos in self._picks.values():
+            if actor != cid or pos < last:
+                continue
+            champ = champ or p_champ
+            if champ > 0:
+                ch, last = champ, pos
+        return ch
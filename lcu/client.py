@@ -6,11 +6,12 @@ League Client API client
 
 import os
 import time
-import psutil
-import requests
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from utils.logging import get_logger
+from .http_client import LCUHttpClient, LCUTransportError
+from .lockfile_watcher import LockfileWatcher
+from .session_store import SessionStore
 
 log = get_logger()
 
@@ -24,58 +25,25 @@ class Lockfile:
     protocol: str
 
 
-def _find_lockfile(explicit: Optional[str]) -> Optional[str]:
-    """Find League Client lockfile"""
-    if explicit and os.path.isfile(explicit): 
-        return explicit
-    
-    env = os.environ.get("LCU_LOCKFILE")
-    if env and os.path.isfile(env): 
-        return env
-    
-    if os.name == "nt":
-        for p in (r"C:\\Riot Games\\League of Legends\\lockfile",
-                  r"C:\\Program Files\\Riot Games\\League of Legends\\lockfile",
-                  r"C:\\Program Files (x86)\\Riot Games\\League of Legends\\lockfile"):
-            if os.path.isfile(p): 
-                return p
-    else:
-        for p in ("/Applications/League of Legends.app/Contents/LoL/lockfile",
-                  os.path.expanduser("~/.local/share/League of Legends/lockfile")):
-            if os.path.isfile(p): 
-                return p
-    
-    try:
-        for proc in psutil.process_iter(attrs=["name", "exe"]):
-            nm = (proc.info.get("name") or "").lower()
-            if "leagueclient" in nm:
-                exe = proc.info.get("exe") or ""
-                for d in (os.path.dirname(exe), os.path.dirname(os.path.dirname(exe))):
-                    p = os.path.join(d, "lockfile")
-                    if os.path.isfile(p): 
-                        return p
-    except Exception:
-        pass
-    return None
-
-
 class LCU:
     """League Client API client"""
     
-    def __init__(self, lockfile_path: Optional[str]):
+    def __init__(self, lockfile_path: Optional[str], pool_size: int = 8):
         self.ok = False
         self.port = None
         self.pw = None
         self.base = None
-        self.s = None
+        self.http = LCUHttpClient(pool_size=pool_size)
+        self.sessions = SessionStore()
         self._explicit_lockfile = lockfile_path
+        self.watcher = LockfileWatcher(lockfile_path)
         self.lf_path = None
         self.lf_mtime = 0.0
         self._init_from_lockfile()
 
     def _init_from_lockfile(self):
         """Initialize from lockfile"""
-        lf = _find_lockfile(self._explicit_lockfile)
+        lf, _ = self.watcher.poll()
         self.lf_path = lf
         if not lf or not os.path.isfile(lf):
             self._disable("LCU lockfile introuvable")
@@ -86,10 +54,7 @@ class LCU:
             self.port = int(port)
             self.pw = pw
             self.base = f"https://127.0.0.1:{self.port}"
-            self.s = requests.Session()
-            self.s.verify = False
-            self.s.auth = ("riot", pw)
-            self.s.headers.update({"Content-Type": "application/json"})
+            self.http.configure(self.base, pw)
             self.ok = True
             try: 
                 self.lf_mtime = os.path.getmtime(lf)
@@ -107,23 +72,18 @@ class LCU:
         self.base = None
         self.port = None
         self.pw = None
-        self.s = requests.Session()
-        self.s.verify = False
+        if self.http.base is not None:
+            self.http.configure(None, None)
 
     def refresh_if_needed(self, force: bool = False):
         """Refresh connection if needed"""
-        lf = _find_lockfile(self._explicit_lockfile)
-        if not lf or not os.path.isfile(lf):
+        lf, mt = self.watcher.poll()
+        if not lf:
             self._disable("lockfile absent")
             self.lf_path = None
             self.lf_mtime = 0.0
             return
         
-        try: 
-            mt = os.path.getmtime(lf)
-        except Exception: 
-            mt = 0.0
-        
         if force or lf != self.lf_path or (mt and mt != self.lf_mtime) or not self.ok:
             old = (self.port, self.pw)
             self.lf_path = lf
@@ -132,6 +92,15 @@ class LCU:
             if self.ok and old != new: 
                 log.info(f"LCU relu (port={self.port})")
 
+    def _get_once(self, path: str, timeout: float):
+        """One GET through the pooled client; LCUTransportError on connection or HTTP error"""
+        status, data = self.http.get_sync(path, timeout=timeout)
+        if status in (404, 405):
+            return None
+        if status >= 400:
+            raise LCUTransportError(f"HTTP {status} for {path}")
+        return data
+
     def get(self, path: str, timeout: float = 1.0):
         """Make GET request to LCU API"""
         if not self.ok:
@@ -140,38 +109,43 @@ class LCU:
                 return None
         
         try:
-            r = self.s.get((self.base or "") + path, timeout=timeout)
-            if r.status_code in (404, 405): 
-                return None
-            r.raise_for_status()
-            try: 
-                return r.json()
-            except Exception: 
-                return None
-        except requests.exceptions.RequestException:
+            return self._get_once(path, timeout)
+        except LCUTransportError:
             self.refresh_if_needed(force=True)
             if not self.ok: 
                 return None
             try:
-                r = self.s.get((self.base or "") + path, timeout=timeout)
-                if r.status_code in (404, 405): 
-                    return None
-                r.raise_for_status()
-                try: 
-                    return r.json()
-                except Exception: 
-                    return None
-            except requests.exceptions.RequestException:
+                return self._get_once(path, timeout)
+            except LCUTransportError:
                 return None
 
+    def latency_report(self) -> Dict[str, str]:
+        """Per-endpoint latency histogram summaries"""
+        return self.http.report()
+
+    def close(self):
+        """Close pooled connections"""
+        self.watcher.stop()
+        self.http.close()
+
     def phase(self) -> Optional[str]:
         """Get current gameflow phase"""
         ph = self.get("/lol-gameflow/v1/gameflow-phase")
         return ph if isinstance(ph, str) else None
 
-    def session(self) -> Optional[dict]:
-        """Get current session"""
-        return self.get("/lol-champ-select/v1/session")
+    def session(self, max_age_s: Optional[float] = None) -> Optional[dict]:
+        """Get current session (from the WebSocket snapshot while the feed is live and fresh enough)"""
+        return self.session_snapshot(max_age_s)[0]
+
+    def session_snapshot(self, max_age_s: Optional[float] = None) -> Tuple[Optional[dict], float]:
+        """(session, monotonic time it was received); HTTP only when the push feed is down or older than max_age_s"""
+        snap = self.sessions.snapshot(max_age_s)
+        if snap is not None:
+            return snap
+        t0 = time.monotonic()
+        sess = self.get("/lol-champ-select/v1/session")
+        self.sessions.seed(sess, t0)
+        return sess, time.monotonic()
 
     def hovered_champion_id(self) -> Optional[int]:
         """Get hovered champion ID"""
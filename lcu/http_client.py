@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+League Client API transport (pooled keep-alive, coalesced GETs, latency histograms)
+"""
+
+import time
+import threading
+from bisect import bisect_left
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from typing import Any, Dict, Optional, Tuple
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class LCUTransportError(Exception):
+    """Connection-level failure (refused, reset, timeout): the caller may re-read the lockfile and retry"""
+
+
+class LatencyHistogram:
+    """Request latency buckets for one endpoint"""
+
+    BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BOUNDS_MS) + 1)
+        self.n = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.errors = 0
+        self.coalesced = 0
+
+    def add(self, ms: float) -> None:
+        self.counts[bisect_left(self.BOUNDS_MS, ms)] += 1
+        self.n += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def percentile(self, q: float) -> float:
+        """Upper bound (ms) of the bucket holding the q-th percentile"""
+        if not self.n:
+            return 0.0
+        rank = q / 100.0 * self.n
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= rank:
+                return float(self.BOUNDS_MS[i]) if i < len(self.BOUNDS_MS) else self.max_ms
+        return self.max_ms
+
+    def summary(self) -> str:
+        mean = self.total_ms / self.n if self.n else 0.0
+        return (f"n={self.n} avg={mean:.1f}ms p50<={self.percentile(50):.0f}ms p95<={self.percentile(95):.0f}ms "
+                f"max={self.max_ms:.1f}ms coalesced={self.coalesced} errors={self.errors}")
+
+
+class LCUHttpClient:
+    """LCU GETs through one keep-alive requests.Session, called from the caller's thread
+
+    - pooled connections (pool_size per client instance)
+    - identical GETs (same client base and path) issued while one is in flight share its result
+    - per-endpoint latency histograms (successful requests; failures are counted as errors)
+    """
+
+    def __init__(self, pool_size: int = 8):
+        self.pool_size = max(1, int(pool_size))
+        self.base: Optional[str] = None
+        self._password: Optional[str] = None
+        self._inflight: Dict[Tuple[Optional[str], str], Future] = {}
+        self._lock = threading.Lock()  # base/password, session, _inflight
+        self._stats_lock = threading.Lock()
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self._session: Optional[requests.Session] = None
+
+    def configure(self, base: Optional[str], password: Optional[str]) -> None:
+        """Point at a (new) client instance; existing pooled connections are dropped"""
+        with self._lock:
+            self.base = base
+            self._password = password
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def _histogram(self, path: str) -> LatencyHistogram:
+        key = path.split("?", 1)[0]
+        with self._stats_lock:
+            h = self.histograms.get(key)
+            if h is None:
+                h = LatencyHistogram()
+                self.histograms[key] = h
+            return h
+
+    def _record(self, hist: LatencyHistogram, ms: Optional[float] = None, error: bool = False, coalesced: bool = False) -> None:
+        with self._stats_lock:
+            if ms is not None:
+                hist.add(ms)
+            hist.errors += error
+            hist.coalesced += coalesced
+
+    def _requests_session(self) -> requests.Session:
+        """Pooled session for the current target (caller holds self._lock)"""
+        if self._session is None:
+            s = requests.Session()
+            s.verify = False
+            if self._password:
+                s.auth = ("riot", self._password)
+            s.headers.update({"Content-Type": "application/json"})
+            s.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size))
+            self._session = s
+        return self._session
+
+    def _requests_get(self, session: requests.Session, url: str, timeout: float) -> Tuple[int, Any]:
+        try:
+            r = session.get(url, timeout=timeout)
+        except requests.exceptions.RequestException as e:
+            raise LCUTransportError(str(e)) from e
+        try:
+            return r.status_code, r.json()
+        except Exception:
+            return r.status_code, None
+
+    def get_sync(self, path: str, timeout: float = 1.0) -> Tuple[int, Any]:
+        """(status, parsed JSON or None); raises LCUTransportError on connection failure
+
+        The first caller fetches; concurrent callers for the same base and path wait for its result.
+        """
+        hist = self._histogram(path)
+        with self._lock:
+            base = self.base
+            key = (base, path)
+            fut = self._inflight.get(key)
+            owner = fut is None
+            if owner:
+                fut = Future()
+                self._inflight[key] = fut
+                session = self._requests_session()
+        if not owner:
+            self._record(hist, coalesced=True)
+            try:
+                return fut.result(timeout=timeout + 1.0)
+            except FutureTimeout as e:
+                raise LCUTransportError(f"timeout waiting for {path}") from e
+
+        t0 = time.perf_counter()
+        try:
+            res = self._requests_get(session, (base or "") + path, timeout)
+        except Exception as e:
+            self._record(hist, error=True)
+            fut.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+        self._record(hist, (time.perf_counter() - t0) * 1000.0)
+        fut.set_result(res)
+        return res
+
+    def report(self) -> Dict[str, str]:
+        """Histogram summary per endpoint"""
+        with self._stats_lock:
+            return {path: h.summary() for path, h in sorted(self.histograms.items())}
+
+    def close(self) -> None:
+        self.configure(None, None)
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+League Client lockfile discovery and change watching
+"""
+
+import os
+import time
+import threading
+import psutil
+from typing import Callable, List, Optional, Tuple
+from utils.logging import get_logger
+
+try:
+    from watchdog.observers import Observer  # pyright: ignore[reportMissingImports]
+    from watchdog.events import FileSystemEventHandler  # pyright: ignore[reportMissingImports]
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
+log = get_logger()
+
+# Minimum time between two process-table scans while the install location is unknown
+SCAN_INTERVAL_S = 15.0
+
+
+def _known_lockfile(explicit: Optional[str]) -> Optional[str]:
+    """Lockfile from the explicit path, LCU_LOCKFILE or a default install location (stat only)"""
+    if explicit and os.path.isfile(explicit):
+        return explicit
+
+    env = os.environ.get("LCU_LOCKFILE")
+    if env and os.path.isfile(env):
+        return env
+
+    if os.name == "nt":
+        for p in (r"C:\\Riot Games\\League of Legends\\lockfile",
+                  r"C:\\Program Files\\Riot Games\\League of Legends\\lockfile",
+                  r"C:\\Program Files (x86)\\Riot Games\\League of Legends\\lockfile"):
+            if os.path.isfile(p):
+                return p
+    else:
+        for p in ("/Applications/League of Legends.app/Contents/LoL/lockfile",
+                  os.path.expanduser("~/.local/share/League of Legends/lockfile")):
+            if os.path.isfile(p):
+                return p
+    return None
+
+
+def _scan_processes() -> Optional[str]:
+    """Lockfile next to a running LeagueClient executable (walks the whole process table)"""
+    try:
+        for proc in psutil.process_iter(attrs=["name", "exe"]):
+            nm = (proc.info.get("name") or "").lower()
+            if "leagueclient" in nm:
+                exe = proc.info.get("exe") or ""
+                for d in (os.path.dirname(exe), os.path.dirname(os.path.dirname(exe))):
+                    p = os.path.join(d, "lockfile")
+                    if os.path.isfile(p):
+                        return p
+    except Exception:
+        pass
+    return None
+
+
+class _DirHandler(FileSystemEventHandler):
+    """Re-polls the watcher on any event touching the lockfile, so listeners hear about it right away"""
+
+    def __init__(self, watcher: "LockfileWatcher"):
+        self.watcher = watcher
+
+    def on_any_event(self, event):
+        paths = (getattr(event, "src_path", ""), getattr(event, "dest_path", ""))
+        if any(p and os.path.basename(p) == "lockfile" for p in paths):
+            self.watcher._dirty.set()
+            try:
+                self.watcher.poll()
+            except Exception as e:
+                log.debug(f"[lockfile] poll from notification failed: {e}")
+
+
+class LockfileWatcher:
+    """Remembers the lockfile location and only stats that file while it exists
+
+    When the remembered lockfile is missing (client closed, moved or reinstalled) the
+    location is resolved again: known paths first, then the process table at most every
+    scan_interval_s. With watchdog installed (optional, not in requirements.txt),
+    filesystem notifications replace the per-poll stat and push events from the
+    observer thread; without it, events are emitted by poll().
+    Listeners receive "connected", "changed" (new port/password) and "disconnected".
+    """
+
+    def __init__(self, explicit: Optional[str] = None, scan_interval_s: float = SCAN_INTERVAL_S):
+        self.explicit = explicit
+        self.scan_interval_s = scan_interval_s
+        self.path: Optional[str] = None
+        self.mtime = 0.0
+        self._install_path: Optional[str] = None
+        self._last_scan = 0.0
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[str, Optional[str]], None]] = []
+        self._dirty = threading.Event()
+        self._dirty.set()
+        self._observer = None
+        self._watch_dir: Optional[str] = None
+
+    def add_listener(self, fn: Callable[[str, Optional[str]], None]) -> None:
+        """fn(event, path) on connect / change / disconnect"""
+        self._listeners.append(fn)
+
+    def _resolve(self) -> Optional[str]:
+        if self._install_path and os.path.isfile(self._install_path):
+            return self._install_path
+        lf = _known_lockfile(self.explicit)
+        if not lf:
+            now = time.monotonic()
+            if now - self._last_scan < self.scan_interval_s:
+                return None
+            self._last_scan = now
+            lf = _scan_processes()
+        if lf and lf != self._install_path:
+            self._install_path = lf
+            self._watch(os.path.dirname(lf))
+            log.debug(f"[lockfile] install location: {lf}")
+        return lf
+
+    def _watch(self, directory: str) -> None:
+        if Observer is None or directory == self._watch_dir:
+            return
+        self.stop()
+        self._watch_dir = directory
+        try:
+            obs = Observer()
+            obs.schedule(_DirHandler(self), directory, recursive=False)
+            obs.daemon = True
+            obs.start()
+            self._observer = obs
+        except Exception as e:
+            log.debug(f"[lockfile] notifications unavailable, polling: {e}")
+
+    def poll(self) -> Tuple[Optional[str], float]:
+        """Current (lockfile path, mtime); (None, 0.0) while the client is not running"""
+        with self._lock:
+            # Nothing to stat until notified, unless the last poll missed (keep re-resolving then)
+            if self._observer is not None and self.path and not self._dirty.is_set():
+                return self.path, self.mtime
+            self._dirty.clear()
+
+            lf = self._resolve()
+            mt = 0.0
+            if lf:
+                try:
+                    mt = os.path.getmtime(lf)
+                except OSError:
+                    lf = None
+            old_path, old_mtime = self.path, self.mtime
+            self.path, self.mtime = lf, mt
+
+        if lf and not old_path:
+            self._emit("connected", lf)
+        elif not lf and old_path:
+            self._emit("disconnected", None)
+        elif lf and (lf != old_path or mt != old_mtime):
+            self._emit("changed", lf)
+        return lf, mt
+
+    def _emit(self, event: str, path: Optional[str]) -> None:
+        for fn in list(self._listeners):
+            try:
+                fn(event, path)
+            except Exception as e:
+                log.debug(f"[lockfile] listener error: {e}")
+
+    def stop(self) -> None:
+        if self._observer is not None:
+            try:
+                self._observer.stop()
+            except Exception:
+                pass
+            self._observer = None
+        self._watch_dir = None
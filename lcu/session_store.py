@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Champ-select session snapshot kept up to date by the WebSocket feed
+"""
+
+import time
+import threading
+from typing import Optional, Tuple
+
+# Readers fall back to HTTP once the last push (or HTTP seed) is older than this; the client
+# pushes on every change, so quiet stretches cost one request per interval at most
+SESSION_MAX_AGE_S = 2.0
+
+
+class SessionStore:
+    """Latest /lol-champ-select/v1/session payload with the monotonic time it was received
+
+    The WebSocket thread marks the feed live when the first subscribed session event
+    arrives (not when the subscribe frames are sent) and pushes every session update;
+    while live, readers are served from memory as long as the snapshot is younger than
+    the max_age_s they pass. When the feed is down (no WS mode, reconnecting, silent
+    subscription) or the snapshot is too old, LCU.session() falls back to HTTP.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data: Optional[dict] = None
+        self._received_at = 0.0
+        self._live = False
+        self.pushes = 0
+        self.hits = 0
+
+    @property
+    def live(self) -> bool:
+        return self._live
+
+    def set_live(self, live: bool) -> None:
+        """Feed (dis)connected; going down also drops the snapshot"""
+        with self._lock:
+            self._live = live
+            if not live:
+                self._data = None
+                self._received_at = 0.0
+
+    def put(self, data: Optional[dict], received_at: Optional[float] = None) -> None:
+        """Store a pushed session payload (None once the session is deleted)"""
+        with self._lock:
+            self._data = data if isinstance(data, dict) else None
+            self._received_at = received_at if received_at is not None else time.monotonic()
+            self.pushes += 1
+
+    def seed(self, data: Optional[dict], requested_at: float) -> None:
+        """Store an HTTP response unless a push arrived after the request was sent"""
+        with self._lock:
+            if not self._live or self._received_at >= requested_at:
+                return
+            self._data = data if isinstance(data, dict) else None
+            self._received_at = time.monotonic()
+
+    def clear(self) -> None:
+        """Champ select left: the session endpoint now 404s"""
+        self.put(None)
+
+    def fresh(self, max_age_s: float) -> bool:
+        """Feed live and snapshot younger than max_age_s (no hit counted)"""
+        with self._lock:
+            return self._live and bool(self._received_at) and time.monotonic() - self._received_at <= max_age_s
+
+    def snapshot(self, max_age_s: Optional[float] = None) -> Optional[Tuple[Optional[dict], float]]:
+        """(session or None, received_at) if the feed is live and the snapshot fresh enough, else None"""
+        with self._lock:
+            if not self._live or not self._received_at:
+                return None
+            if max_age_s is not None and time.monotonic() - self._received_at > max_age_s:
+                return None
+            self.hits += 1
+            return self._data, self._received_at
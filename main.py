@@ -5,10 +5,11 @@ Main entry point for the modularized LoL Skin Changer
 """
 
 import argparse
+import threading
 import time
-from ocr.backend import OCR
+from ocr.backend import OCR, OCRPool
 from database.name_db import NameDB
-from database.multilang_db import MultiLanguageDB
+from database.multilang_db import MultiLanguageDB, SCORERS, SUPPORTED_LANGUAGES
 from lcu.client import LCU
 from state.shared_state import SharedState
 from threads.phase_thread import PhaseThread
@@ -72,9 +73,8 @@ def validate_ocr_language(lang: str) -> bool:
     return True
 
 
-def main():
-    """Main entry point"""
-    
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Command-line options (also used by the replay benchmark for defaults)"""
     ap = argparse.ArgumentParser(description="Tracer combiné LCU + OCR (ChampSelect) — ROI lock + burst OCR + locks/timer fixes")
     
     # OCR arguments
@@ -83,6 +83,9 @@ def main():
     ap.add_argument("--min-conf", type=float, default=0.5)
     ap.add_argument("--lang", type=str, default="auto", help="OCR lang (tesseract): 'auto', 'fra+eng', 'kor', 'chi_sim', 'ell', etc.")
     ap.add_argument("--tesseract-exe", type=str, default=None)
+    ap.add_argument("--constrained-ocr", action="store_true", default=True, help="Restrict OCR to the locked champion's skin names (user words + char whitelist)")
+    ap.add_argument("--no-constrained-ocr", action="store_false", dest="constrained_ocr", help="Disable constrained OCR mode")
+    ap.add_argument("--ocr-workers", type=int, default=1, help="Tesseract engines in the OCR pool; >1 also reads alternate preprocessings in parallel and votes")
     
     # Capture arguments
     ap.add_argument("--capture", choices=["window", "screen"], default="window")
@@ -91,19 +94,28 @@ def main():
     
     # Database arguments
     ap.add_argument("--dd-lang", type=str, default="en_US", help="Langue(s) DDragon: 'fr_FR' | 'fr_FR,en_US,es_ES' | 'all'")
+    ap.add_argument("--dd-prefetch", action="store_true", default=False, help="Download the active language's champion files in the background at startup (indexes are still built on first use)")
+    ap.add_argument("--no-dd-prefetch", action="store_false", dest="dd_prefetch", help="Fetch champion data lazily on first lock (default)")
+    ap.add_argument("--dd-workers", type=int, default=8, help="Parallel DataDragon downloads during prefetch")
     
     # General arguments
     ap.add_argument("--verbose", action="store_true")
     ap.add_argument("--lockfile", type=str, default=None)
+    ap.add_argument("--lcu-pool", type=int, default=8, help="Keep-alive connections to the League Client API")
     
     # OCR performance arguments
     ap.add_argument("--burst-hz", type=float, default=50.0)
     ap.add_argument("--idle-hz", type=float, default=0.0, help="ré-émission périodique (0=off)")
+    ap.add_argument("--alert-hz", type=float, default=15.0, help="Capture rate right after a carousel change")
+    ap.add_argument("--min-hz", type=float, default=1.0, help="Capture rate floor once the carousel has been still")
+    ap.add_argument("--boost-ms", type=int, default=3000, help="Capture at --burst-hz when the loadout timer is within this of --skin-threshold-ms")
     ap.add_argument("--diff-threshold", type=float, default=0.001)
     ap.add_argument("--burst-ms", type=int, default=280)
     ap.add_argument("--min-ocr-interval", type=float, default=0.11)
     ap.add_argument("--second-shot-ms", type=int, default=120)
-    ap.add_argument("--roi-lock-s", type=float, default=1.5)
+    ap.add_argument("--roi-lock-s", type=float, default=1.5, help="Intervalle de vérification du rect fenêtre (s); le ROI n'est recalculé que s'il a changé")
+    ap.add_argument("--ocr-cache-size", type=int, default=64, help="OCR result cache entries keyed on band hash (0=off)")
+    ap.add_argument("--ocr-cache-hamming", type=int, default=24, help="Max Hamming distance (bits out of 1024) for an OCR cache hit")
     
     # Threading arguments
     ap.add_argument("--phase-hz", type=float, default=2.0)
@@ -121,6 +133,8 @@ def main():
     # Multi-language arguments
     ap.add_argument("--multilang", action="store_true", default=True, help="Enable multi-language support")
     ap.add_argument("--no-multilang", action="store_false", dest="multilang", help="Disable multi-language support")
+    ap.add_argument("--multilang-scorer", choices=sorted(SCORERS), default="levenshtein", help="Similarity scorer for multi-language matching")
+    ap.add_argument("--multilang-min-score", type=float, default=0.7, help="Minimum similarity (0-1) for a multi-language match")
     ap.add_argument("--language", type=str, default="auto", help="Manual language selection (e.g., 'fr_FR', 'en_US', 'zh_CN', 'auto' for detection)")
     
     # Skin download arguments
@@ -128,7 +142,14 @@ def main():
     ap.add_argument("--no-download-skins", action="store_false", dest="download_skins", help="Disable automatic skin downloading")
     ap.add_argument("--force-update-skins", action="store_true", help="Force update all skins (re-download existing ones)")
     ap.add_argument("--max-champions", type=int, default=None, help="Limit number of champions to download skins for (for testing)")
+    
+    return ap
+
 
+def main():
+    """Main entry point"""
+    
+    ap = build_arg_parser()
     args = ap.parse_args()
 
     setup_logging(args.verbose)
@@ -154,7 +175,7 @@ def main():
     
     # Initialize components
     # Initialize LCU first
-    lcu = LCU(args.lockfile)
+    lcu = LCU(args.lockfile, pool_size=args.lcu_pool)
     
     # Wait for LCU connection before determining language
     ocr_lang = args.lang
@@ -190,16 +211,19 @@ def main():
         ocr_lang = "eng"
     
     # Initialize OCR with determined language
+    def make_ocr(lang: str):
+        if args.ocr_workers > 1:
+            return OCRPool(args.ocr_workers, lang=lang, psm=args.psm, tesseract_exe=args.tesseract_exe, tessdata_dir=args.tessdata)
+        return OCR(lang=lang, psm=args.psm, tesseract_exe=args.tesseract_exe, tessdata_dir=args.tessdata)
+    
     try:
-        ocr = OCR(lang=ocr_lang, psm=args.psm, tesseract_exe=args.tesseract_exe)
-        ocr.tessdata_dir = args.tessdata
-        log.info(f"OCR: {ocr.backend} (lang: {ocr_lang})")
+        ocr = make_ocr(ocr_lang)
+        log.info(f"OCR: {ocr.backend} (lang: {ocr_lang}, workers: {ocr.workers})")
     except Exception as e:
         log.warning(f"Failed to initialize OCR with language '{ocr_lang}': {e}")
         log.info("Falling back to English OCR")
-        ocr = OCR(lang="eng", psm=args.psm, tesseract_exe=args.tesseract_exe)
-        ocr.tessdata_dir = args.tessdata
-        log.info(f"OCR: {ocr.backend} (lang: eng)")
+        ocr = make_ocr("eng")
+        log.info(f"OCR: {ocr.backend} (lang: eng, workers: {ocr.workers})")
     
     db = NameDB(lang=args.dd_lang)
     state = SharedState()
@@ -209,16 +233,40 @@ def main():
         auto_detect = args.language.lower() == "auto"
         if auto_detect:
             # For auto-detect mode, use English as fallback but let LCU determine the primary language
-            multilang_db = MultiLanguageDB(auto_detect=True, fallback_lang="en_US", lcu_client=lcu)
+            multilang_db = MultiLanguageDB(auto_detect=True, fallback_lang="en_US", lcu_client=lcu,
+                                           scorer=args.multilang_scorer, min_similarity=args.multilang_min_score)
             log.info("Multi-language auto-detection enabled")
         else:
             # For manual mode, use the specified language
-            multilang_db = MultiLanguageDB(auto_detect=False, fallback_lang=args.language, lcu_client=lcu)
+            multilang_db = MultiLanguageDB(auto_detect=False, fallback_lang=args.language, lcu_client=lcu,
+                                           scorer=args.multilang_scorer, min_similarity=args.multilang_min_score)
             log.info(f"Multi-language mode: manual language '{args.language}'")
     else:
         multilang_db = None
         log.info("Multi-language support disabled")
     
+    # Opt-in: download the active language's champion files in the background so the
+    # first lock doesn't wait on the network (match indexes stay lazy)
+    def prefetch_databases():
+        dbs = [db]
+        if multilang_db:
+            active = multilang_db.databases.get(multilang_db.current_language)
+            if active is not None and active is not db:
+                dbs.append(active)
+        for d in dbs:
+            def report(done: int, total: int, langs=",".join(d.langs)):
+                if done == total or done % max(1, total // 10) == 0:
+                    log.info(f"[dd] prefetch {langs}: {done}/{total}")
+            t0 = time.time()
+            try:
+                failed = d.prefetch(workers=args.dd_workers, progress=report, warm=False)
+                log.info(f"[dd] {','.join(d.langs)} champion files cached in {time.time() - t0:.1f}s" + (f" ({failed} downloads failed)" if failed else ""))
+            except Exception as e:
+                log.debug(f"[dd] prefetch failed for {d.langs}: {e}")
+    
+    if args.dd_prefetch:
+        threading.Thread(target=prefetch_databases, daemon=True, name="dd-prefetch").start()
+    
     # Initialize injection manager
     injection_manager = InjectionManager()
     
@@ -230,6 +278,9 @@ def main():
     # Function to update OCR language dynamically
     def update_ocr_language(new_lcu_lang: str):
         """Update OCR language when LCU language changes"""
+        # Warm the client locale's database before champ select needs it
+        if multilang_db and new_lcu_lang in SUPPORTED_LANGUAGES:
+            multilang_db.preload(new_lcu_lang)
         if args.lang == "auto":
             new_ocr_lang = get_ocr_language(new_lcu_lang, args.lang)
             if new_ocr_lang != ocr.lang:
@@ -242,11 +293,13 @@ def main():
                     if multilang_db and multilang_db.auto_detect:
                         multilang_db.current_language = new_lcu_lang
                         if new_lcu_lang not in multilang_db.databases:
-                            try:
-                                multilang_db.databases[new_lcu_lang] = NameDB(lang=new_lcu_lang)
-                                log.info(f"Loaded multilang database for {new_lcu_lang}")
-                            except Exception as e:
-                                log.debug(f"Failed to load multilang database for {new_lcu_lang}: {e}")
+                            # Load in the background; matching uses the fallback database until it is ready
+                            def on_loaded(fut, lang=new_lcu_lang):
+                                if fut.exception() is not None:
+                                    log.debug(f"Failed to load multilang database for {lang}: {fut.exception()}")
+                                else:
+                                    log.info(f"Loaded multilang database for {lang}")
+                            multilang_db.preload(new_lcu_lang).add_done_callback(on_loaded)
                 except Exception as e:
                     log.warning(f"Failed to update OCR language: {e}")
 
@@ -291,6 +344,9 @@ def main():
         if t_ws: 
             t_ws.join(timeout=1.0)
         t_lcu_monitor.join(timeout=1.0)
+        for path, summary in lcu.latency_report().items():
+            log.debug(f"[lcu-latency] {path}: {summary}")
+        lcu.close()
 
 
 if __name__ == "__main__":
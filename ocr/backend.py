@@ -5,55 +5,284 @@ OCR backend implementation
 """
 
 import os
-from typing import Optional
+import queue
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Iterable, Dict, Tuple, List
 import numpy as np
 import cv2
+from utils.logging import get_logger
+
+log = get_logger()
+
+# Directory for generated per-champion user-words files
+WORDS_DIR = os.path.join(tempfile.gettempdir(), "lcu-ocr-words")
 
 
 class OCR:
     """OCR backend using tesserocr"""
-    
-    def __init__(self, lang: str = "eng", psm: int = 7, tesseract_exe: Optional[str] = None):
+
+    workers = 1
+
+    def __init__(self, lang: str = "eng", psm: int = 7, tesseract_exe: Optional[str] = None, max_constrained: int = 4,
+                 tessdata_dir: Optional[str] = None):
+        self._lock = threading.Lock()
+        self.api = None
         self.lang = lang
         self.psm = int(psm)
         self.backend = None
-        self.api = None
-        
+        if tessdata_dir:
+            self.tessdata_dir = tessdata_dir
+        self.max_constrained = max(1, int(max_constrained))
+        # Constrained mode: (whitelist, user-words file) per vocabulary key, and an LRU of ready engines
+        self._vocab_key: Optional[str] = None
+        self._vocab_names: List[str] = []
+        self._profiles: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        self._engines: "OrderedDict[Tuple[str, str], object]" = OrderedDict()
+        self._failed: set = set()
+
         try:
-            from tesserocr import PyTessBaseAPI, PSM  # pyright: ignore[reportMissingImports]
-            
-            tessdata_dir = getattr(self, "tessdata_dir", None) or os.environ.get("TESSDATA_PREFIX")
-            if tessdata_dir and not tessdata_dir.lower().endswith("tessdata"):
-                cand = os.path.join(tessdata_dir, "tessdata")
-                if os.path.isdir(cand):
-                    tessdata_dir = cand
-            
-            psm_mode = PSM.SINGLE_LINE if self.psm == 7 else PSM.AUTO
-            
-            if tessdata_dir and os.path.isdir(tessdata_dir):
-                self.api = PyTessBaseAPI(path=tessdata_dir, lang=self.lang, psm=psm_mode)
-            else:
-                self.api = PyTessBaseAPI(lang=self.lang, psm=psm_mode)
-            
-            self.api.SetVariable("preserve_interword_spaces", "1")
-            self.api.SetVariable("user_defined_dpi", "240")
+            self.api = self._make_api()
             # Remove character whitelist to allow all Unicode characters
             # This enables recognition of Korean, Chinese, Greek, and other Unicode characters
             self.backend = "tesserocr"
         except ImportError:
             raise ImportError("tesserocr is required for OCR functionality")
 
+    @property
+    def lang(self) -> str:
+        return self._lang
+
+    @lang.setter
+    def lang(self, value: str) -> None:
+        """Switch language; a running engine is re-initialised (Tesseract loads traineddata at Init)"""
+        old = getattr(self, "_lang", None)
+        if value == old:
+            return
+        self._lang = value
+        if self.api is None:
+            return
+        with self._lock:
+            try:
+                api = self._make_api()
+            except Exception:
+                self._lang = old
+                raise
+            self._end(self.api)
+            self.api = api
+            # Constrained engines are per language; they are rebuilt on demand
+            self._end_constrained()
+            vocab_key, vocab_names = self._vocab_key, self._vocab_names
+        if vocab_key is not None:
+            self.set_vocabulary(vocab_key, vocab_names)
+
+    @staticmethod
+    def _end(api) -> None:
+        try:
+            api.End()
+        except Exception:
+            pass
+
+    def _end_constrained(self) -> None:
+        while self._engines:
+            _, api = self._engines.popitem(last=False)
+            self._end(api)
+
+    def close(self) -> None:
+        """Release the unconstrained and every cached constrained engine"""
+        with self._lock:
+            self._end_constrained()
+            if self.api is not None:
+                self._end(self.api)
+                self.api = None
+            self.backend = None
+
+    def _make_api(self, variables: Optional[Dict[str, str]] = None):
+        """Create a PyTessBaseAPI with the shared lang/psm/tessdata configuration"""
+        from tesserocr import PyTessBaseAPI, PSM  # pyright: ignore[reportMissingImports]
+
+        tessdata_dir = getattr(self, "tessdata_dir", None) or os.environ.get("TESSDATA_PREFIX")
+        if tessdata_dir and not tessdata_dir.lower().endswith("tessdata"):
+            cand = os.path.join(tessdata_dir, "tessdata")
+            if os.path.isdir(cand):
+                tessdata_dir = cand
+
+        psm_mode = PSM.SINGLE_LINE if self.psm == 7 else PSM.AUTO
+
+        if tessdata_dir and os.path.isdir(tessdata_dir):
+            api = PyTessBaseAPI(path=tessdata_dir, lang=self.lang, psm=psm_mode, variables=variables or {})
+        else:
+            api = PyTessBaseAPI(lang=self.lang, psm=psm_mode, variables=variables or {})
+
+        api.SetVariable("preserve_interword_spaces", "1")
+        api.SetVariable("user_defined_dpi", "240")
+        return api
+
+    def set_vocabulary(self, key: str, names: Iterable[str]) -> None:
+        """Constrain recognition to a known vocabulary (e.g. the locked champion's skin names)"""
+        names = [n for n in names if n]
+        with self._lock:
+            self._vocab_key = str(key)
+            self._vocab_names = names
+            pkey = (self.lang, self._vocab_key)
+            if pkey in self._profiles:
+                return
+
+            words = sorted({w for n in names for w in n.split()})
+            chars = sorted({c for n in names for c in n if not c.isspace()})
+            if not words:
+                self._vocab_key = None
+                return
+
+            try:
+                os.makedirs(WORDS_DIR, exist_ok=True)
+                safe = "".join(c if c.isalnum() else "_" for c in f"{self.lang}_{self._vocab_key}")
+                path = os.path.join(WORDS_DIR, f"{safe}.user-words")
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write("\n".join(words) + "\n")
+            except Exception as e:
+                log.debug(f"[ocr] user-words write failed for {pkey}: {e}")
+                path = ""
+            self._profiles[pkey] = ("".join(chars), path)
+
+    def clear_vocabulary(self) -> None:
+        """Back to unconstrained recognition"""
+        with self._lock:
+            self._vocab_key = None
+
+    def _active_api(self):
+        """Engine for the current vocabulary (cached), or the unconstrained engine"""
+        if self._vocab_key is None:
+            return self.api
+
+        pkey = (self.lang, self._vocab_key)
+        api = self._engines.get(pkey)
+        if api is not None:
+            self._engines.move_to_end(pkey)
+            return api
+
+        profile = self._profiles.get(pkey)
+        if profile is None or pkey in self._failed:
+            return self.api
+
+        whitelist, words_file = profile
+        variables = {"load_system_dawg": "0", "load_freq_dawg": "0"}
+        if words_file:
+            variables["user_words_file"] = words_file
+        try:
+            api = self._make_api(variables)
+            if whitelist:
+                api.SetVariable("tessedit_char_whitelist", whitelist)
+        except Exception as e:
+            log.debug(f"[ocr] constrained engine init failed for {pkey}: {e}")
+            self._failed.add(pkey)
+            return self.api
+
+        self._engines[pkey] = api
+        while len(self._engines) > self.max_constrained:
+            _, old = self._engines.popitem(last=False)
+            self._end(old)
+        log.debug(f"[ocr] constrained engine ready for {pkey} ({len(whitelist)} chars)")
+        return api
+
     def recognize(self, img: np.ndarray) -> str:
         """Recognize text in image"""
         if self.backend == "tesserocr":
-            from PIL import Image
-            pil = Image.fromarray(img if img.ndim == 2 else cv2.cvtColor(img, cv2.COLOR_BGR2RGB))
-            self.api.SetImage(pil)
-            txt = self.api.GetUTF8Text() or ""
+            with self._lock:
+                api = self._active_api()
+                if img.ndim == 2 and img.dtype == np.uint8 and img.flags.c_contiguous:
+                    # Grayscale band: raw pixels straight to Tesseract (one copy to bytes, no PIL round trip)
+                    h, w = img.shape
+                    api.SetImageBytes(img.tobytes(), w, h, 1, w)
+                else:
+                    from PIL import Image
+                    api.SetImage(Image.fromarray(img if img.ndim == 2 else cv2.cvtColor(img, cv2.COLOR_BGR2RGB)))
+                txt = api.GetUTF8Text() or ""
         else:
             cfg = f"-l {self.lang} --oem 3 --psm {self.psm} -c preserve_interword_spaces=1"
             txt = self.pytesseract.image_to_string(img, config=cfg)
-        
+
         txt = txt.replace("\n", " ").strip()
         txt = txt.replace("'", "'").replace("`", "'")
         return " ".join(txt.split())
+
+
+class OCRPool:
+    """N independent OCR engines (one PyTessBaseAPI each); tesserocr releases the GIL so reads run in parallel"""
+
+    def __init__(self, workers: int = 2, lang: str = "eng", psm: int = 7, tesseract_exe: Optional[str] = None,
+                 tessdata_dir: Optional[str] = None, max_constrained: int = 2):
+        self.workers = max(1, int(workers))
+        self.engines: List[OCR] = [
+            OCR(lang=lang, psm=psm, tesseract_exe=tesseract_exe, max_constrained=max_constrained, tessdata_dir=tessdata_dir)
+            for _ in range(self.workers)
+        ]
+        self._free: "queue.Queue[OCR]" = queue.Queue()
+        for e in self.engines:
+            self._free.put(e)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="ocr-pool")
+
+    @property
+    def backend(self) -> Optional[str]:
+        return self.engines[0].backend
+
+    @property
+    def lang(self) -> str:
+        return self.engines[0].lang
+
+    @lang.setter
+    def lang(self, value: str) -> None:
+        """Re-initialise every engine (waits until all of them are idle)"""
+        idle = [self._free.get() for _ in self.engines]
+        try:
+            for e in idle:
+                e.lang = value
+        finally:
+            for e in idle:
+                self._free.put(e)
+
+    @property
+    def psm(self) -> int:
+        return self.engines[0].psm
+
+    def set_vocabulary(self, key: str, names: Iterable[str]) -> None:
+        """Constrain every engine to the same vocabulary"""
+        names = list(names)
+        for e in self.engines:
+            e.set_vocabulary(key, names)
+
+    def clear_vocabulary(self) -> None:
+        for e in self.engines:
+            e.clear_vocabulary()
+
+    def recognize(self, img: np.ndarray) -> str:
+        """Recognize on the first idle engine"""
+        engine = self._free.get()
+        try:
+            return engine.recognize(img)
+        finally:
+            self._free.put(engine)
+
+    def submit(self, img: np.ndarray) -> Future:
+        """Queue a read on the pool"""
+        return self._executor.submit(self.recognize, img)
+
+    def recognize_many(self, imgs: List[np.ndarray]) -> List[str]:
+        """Read several images concurrently (e.g. alternate preprocessings of one band)"""
+        futures = [self.submit(img) for img in imgs]
+        out = []
+        for f in futures:
+            try:
+                out.append(f.result())
+            except Exception as e:
+                log.debug(f"[ocr] pool read failed: {e}")
+                out.append("")
+        return out
+
+    def close(self) -> None:
+        """Stop workers and release engines"""
+        self._executor.shutdown(wait=False)
+        for e in self.engines:
+            e.close()
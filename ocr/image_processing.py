@@ -4,9 +4,11 @@
 Image processing utilities for OCR
 """
 
+import threading
 import numpy as np
 import cv2
-from typing import Tuple
+from collections import deque
+from typing import Optional, Tuple
 
 
 def band_candidates(h: int, centre_pct: Tuple[float, float] = (62.0, 6.5), 
@@ -27,30 +29,58 @@ def score_white_text(bgr_band: np.ndarray) -> float:
 
 
 def choose_band(frame: np.ndarray) -> Tuple[int, int, int, int]:
-    """Choose the best band for text detection"""
+    """Choose the best band for text detection
+
+    The column strip is converted (HSV mask + grayscale) once; each candidate's
+    white-pixel density comes from row prefix sums. Canny still runs per band on
+    the shared grayscale because its output depends on the crop borders, which
+    keeps scores identical to score_white_text on each crop.
+    """
     h, w = frame.shape[:2]
     Lpct, Rpct = 28.0, 72.0
     x1 = int(w * (Lpct / 100.0))
     x2 = int(w * (Rpct / 100.0))
     best = (-1.0, 0, 0)
     
+    bands = []
     for T, B in band_candidates(h, (62.0, 6.5), (52.0, 70.0), steps=9):
         y1 = int(h * (T / 100.0))
         y2 = int(h * (B / 100.0))
         if y2 - y1 < 24: 
             continue
-        sc = score_white_text(frame[y1:y2, x1:x2])
-        if sc > best[0]: 
-            best = (sc, y1, y2)
+        bands.append((y1, y2))
+    
+    if bands:
+        top = min(y1 for y1, _ in bands)
+        bottom = max(y2 for _, y2 in bands)
+        strip = frame[top:bottom, x1:x2]
+        hsv = cv2.cvtColor(strip, cv2.COLOR_BGR2HSV)
+        mask = cv2.inRange(hsv, np.array([0, 0, 200], np.uint8), np.array([179, 70, 255], np.uint8))
+        gray = cv2.cvtColor(strip, cv2.COLOR_BGR2GRAY)
+        # rows[i] = white pixels in strip rows [0, i)
+        rows = np.concatenate(([0], np.cumsum(np.count_nonzero(mask, axis=1), dtype=np.int64)))
+        width = x2 - x1
+        
+        for y1, y2 in bands:
+            n = (y2 - y1) * width
+            white = (rows[y2 - top] - rows[y1 - top]) / n if n else float("nan")
+            e = cv2.Canny(np.ascontiguousarray(gray[y1 - top:y2 - top]), 40, 120)
+            sc = 0.6 * white + 0.4 * (e > 0).mean()
+            if sc > best[0]: 
+                best = (sc, y1, y2)
     
     y1, y2 = (int(h * 0.58), int(h * 0.66)) if best[0] < 0 else (best[1], best[2])
     return x1, y1, x2, y2
 
 
-def prep_for_ocr(bgr: np.ndarray) -> np.ndarray:
+# Alternate (min value, max saturation, scale) settings for voting on a band
+OCR_VARIANTS = [(180, 90, 2.0), (220, 50, 2.0), (200, 70, 3.0)]
+
+
+def prep_for_ocr(bgr: np.ndarray, v_min: int = 200, s_max: int = 70) -> np.ndarray:
     """Preprocess image for OCR"""
     hsv = cv2.cvtColor(bgr, cv2.COLOR_BGR2HSV)
-    mask = cv2.inRange(hsv, np.array([0, 0, 200], np.uint8), np.array([179, 70, 255], np.uint8))
+    mask = cv2.inRange(hsv, np.array([0, 0, v_min], np.uint8), np.array([179, s_max, 255], np.uint8))
     mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, np.ones((3, 3), np.uint8))
     mask = cv2.dilate(mask, np.ones((2, 2), np.uint8), 1)
     inv = 255 - mask
@@ -63,3 +93,102 @@ def preprocess_band_for_ocr(band_bgr: np.ndarray) -> np.ndarray:
     if band_bgr.shape[0] < 120:
         band_bgr = cv2.resize(band_bgr, None, fx=2.0, fy=2.0, interpolation=cv2.INTER_CUBIC)
     return prep_for_ocr(band_bgr)
+
+
+class BandPreprocessor:
+    """preprocess_band_for_ocr for a stream of bands (BGR or BGRA) using reusable scratch buffers
+
+    The returned array is overwritten by the next call unless it is detach()ed; detached
+    buffers come back through release() (from any thread) and are recycled.
+    """
+    
+    def __init__(self, thumb_size: Tuple[int, int] = (96, 20)):
+        self.thumb_size = thumb_size
+        self._key = None
+        self._free: deque = deque()
+        self._free_lock = threading.Lock()
+        self._lo = np.array([0, 0, 200], np.uint8)
+        self._hi = np.array([179, 70, 255], np.uint8)
+        self._k_close = np.ones((3, 3), np.uint8)
+        self._k_dilate = np.ones((2, 2), np.uint8)
+        tw, th = thumb_size
+        self._thumbs = [np.empty((th, tw), np.uint8), np.empty((th, tw), np.uint8)]
+        self._thumb_i = 0
+        self._has_prev = False
+        self._absdiff = np.empty((th, tw), np.uint8)
+    
+    def _alloc(self, h: int, w: int, ch: int, scale: bool) -> None:
+        """(Re)allocate scratch buffers when the band size changes"""
+        oh, ow = (h * 2, w * 2) if scale else (h, w)
+        self._key = (h, w, ch, scale)
+        self._up = np.empty((oh, ow, ch), np.uint8) if scale else None
+        self._hsv = np.empty((oh, ow, 3), np.uint8)
+        self._mask = np.empty((oh, ow), np.uint8)
+        self._tmp = np.empty((oh, ow), np.uint8)
+        with self._free_lock:
+            self._out_shape = (oh, ow)
+            self._free.clear()
+        self.out = self._new_out()
+        self._has_prev = False
+    
+    def _new_out(self) -> np.ndarray:
+        oh, ow = self._out_shape
+        return np.empty((oh, ow), np.uint8)
+    
+    def process(self, band: np.ndarray) -> np.ndarray:
+        """Binarized band (black text on white), same pixels as preprocess_band_for_ocr"""
+        h, w = band.shape[:2]
+        ch = band.shape[2] if band.ndim == 3 else 1
+        scale = h < 120
+        if self._key != (h, w, ch, scale):
+            self._alloc(h, w, ch, scale)
+        src = band
+        if scale:
+            src = cv2.resize(band, (w * 2, h * 2), dst=self._up, interpolation=cv2.INTER_CUBIC)
+        cv2.cvtColor(src, cv2.COLOR_BGR2HSV, dst=self._hsv)
+        cv2.inRange(self._hsv, self._lo, self._hi, dst=self._mask)
+        cv2.morphologyEx(self._mask, cv2.MORPH_CLOSE, self._k_close, dst=self._tmp)
+        cv2.dilate(self._tmp, self._k_dilate, dst=self._mask, iterations=1)
+        cv2.bitwise_not(self._mask, dst=self._tmp)
+        cv2.medianBlur(self._tmp, 3, dst=self.out)
+        return self.out
+    
+    def thumb_diff(self) -> Optional[float]:
+        """Mean absolute difference (0..1) between this output's thumbnail and the previous one"""
+        self._thumb_i ^= 1
+        cur, prev = self._thumbs[self._thumb_i], self._thumbs[self._thumb_i ^ 1]
+        cv2.resize(self.out, self.thumb_size, dst=cur, interpolation=cv2.INTER_AREA)
+        if not self._has_prev:
+            self._has_prev = True
+            return None
+        cv2.absdiff(cur, prev, dst=self._absdiff)
+        return cv2.sumElems(self._absdiff)[0] / self._absdiff.size / 255.0
+    
+    def reset(self) -> None:
+        """Forget the previous thumbnail (next thumb_diff reports a change)"""
+        self._has_prev = False
+    
+    def detach(self) -> np.ndarray:
+        """Hand the current output to a consumer; a recycled or new buffer takes its place"""
+        out = self.out
+        with self._free_lock:
+            buf = self._free.pop() if self._free else None
+        self.out = buf if buf is not None else self._new_out()
+        return out
+    
+    def release(self, buf: np.ndarray) -> None:
+        """Return a detached buffer once the consumer is done with it"""
+        with self._free_lock:
+            if self._key is not None and buf.shape == self._out_shape and len(self._free) < 4:
+                self._free.append(buf)
+
+
+def preprocess_band_variants(band_bgr: np.ndarray, count: int) -> list:
+    """Alternate preprocessings (thresholds / scale) of a band, for multi-engine voting"""
+    out = []
+    for v_min, s_max, scale in OCR_VARIANTS[:max(0, count)]:
+        src = band_bgr
+        if band_bgr.shape[0] < 120:
+            src = cv2.resize(band_bgr, None, fx=scale, fy=scale, interpolation=cv2.INTER_CUBIC)
+        out.append(prep_for_ocr(src, v_min, s_max))
+    return out
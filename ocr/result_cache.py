@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Perceptual-hash cache for OCR results
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional, Hashable
+import numpy as np
+import cv2
+
+
+def band_hash(img: np.ndarray, width: int = 64, height: int = 16) -> int:
+    """Difference hash (width x height bits) of the text inside a binarized band
+
+    The band is cropped to its dark-ink bounding box first so the hash resolution
+    is spent on the glyphs rather than on the empty margins around the name.
+    """
+    if img.ndim == 3:
+        img = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    ys, xs = np.nonzero(img < 128)
+    if xs.size:
+        img = img[ys.min():ys.max() + 1, xs.min():xs.max() + 1]
+    small = cv2.resize(img, (width + 1, height), interpolation=cv2.INTER_AREA)
+    bits = small[:, 1:] > small[:, :-1]
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+@dataclass
+class CachedResult:
+    """OCR text and the match it produced"""
+    text: str
+    match: Any = None
+
+
+class OCRResultCache:
+    """Bounded LRU keyed on a band hash, with Hamming-distance tolerant lookup"""
+
+    def __init__(self, size: int = 64, max_distance: int = 24):
+        self.size = max(0, int(size))
+        self.max_distance = max(0, int(max_distance))
+        self._items: "OrderedDict[int, CachedResult]" = OrderedDict()
+        self._context: Optional[Hashable] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.size > 0
+
+    def set_context(self, context: Hashable) -> None:
+        """Drop every entry when the context (OCR language, champion...) changes"""
+        if context != self._context:
+            if self._items:
+                self.invalidate()
+            self._context = context
+
+    def invalidate(self) -> None:
+        """Clear all cached results"""
+        self._items.clear()
+        self.invalidations += 1
+
+    def get(self, h: int) -> Optional[CachedResult]:
+        """Exact hash first, then nearest hash within max_distance"""
+        if not self.enabled:
+            return None
+        res = self._items.get(h)
+        if res is None and self.max_distance > 0:
+            best_d = self.max_distance + 1
+            best_h = None
+            for k in self._items:
+                d = (k ^ h).bit_count()
+                if d < best_d:
+                    best_d, best_h = d, k
+            if best_h is not None:
+                h = best_h
+                res = self._items[h]
+        if res is None:
+            self.misses += 1
+            return None
+        self._items.move_to_end(h)
+        self.hits += 1
+        return res
+
+    def put(self, h: int, text: str, match: Any = None) -> None:
+        """Store a result, evicting the least recently used one when full"""
+        if not self.enabled:
+            return
+        self._items[h] = CachedResult(text, match)
+        self._items.move_to_end(h)
+        while len(self._items) > self.size:
+            self._items.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        """Hit/miss counters"""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._items),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / total) if total else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
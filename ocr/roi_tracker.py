@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ROI tracker: keep the skin-name band until a cheap signal invalidates it
+"""
+
+from typing import Callable, Hashable, Optional, Tuple
+import numpy as np
+from ocr.image_processing import score_white_text
+from utils.logging import get_logger
+
+log = get_logger()
+
+Rect = Tuple[int, int, int, int]
+
+
+class ROITracker:
+    """Event-driven band ROI: rescan only on window move/resize, score drop or context change"""
+
+    def __init__(self, rect_check_s: float = 1.5, score_check_s: float = 0.25,
+                 score_drop: float = 0.5, drop_checks: int = 3):
+        self.rect_check_s = max(0.05, float(rect_check_s))
+        self.score_check_s = max(0.0, float(score_check_s))
+        self.score_drop = float(score_drop)
+        self.drop_checks = max(1, int(drop_checks))
+        self.roi_abs: Optional[Rect] = None
+        self.window_rect: Optional[Rect] = None
+        self.context: Optional[Hashable] = None
+        # Window rect fetched by the last needs_scan() call (None if it did not poll)
+        self.polled_rect: Optional[Rect] = None
+        self.baseline: Optional[float] = None
+        self.next_rect_check = 0.0
+        self.next_score_check = 0.0
+        self.low_checks = 0
+        self.scans = 0
+        self.invalidations = 0
+
+    def set(self, roi_abs: Rect, window_rect: Optional[Rect], now: float) -> None:
+        """Adopt a freshly scanned ROI"""
+        self.roi_abs = roi_abs
+        self.window_rect = window_rect
+        self.baseline = None
+        self.low_checks = 0
+        self.next_rect_check = now + self.rect_check_s
+        self.next_score_check = now
+        self.scans += 1
+
+    def invalidate(self, reason: str) -> None:
+        """Force a full scan on next frame"""
+        if self.roi_abs is not None:
+            log.debug(f"[ocr:roi] invalidated ({reason})")
+            self.invalidations += 1
+        self.roi_abs = None
+        self.baseline = None
+        self.low_checks = 0
+
+    def needs_scan(self, now: float, context: Hashable, rect_fn: Optional[Callable[[], Optional[Rect]]] = None) -> bool:
+        """True when the ROI is missing, the context (e.g. locked champion) changed or the window moved"""
+        self.polled_rect = None
+        if context != self.context:
+            self.context = context
+            self.invalidate(f"context {context}")
+        if self.roi_abs is None:
+            return True
+        if rect_fn is not None and now >= self.next_rect_check:
+            self.next_rect_check = now + self.rect_check_s
+            rect = self.polled_rect = rect_fn()
+            if rect != self.window_rect:
+                self.invalidate(f"window {self.window_rect} -> {rect}")
+                return True
+        return False
+
+    def observe_band(self, now: float, band_bgr: np.ndarray) -> None:
+        """Track the band's white-text score; a sustained drop means the text left the ROI"""
+        if self.roi_abs is None or now < self.next_score_check:
+            return
+        self.next_score_check = now + self.score_check_s
+        try:
+            sc = score_white_text(band_bgr)
+        except Exception:
+            return
+        if self.baseline is None:
+            self.baseline = sc
+            return
+        if sc < self.baseline * self.score_drop:
+            self.low_checks += 1
+            if self.low_checks >= self.drop_checks:
+                self.invalidate(f"score {sc:.3f} < {self.score_drop:.2f} x {self.baseline:.3f}")
+        else:
+            self.low_checks = 0
+            # Slow follow so gradual client-side changes don't trip the drop test
+            self.baseline = 0.9 * self.baseline + 0.1 * sc
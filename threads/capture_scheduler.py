@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Adaptive capture rate for the OCR thread
+"""
+
+import time
+from state.shared_state import SharedState
+
+
+class CaptureScheduler:
+    """Capture interval from carousel activity, loadout time left and OCR latency
+
+    - burst_hz while a change is being followed (motion window)
+    - alert_hz for alert_s after the last change (user is browsing skins)
+    - then decays linearly to min_hz over decay_s of stillness
+    - burst_hz again when the loadout timer is within boost_ms of the skin-write threshold
+    """
+
+    def __init__(self, burst_hz: float = 50.0, alert_hz: float = 15.0, min_hz: float = 1.0,
+                 alert_s: float = 2.0, decay_s: float = 8.0, boost_ms: int = 3000):
+        self.burst_hz = max(1.0, float(burst_hz))
+        self.alert_hz = max(0.1, min(float(alert_hz), self.burst_hz))
+        self.min_hz = max(0.1, min(float(min_hz), self.alert_hz))
+        self.alert_s = max(0.0, float(alert_s))
+        self.decay_s = max(0.001, float(decay_s))
+        self.boost_ms = max(0, int(boost_ms))
+        self.last_change_t = 0.0
+        self.ocr_latency_s = 0.0
+        # Counters
+        self.frames_captured = 0
+        self.frames_skipped = 0.0
+        self.ocr_calls = 0
+        self.ocr_calls_saved = 0
+
+    def reset(self) -> None:
+        """New champ select / lock: start alert so the first hover is caught quickly"""
+        self.last_change_t = time.time()
+
+    def note_frame(self, interval_s: float) -> None:
+        """One capture done; count the burst-rate frames the chosen interval skips"""
+        self.frames_captured += 1
+        self.frames_skipped += max(0.0, interval_s * self.burst_hz - 1.0)
+
+    def note_result(self, now: float, changed: bool, submitted: bool) -> None:
+        """Preprocess stage outcome for one frame"""
+        if changed:
+            self.last_change_t = now
+        if submitted:
+            self.ocr_calls += 1
+        else:
+            self.ocr_calls_saved += 1
+
+    def note_ocr(self, latency_s: float) -> None:
+        """Measured OCR call time (EWMA)"""
+        self.ocr_latency_s = latency_s if self.ocr_latency_s <= 0 else 0.8 * self.ocr_latency_s + 0.2 * latency_s
+
+    def _near_write_threshold(self, state: SharedState) -> bool:
+        if not state.loadout_countdown_active or state.last_hover_written:
+            return False
+        remain_ms = state.loadout_left0_ms - (time.monotonic() - state.loadout_t0) * 1000.0
+        thresh = int(getattr(state, "skin_write_ms", 2000) or 2000)
+        return remain_ms - thresh <= self.boost_ms
+
+    def next_interval(self, now: float, motion_until: float, state: SharedState) -> float:
+        """Seconds to wait before the next capture"""
+        if now < motion_until or self._near_write_threshold(state):
+            return 1.0 / self.burst_hz
+
+        hz = self.alert_hz
+        # Sampling a still band faster than ~2 frames per OCR call only feeds the diff stage
+        if self.ocr_latency_s > 0:
+            hz = min(hz, max(self.min_hz, 2.0 / self.ocr_latency_s))
+        still = now - self.last_change_t - self.alert_s
+        if still > 0:
+            k = min(1.0, still / self.decay_s)
+            hz = hz + (self.min_hz - hz) * k
+        return 1.0 / max(self.min_hz, hz)
+
+    def stats(self) -> dict:
+        """Counters since start"""
+        return {
+            "captured": self.frames_captured,
+            "skipped": int(self.frames_skipped),
+            "ocr_calls": self.ocr_calls,
+            "ocr_saved": self.ocr_calls_saved,
+            "ocr_ms": round(self.ocr_latency_s * 1000.0, 1),
+        }
@@ -7,6 +7,7 @@ Champion monitoring thread
 import time
 import threading
 from lcu.client import LCU
+from lcu.session_store import SESSION_MAX_AGE_S
 from database.name_db import NameDB
 from state.shared_state import SharedState
 from utils.logging import get_logger
@@ -48,7 +49,7 @@ class ChampThread(threading.Thread):
                 self.last_hover = cid
             
             # Personal lock (useful log even without WS)
-            sess = self.lcu.session() or {}
+            sess = self.lcu.session(max_age_s=SESSION_MAX_AGE_S) or {}
             try:
                 my_cell = sess.get("localPlayerCellId")
                 actions = sess.get("actions") or []
@@ -4,7 +4,6 @@
 LCU connection monitoring thread for language detection
 """
 
-import time
 import threading
 from typing import Optional, Callable
 from lcu.client import LCU
@@ -27,6 +26,13 @@ class LCUMonitorThread(threading.Thread):
         self.last_language = None
         self.waiting_for_connection = False
         self.ws_connected = False
+        # Lockfile connect/disconnect events wake the loop early
+        self._wake = threading.Event()
+        self.lcu.watcher.add_listener(self._on_lockfile_event)
+
+    def _on_lockfile_event(self, event: str, path: Optional[str]):
+        log.debug(f"[lockfile] {event}")
+        self._wake.set()
 
     def run(self):
         """Main monitoring loop"""
@@ -80,7 +86,8 @@ class LCUMonitorThread(threading.Thread):
             except Exception as e:
                 log.debug(f"LCU monitor error: {e}")
             
-            time.sleep(1.0)
+            self._wake.wait(1.0)
+            self._wake.clear()
     
     def _is_ws_connected(self) -> bool:
         """Check if WebSocket is connected"""
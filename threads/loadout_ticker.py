@@ -9,6 +9,7 @@ import time
 import threading
 from typing import Optional
 from lcu.client import LCU
+from lcu.session_store import SESSION_MAX_AGE_S
 from state.shared_state import SharedState
 from database.name_db import NameDB
 from utils.logging import get_logger
@@ -55,12 +56,13 @@ class LoadoutTicker(threading.Thread):
             # Periodic LCU resync
             if (now - last_poll) >= poll_period_s:
                 last_poll = now
-                sess = self.lcu.session() or {}
-                t = (sess.get("timer") or {})
+                sess, received_at = self.lcu.session_snapshot(max_age_s=SESSION_MAX_AGE_S)
+                t = ((sess or {}).get("timer") or {})
                 phase = str((t.get("phase") or "")).upper()
                 left_ms = int(t.get("adjustedTimeLeftInPhase") or 0)
                 if phase == "FINALIZATION" and left_ms > 0:
-                    cand_deadline = time.monotonic() + (left_ms / 1000.0)
+                    # Time left is as of when the snapshot was received, not now
+                    cand_deadline = received_at + (left_ms / 1000.0)
                     if cand_deadline < deadline:
                         deadline = cand_deadline
             
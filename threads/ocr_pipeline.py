@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Building blocks for the staged OCR pipeline (capture -> preprocess -> OCR)
+"""
+
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+import numpy as np
+
+
+@dataclass
+class Frame:
+    """Captured band (BGRA view over the mss buffer), tagged with the tracking epoch it belongs to"""
+    band: np.ndarray
+    t: float
+    epoch: int
+
+
+@dataclass
+class OCRJob:
+    """Preprocessed band queued for recognition (raw band kept for alternate preprocessings)"""
+    band_bin: np.ndarray
+    t: float
+    epoch: int
+    band: Optional[np.ndarray] = None
+    # False for second-shot / burst re-reads, which exist to correct the first read
+    use_cache: bool = True
+
+
+class LatestQueue:
+    """Bounded hand-off queue: when full, put() drops the oldest item (latest frame wins)
+
+    on_drop is called (outside the queue lock) with every item put() replaces or clear()
+    discards, so items owning pooled buffers can hand them back.
+    """
+
+    def __init__(self, maxsize: int = 1, on_drop: Optional[Callable[[Any], None]] = None):
+        self.maxsize = max(1, int(maxsize))
+        self.on_drop = on_drop
+        self._items: deque = deque()
+        self._cond = threading.Condition()
+        self.puts = 0
+        self.dropped = 0
+
+    def put(self, item: Any) -> None:
+        """Enqueue without ever blocking the producer"""
+        dropped = []
+        with self._cond:
+            while len(self._items) >= self.maxsize:
+                dropped.append(self._items.popleft())
+                self.dropped += 1
+            self._items.append(item)
+            self.puts += 1
+            self._cond.notify()
+        self._drop(dropped)
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Any]:
+        """Oldest pending item, or None after timeout"""
+        with self._cond:
+            if not self._items:
+                self._cond.wait(timeout)
+            return self._items.popleft() if self._items else None
+
+    def clear(self) -> None:
+        """Drop pending items"""
+        with self._cond:
+            dropped = list(self._items)
+            self._items.clear()
+        self._drop(dropped)
+
+    def _drop(self, items: list) -> None:
+        if self.on_drop is not None:
+            for item in items:
+                self.on_drop(item)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class StageStats:
+    """Per-stage timing (count / mean / max), reset on each report"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+
+    def add(self, dt: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.total_s += dt
+            if dt > self.max_s:
+                self.max_s = dt
+
+    def report(self, window_s: float) -> str:
+        """One-line summary for the last window, then reset"""
+        with self._lock:
+            n, total, mx = self.count, self.total_s, self.max_s
+            self.count, self.total_s, self.max_s = 0, 0.0, 0.0
+        rate = n / window_s if window_s > 0 else 0.0
+        mean_ms = (total / n * 1000.0) if n else 0.0
+        return f"{self.name} {rate:.1f}/s avg={mean_ms:.1f}ms max={mx * 1000.0:.1f}ms"
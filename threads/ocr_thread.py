@@ -8,12 +8,16 @@ import os
 import re
 import time
 import threading
-from typing import Optional, Tuple
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
 import numpy as np
-import cv2
 from ocr.backend import OCR
-from ocr.image_processing import choose_band, preprocess_band_for_ocr
-from database.name_db import NameDB
+from ocr.image_processing import choose_band, preprocess_band_variants, BandPreprocessor
+from ocr.result_cache import OCRResultCache, band_hash
+from ocr.roi_tracker import ROITracker
+from threads.ocr_pipeline import Frame, OCRJob, LatestQueue, StageStats
+from threads.capture_scheduler import CaptureScheduler
+from database.name_db import NameDB, Entry
 from database.multilang_db import MultiLanguageDB
 from state.shared_state import SharedState
 from lcu.client import LCU
@@ -24,11 +28,35 @@ from utils.window_capture import find_league_window_rect
 log = get_logger()
 
 
+@dataclass
+class HoverMatch:
+    """Matched entry with the label to publish and a log detail"""
+    entry: Entry
+    label: str
+    detail: str
+
+
+@dataclass
+class OCRRead:
+    """Outcome of one OCR read (timestamps filled in by the OCR stage)"""
+    text: str
+    match: Optional[HoverMatch]
+    cached: bool
+    t_capture: float = 0.0
+    t_done: float = 0.0
+    ocr_s: float = 0.0
+
+
 class OCRSkinThread(threading.Thread):
-    """OCR thread: locked ROI + burst"""
+    """OCR thread: locked ROI + burst, split into capture / preprocess / OCR stages"""
     
-    def __init__(self, state: SharedState, db: NameDB, ocr: OCR, args, lcu: Optional[LCU] = None, multilang_db: Optional[MultiLanguageDB] = None):
+    def __init__(self, state: SharedState, db: NameDB, ocr: OCR, args, lcu: Optional[LCU] = None, multilang_db: Optional[MultiLanguageDB] = None,
+                 capture_factory: Optional[Callable] = None, on_read: Optional[Callable[[OCRRead], None]] = None):
         super().__init__(daemon=True)
+        # capture_factory: mss-compatible context manager (defaults to mss.mss; replay uses ReplayCapture)
+        # on_read: observer called after every OCR read (benchmarks)
+        self.capture_factory = capture_factory
+        self.on_read = on_read
         self.state = state
         self.db = db
         self.multilang_db = multilang_db
@@ -40,221 +68,370 @@ class OCRSkinThread(threading.Thread):
         self.burst_ms = args.burst_ms
         self.min_ocr_interval = args.min_ocr_interval
         self.second_shot_ms = args.second_shot_ms
-        self.last_small = None
         self.last_key = None
         self.motion_until = 0.0
-        self.last_ocr_t = 0.0
         self.next_emit = time.time()
         self.emit_dt = (1.0 / max(1.0, args.idle_hz)) if args.idle_hz > 0 else None
-        self.roi_abs = None
-        self.roi_lock_until = 0.0
-        self.roi_lock_s = args.roi_lock_s
-        self.second_shot_at = 0.0
+        self.roi = ROITracker(rect_check_s=args.roi_lock_s)
+        self.constrained_ocr = getattr(args, "constrained_ocr", True)
+        self.vocab_key = None
+        self.ocr_cache = OCRResultCache(getattr(args, "ocr_cache_size", 64), getattr(args, "ocr_cache_hamming", 24))
+        # Pipeline: capture (this thread) -> preprocess/diff -> OCR, latest-frame-wins hand-offs
+        self.epoch = 0
+        # Serializes epoch bumps against publishing, so a read from an old epoch can't land after a reset
+        self.publish_lock = threading.Lock()
+        self.scheduler = CaptureScheduler(
+            burst_hz=max(10.0, args.burst_hz),
+            alert_hz=getattr(args, "alert_hz", 15.0),
+            min_hz=getattr(args, "min_hz", 1.0),
+            boost_ms=getattr(args, "boost_ms", 3000),
+        )
+        self.prep = BandPreprocessor()
+        self.frames = LatestQueue(1)
+        # Replaced or cleared jobs hand their preprocessed buffer back to the pool
+        self.ocr_jobs = LatestQueue(1, on_drop=lambda job: self.prep.release(job.band_bin))
+        self.stages_stop = threading.Event()
+        self.stats_capture = StageStats("capture")
+        self.stats_preprocess = StageStats("preprocess")
+        self.stats_ocr = StageStats("ocr")
+        self.stats_latency = StageStats("frame->match")
+        self.stats_every_s = 10.0
+        self.next_stats_report = time.time() + self.stats_every_s
+
+    def _source_rect(self, monitor) -> Optional[Tuple[int, int, int, int]]:
+        """Current capture source rectangle (League window or monitor)"""
+        if self.args.capture == "window" and os.name == "nt":
+            return find_league_window_rect(self.args.window_hint)
+        return (monitor["left"], monitor["top"], monitor["left"] + monitor["width"], monitor["top"] + monitor["height"])
 
-    def _calc_band_roi_abs(self, sct, monitor) -> Optional[Tuple[int, int, int, int]]:
-        """Calculate band ROI in absolute coordinates"""
+    def _calc_band_roi_abs(self, sct, monitor, rect: Optional[Tuple[int, int, int, int]]) -> Optional[Tuple[int, int, int, int]]:
+        """Calculate band ROI in absolute coordinates (full-window grab + choose_band)"""
         try:
-            import mss  # pyright: ignore[reportMissingImports]
             if self.args.capture == "window" and os.name == "nt":
-                rect = find_league_window_rect(self.args.window_hint)
                 if not rect: 
                     log.debug("[ocr] League window not found, falling back to monitor capture")
                     return None
                 l, t, r, b = rect
                 log.debug(f"[ocr] League window found: {l},{t},{r},{b} (size: {r-l}x{b-t})")
                 mon = {"left": l, "top": t, "width": r - l, "height": b - t}
-                full = np.array(sct.grab(mon), dtype=np.uint8)[:, :, :3]
+                full = self._bgra(sct.grab(mon))
                 x1, y1, x2, y2 = choose_band(full)
                 roi_abs = (l + x1, t + y1, l + x2, t + y2)
                 log.debug(f"[ocr] ROI calculated: {roi_abs}")
                 return roi_abs
             else:
                 log.debug(f"[ocr] Using monitor capture (mode: {self.args.capture})")
-                shot = sct.grab(monitor)
-                full = np.array(shot, dtype=np.uint8)[:, :, :3]
+                full = self._bgra(sct.grab(monitor))
                 x1, y1, x2, y2 = choose_band(full)
                 return (monitor["left"] + x1, monitor["top"] + y1, monitor["left"] + x2, monitor["top"] + y2)
         except Exception as e:
             log.debug(f"[ocr] Error calculating ROI: {e}")
             return None
 
+    @staticmethod
+    def _bgra(shot) -> np.ndarray:
+        """Zero-copy BGRA view over an mss screenshot buffer"""
+        return np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+
+    def _reset_tracking(self):
+        """Forget motion/OCR history; downstream stages see the new epoch and drop stale work"""
+        with self.publish_lock:
+            self.epoch += 1
+            self.last_key = None
+        self.frames.clear()
+        self.ocr_jobs.clear()
+
     def run(self):
-        """Main OCR loop"""
-        import mss  # pyright: ignore[reportMissingImports]
+        """Capture stage: grabs the band at burst/idle rate and feeds the preprocessing stage"""
+        if self.capture_factory is None:
+            import mss  # pyright: ignore[reportMissingImports]
+            self.capture_factory = mss.mss
         log.info("[ocr] thread prêt (actif uniquement en ChampSelect).")
         
+        stages = [
+            threading.Thread(target=self._preprocess_stage, name="ocr-preprocess", daemon=True),
+            threading.Thread(target=self._ocr_stage, name="ocr-recognize", daemon=True),
+        ]
+        for t in stages:
+            t.start()
+        
         try:
-            with mss.mss() as sct:
+            with self.capture_factory() as sct:
                 monitor = sct.monitors[self.monitor_index]
+                active = False
                 while not self.state.stop:
                     now = time.time()
                     if self.state.phase != "ChampSelect":
-                        self.last_small = None
-                        self.last_key = None
-                        self.motion_until = 0.0
-                        self.last_ocr_t = 0.0
-                        self.roi_abs = None
-                        self.roi_lock_until = 0.0
+                        if active and self.ocr_cache.enabled:
+                            log.debug(f"[ocr:cache] {self.ocr_cache.stats()}")
+                        if active:
+                            self._reset_tracking()
+                            active = False
+                        self.roi.invalidate("phase")
                         time.sleep(0.15)
                         continue
                     
-                    if self.roi_abs is None or now >= self.roi_lock_until:
-                        roi = self._calc_band_roi_abs(sct, monitor)
+                    # Nothing to read before lock-in: skip the grab entirely
+                    if not getattr(self.state, "locked_champ_id", None):
+                        if active:
+                            self._reset_tracking()
+                            active = False
+                        self.roi.invalidate("no lock")
+                        time.sleep(0.10)
+                        continue
+                    if not active:
+                        self.scheduler.reset()
+                    active = True
+                    
+                    # Full-window rescan only when the tracker says the band is stale
+                    # (a new locked champion means a new champ select screen)
+                    if self.roi.needs_scan(now, self.state.locked_champ_id, lambda: self._source_rect(monitor)):
+                        src = self.roi.polled_rect or self._source_rect(monitor)
+                        roi = self._calc_band_roi_abs(sct, monitor, src)
                         if roi:
-                            self.roi_abs = roi
-                            self.roi_lock_until = now + self.roi_lock_s
+                            self.roi.set(roi, src, now)
                         else:
                             time.sleep(0.05)
                             continue
                     
-                    L, T, R, B = self.roi_abs
+                    L, T, R, B = self.roi.roi_abs
                     mon = {"left": L, "top": T, "width": max(8, R - L), "height": max(8, B - T)}
                     
                     try:
-                        shot = sct.grab(mon)
-                        band = np.array(shot, dtype=np.uint8)[:, :, :3]
+                        band = self._bgra(sct.grab(mon))
                     except Exception:
+                        self.roi.invalidate("grab failed")
                         time.sleep(0.05)
                         continue
                     
-                    if not getattr(self.state, "locked_champ_id", None):
-                        self.last_small = None
-                        self.last_key = None
-                        self.motion_until = 0.0
-                        self.last_ocr_t = 0.0
-                        self.roi_abs = None
-                        self.roi_lock_until = 0.0
-                        time.sleep(0.10)
-                        continue
-                    
-                    band_bin = preprocess_band_for_ocr(band)
-                    small = cv2.resize(band_bin, (96, 20), interpolation=cv2.INTER_AREA)
-                    changed = True
-                    
-                    if self.last_small is not None:
-                        diff = np.mean(np.abs(small.astype(np.int16) - self.last_small.astype(np.int16))) / 255.0
-                        changed = diff > self.diff_threshold
-                    
-                    self.last_small = small
-                    
-                    if changed:
-                        self.motion_until = now + (self.burst_ms / 1000.0)
-                        if now - self.last_ocr_t >= self.min_ocr_interval:
-                            self._run_ocr_and_match(band_bin)
-                            self.last_ocr_t = now
-                            self.second_shot_at = now + (self.second_shot_ms / 1000.0)
-                    
-                    if self.second_shot_at and now >= self.second_shot_at:
-                        if now - self.last_ocr_t >= (self.min_ocr_interval * 0.6):
-                            self._run_ocr_and_match(band_bin)
-                            self.last_ocr_t = now
-                        self.second_shot_at = 0.0
-                    
-                    if now < self.motion_until and (now - self.last_ocr_t >= self.min_ocr_interval):
-                        self._run_ocr_and_match(band_bin)
-                        self.last_ocr_t = now
+                    self.roi.observe_band(now, band)
+                    self.frames.put(Frame(band, now, self.epoch))
+                    self.stats_capture.add(time.time() - now)
                     
                     if self.emit_dt is not None and now >= self.next_emit and self.last_key:
                         log.info(f"[hover:skin] {self.last_key}")
                         self.next_emit = now + self.emit_dt
                     
-                    time.sleep(1.0 / max(10.0, self.args.burst_hz) if now < self.motion_until else 1.0 / max(5.0, self.args.idle_hz))
+                    self._maybe_report_stats(now)
+                    
+                    # Adaptive rate, independent of downstream (OCR) latency
+                    dt = self.scheduler.next_interval(now, self.motion_until, self.state)
+                    self.scheduler.note_frame(dt)
+                    time.sleep(max(0.0, now + dt - time.time()))
         finally:
-            pass
+            self.stages_stop.set()
 
-    def _run_ocr_and_match(self, band_bin: np.ndarray):
-        """Run OCR and match against database using raw Levenshtein distance"""
-        from rapidfuzz.distance import Levenshtein
-        
-        txt = self.ocr.recognize(band_bin)
-        
-        # Save raw OCR text for writing
-        prev_txt = getattr(self.state, 'ocr_last_text', None)
-        self.state.ocr_last_text = txt
-        
-        if txt and txt != prev_txt:
-            log.debug(f"[ocr:text] {txt}")
-        
-        if not txt or not any(c.isalpha() for c in txt):
+    def _preprocess_stage(self):
+        """Preprocess + change detection; decides when a band deserves an OCR call"""
+        epoch = -1
+        last_ocr_t = 0.0
+        second_shot_at = 0.0
+        while not self.state.stop and not self.stages_stop.is_set():
+            frame = self.frames.get(timeout=0.1)
+            if frame is None:
+                continue
+            if frame.epoch != epoch:
+                epoch = frame.epoch
+                self.prep.reset()
+                last_ocr_t = 0.0
+                second_shot_at = 0.0
+                self.motion_until = 0.0
+            
+            t0 = time.time()
+            now = frame.t
+            band_bin = self.prep.process(frame.band)
+            diff = self.prep.thumb_diff()
+            changed = diff is None or diff > self.diff_threshold
+            
+            submit = False
+            use_cache = False
+            
+            if changed:
+                self.motion_until = now + (self.burst_ms / 1000.0)
+                if now - last_ocr_t >= self.min_ocr_interval:
+                    submit = True
+                    use_cache = True
+                    second_shot_at = now + (self.second_shot_ms / 1000.0)
+            
+            if not submit and second_shot_at and now >= second_shot_at:
+                if now - last_ocr_t >= (self.min_ocr_interval * 0.6):
+                    submit = True
+                second_shot_at = 0.0
+            
+            if not submit and now < self.motion_until and (now - last_ocr_t >= self.min_ocr_interval):
+                submit = True
+            
+            if submit:
+                # The job owns this buffer now; the preprocessor continues in a recycled one
+                self.ocr_jobs.put(OCRJob(self.prep.detach(), now, epoch, frame.band, use_cache))
+                last_ocr_t = now
+            self.scheduler.note_result(now, changed, submit)
+            self.stats_preprocess.add(time.time() - t0)
+
+    def _ocr_stage(self):
+        """Recognition worker: always works on the most recent queued band"""
+        while not self.state.stop and not self.stages_stop.is_set():
+            job = self.ocr_jobs.get(timeout=0.1)
+            if job is None:
+                continue
+            if job.epoch != self.epoch:
+                self.prep.release(job.band_bin)
+                continue
+            t0 = time.time()
+            read = None
+            try:
+                read = self._run_ocr_and_match(job.band_bin, job.band, job.use_cache, job.epoch)
+            except Exception as e:
+                log.debug(f"[ocr] recognition error: {e}")
+            t1 = time.time()
+            if read is not None and self.on_read is not None:
+                read.t_capture, read.t_done, read.ocr_s = job.t, t1, t1 - t0
+                self.on_read(read)
+            self.prep.release(job.band_bin)
+            self.scheduler.note_ocr(t1 - t0)
+            self.stats_ocr.add(t1 - t0)
+            self.stats_latency.add(t1 - job.t)
+
+    def _maybe_report_stats(self, now: float):
+        """Periodic per-stage timing at debug level"""
+        if now < self.next_stats_report:
             return
-        
-        champ_id = self.state.hovered_champ_id or self.state.locked_champ_id
-        
-        # Use multilang database if available, otherwise fallback to regular database
+        window = now - (self.next_stats_report - self.stats_every_s)
+        self.next_stats_report = now + self.stats_every_s
+        log.debug(
+            f"[ocr:pipeline] {self.stats_capture.report(window)} | {self.stats_preprocess.report(window)} | "
+            f"{self.stats_ocr.report(window)} | {self.stats_latency.report(window)} | "
+            f"dropped frames={self.frames.dropped} jobs={self.ocr_jobs.dropped} | sched {self.scheduler.stats()}"
+        )
+
+    def _update_ocr_vocabulary(self):
+        """Constrain OCR to the locked champion's skin names (engine configs are cached by OCR)"""
+        champ_id = getattr(self.state, "locked_champ_id", None) if self.constrained_ocr else None
+        db = self.db
         if self.multilang_db:
-            # Use multilang database with automatic language detection
-            entry = self.multilang_db.find_skin_by_text(txt, champ_id)
-            if entry:
-                # Get English names for the matched entry
-                english_champ, english_full = self.multilang_db.get_english_name(entry)
-                
-                if entry.key != self.last_key:
-                    if entry.kind == "champion":
-                        log.info(f"[hover:skin] {english_full} (skinId=0, champ={entry.champ_slug}, multilang_match)")
-                        self.state.last_hovered_skin_key = english_full
-                        self.state.last_hovered_skin_id = 0  # 0 = base skin
-                        self.state.last_hovered_skin_slug = entry.champ_slug
-                    else:
-                        log.info(f"[hover:skin] {english_full} (skinId={entry.skin_id}, champ={entry.champ_slug}, multilang_match)")
-                        self.state.last_hovered_skin_key = english_full
-                        self.state.last_hovered_skin_id = entry.skin_id
-                        self.state.last_hovered_skin_slug = entry.champ_slug
-                    self.last_key = entry.key
+            # Until the client language is loaded, stay unconstrained: another language's
+            # vocabulary and whitelist could exclude the characters of the real skin name
+            db = self.multilang_db.databases.get(self.multilang_db.current_language)
+            if db is None:
+                champ_id = None
+        key = (champ_id, tuple(db.langs)) if champ_id else None
+        if key == self.vocab_key:
             return
+        self.vocab_key = key
         
-        # Fallback to regular database matching (original logic)
-        # Get all skin entries for this champion (no normalization)
-        pairs = self.db.normalized_entries(champ_id) or []
-        if not pairs and champ_id:
-            slug = self.db.slug_by_id.get(champ_id)
-            if slug:
-                self.db._ensure_champ(slug, champ_id)
-                pairs = self.db.normalized_entries(champ_id) or []
+        words = db.skin_vocabulary(champ_id) if champ_id else []
+        if words:
+            self.ocr.set_vocabulary(f"{'+'.join(db.langs)}_{champ_id}", words)
+        else:
+            self.ocr.clear_vocabulary()
+
+    def _run_ocr_and_match(self, band_bin: np.ndarray, band: Optional[np.ndarray] = None, use_cache: bool = True,
+                           epoch: Optional[int] = None) -> OCRRead:
+        """Run OCR (or reuse a cached read of a near-identical band) and match against database
+
+        Only matched reads are cached. Re-reads (use_cache=False) always run OCR and
+        overwrite whatever the first read of the same band stored.
+        """
+        self._update_ocr_vocabulary()
         
-        if not pairs:
-            return
+        champ_id = self.state.hovered_champ_id or self.state.locked_champ_id
+        h = None
+        hit = None
+        if self.ocr_cache.enabled:
+            lang = self.multilang_db.current_language if self.multilang_db else None
+            self.ocr_cache.set_context((self.ocr.lang, lang, champ_id))
+            h = band_hash(band_bin)
+            if use_cache:
+                hit = self.ocr_cache.get(h)
         
-        # Find best match using raw Levenshtein distance
-        best_distance = float('inf')
-        best_entry = None
-        best_skin_name = None
+        if hit is not None:
+            txt, match = hit.text, hit.match
+        else:
+            txt, match = self._recognize_and_match(band_bin, band, champ_id)
+            # Misses and below-threshold reads (match is None) are never cached
+            if h is not None and match is not None:
+                self.ocr_cache.put(h, txt, match)
         
-        for entry, normalized_key in pairs:
-            if entry.kind not in ["skin", "champion"]:
-                continue
-                
-            # Get the original skin name (not normalized)
-            if entry.kind == "skin":
-                skin_name = self.db.skin_name_by_id.get(entry.skin_id) or entry.key
-            else:  # champion (base skin)
-                skin_name = self.db.champ_name_by_id.get(entry.champ_id) or entry.key
+        with self.publish_lock:
+            # Tracking was reset while this read ran (champion/phase change): drop it
+            if epoch is not None and epoch != self.epoch:
+                return OCRRead(txt, None, hit is not None)
+            
+            # Save raw OCR text for writing
+            prev_txt = getattr(self.state, 'ocr_last_text', None)
+            self.state.ocr_last_text = txt
             
-            # Calculate raw Levenshtein distance
-            distance = Levenshtein.distance(txt, skin_name)
+            if txt and txt != prev_txt:
+                log.debug(f"[ocr:text] {txt}{' (cached)' if hit is not None else ''}")
             
-            if distance < best_distance:
-                best_distance = distance
-                best_entry = entry
-                best_skin_name = skin_name
+            if match is not None:
+                self._apply_match(match)
+        return OCRRead(txt, match, hit is not None)
+
+    def _recognize_and_match(self, band_bin: np.ndarray, band: Optional[np.ndarray], champ_id: Optional[int]) -> Tuple[str, Optional[HoverMatch]]:
+        """Single read, or (with an OCR pool) primary + alternate preprocessings read in parallel and voted"""
+        extra = getattr(self.ocr, "workers", 1) - 1
+        if band is None or extra <= 0:
+            txt = self.ocr.recognize(band_bin)
+            return txt, self._match_text(txt, champ_id)
         
-        # Check if the best match meets confidence threshold
-        # Convert distance to a score: 1.0 - (distance / max_length)
-        max_len = max(len(txt), len(best_skin_name)) if best_skin_name else 1
-        score = 1.0 - (best_distance / max_len) if max_len > 0 else 0.0
+        imgs = [band_bin] + preprocess_band_variants(band, extra)
+        texts = self.ocr.recognize_many(imgs)
+        votes = {}
+        for txt in texts:
+            m = self._match_text(txt, champ_id)
+            if m is None:
+                continue
+            n, first_txt, first_m = votes.get(m.entry.key, (0, txt, m))
+            votes[m.entry.key] = (n + 1, first_txt, first_m)
+        if not votes:
+            return texts[0], None
+        # Most votes wins; dict order keeps the primary read ahead on ties
+        n, txt, match = max(votes.values(), key=lambda v: v[0])
+        if len(votes) > 1:
+            log.debug(f"[ocr:vote] {[(k, v[0]) for k, v in votes.items()]} -> {match.entry.key}")
+        return txt, match
+
+    def _match_text(self, txt: str, champ_id: Optional[int]) -> Optional[HoverMatch]:
+        """Match OCR text against the database"""
+        if not txt or not any(c.isalpha() for c in txt):
+            return None
         
-        if best_entry is None or score < self.args.min_conf:
-            return
+        # Use multilang database if available, otherwise fallback to regular database
+        if self.multilang_db:
+            # Use multilang database with automatic language detection
+            entry = self.multilang_db.find_skin_by_text(txt, champ_id)
+            if not entry:
+                return None
+            # Get English names for the matched entry
+            english_champ, english_full = self.multilang_db.get_english_name(entry)
+            return HoverMatch(entry, english_full, "multilang_match")
         
-        if best_entry.key != self.last_key:
-            # Log with raw distance and score
-            if best_entry.kind == "champion":
-                log.info(f"[hover:skin] {best_skin_name} (skinId=0, champ={best_entry.champ_slug}, distance={best_distance}, score={score:.3f})")
-                self.state.last_hovered_skin_key = best_skin_name
-                self.state.last_hovered_skin_id = 0  # 0 = base skin
-                self.state.last_hovered_skin_slug = best_entry.champ_slug
-            else:
-                log.info(f"[hover:skin] {best_skin_name} (skinId={best_entry.skin_id}, champ={best_entry.champ_slug}, distance={best_distance}, score={score:.3f})")
-                self.state.last_hovered_skin_key = best_skin_name
-                self.state.last_hovered_skin_id = best_entry.skin_id
-                self.state.last_hovered_skin_slug = best_entry.champ_slug
-            self.last_key = best_entry.key
+        # Fallback to regular database matching: precompiled per-champion index, or the
+        # n-gram index over every skin when the champion is unknown (once built in the background)
+        if champ_id:
+            match = self.db.match_index(champ_id).best(txt)
+        else:
+            found = self.db.search(txt, k=1)
+            match = found[0] if found else None
+        if match is None or match.score < self.args.min_conf:
+            return None
+        # Log with raw distance and score
+        return HoverMatch(match.entry, match.name, f"distance={match.distance}, score={match.score:.3f}")
+
+    def _apply_match(self, match: HoverMatch):
+        """Publish a matched skin to shared state (caller holds publish_lock)"""
+        entry = match.entry
+        if entry.key == self.last_key:
+            return
+        if entry.kind == "champion":
+            log.info(f"[hover:skin] {match.label} (skinId=0, champ={entry.champ_slug}, {match.detail})")
+            self.state.last_hovered_skin_key = match.label
+            self.state.last_hovered_skin_id = 0  # 0 = base skin
+            self.state.last_hovered_skin_slug = entry.champ_slug
+        else:
+            log.info(f"[hover:skin] {match.label} (skinId={entry.skin_id}, champ={entry.champ_slug}, {match.detail})")
+            self.state.last_hovered_skin_key = match.label
+            self.state.last_hovered_skin_id = entry.skin_id
+            self.state.last_hovered_skin_slug = entry.champ_slug
+        self.last_key = entry.key
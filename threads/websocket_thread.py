@@ -12,7 +12,8 @@ import base64
 import threading
 from typing import Optional
 from lcu.client import LCU
-from lcu.utils import compute_locked
+from lcu.session_store import SESSION_MAX_AGE_S
+from lcu.champ_select_model import ChampSelectModel, HOVER, LOCK, PLAYERS, TIMER_PHASE, UNLOCK
 from database.name_db import NameDB
 from state.shared_state import SharedState
 from threads.loadout_ticker import LoadoutTicker
@@ -26,6 +27,40 @@ try:
 except Exception:
     websocket = None
 
+# Optional faster JSON decoder
+try:
+    import orjson  # pyright: ignore[reportMissingImports]
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Endpoints whose events are consumed; each gets its own WAMP subscription
+# (OnJsonApiEvent_<path with / as _>) instead of the OnJsonApiEvent firehose
+SUBSCRIBED_URIS = (
+    "/lol-gameflow/v1/gameflow-phase",
+    "/lol-champ-select/v1/hovered-champion-id",
+    "/lol-champ-select/v1/session",
+)
+
+
+def _event_name(uri: str) -> str:
+    return "OnJsonApiEvent" + uri.replace("/", "_")
+
+
+def _message_uri(msg: str) -> Optional[str]:
+    """URI of a JSON API event without decoding it (the "uri" key comes last in LCU payloads)
+
+    None when it cannot be read reliably (no compact "uri":" key, escapes): decode the message then.
+    """
+    i = msg.rfind('"uri":"')
+    if i < 0:
+        return None
+    i += 7
+    j = msg.find('"', i)
+    if j <= i or "\\" in msg[i:j]:
+        return None
+    return msg[i:j]
+
 
 class WSEventThread(threading.Thread):
     """WebSocket event thread with WAMP + lock counter + timer"""
@@ -44,6 +79,7 @@ class WSEventThread(threading.Thread):
         self.fallback_ms = fallback_ms
         self.injection_manager = injection_manager
         self.ticker: Optional[LoadoutTicker] = None
+        self.model = ChampSelectModel()
 
     def _maybe_start_timer(self, sess: dict):
         """Start timer if conditions are met"""
@@ -60,10 +96,12 @@ class WSEventThread(threading.Thread):
             should_start = True
         # All locked: try to READ LCU timer (short grace window) before fallback
         elif (total > 0 and locked_count >= total):
-            if left_ms <= 0:
+            # With a fresh push snapshot the next session update re-runs this check;
+            # probing here would only re-read the snapshot while blocking the feed
+            if left_ms <= 0 and not self.lcu.sessions.fresh(SESSION_MAX_AGE_S):
                 # Small 0.5s window to let LCU publish a non-zero timer
                 for _ in range(8):  # 8 * 60ms ~= 480ms
-                    s2 = self.lcu.session() or {}
+                    s2 = self.lcu.session(max_age_s=SESSION_MAX_AGE_S) or {}
                     t2 = (s2.get("timer") or {})
                     left_ms = int(t2.get("adjustedTimeLeftInPhase") or 0)
                     if left_ms > 0:
@@ -110,6 +148,8 @@ class WSEventThread(threading.Thread):
                         self.state.processed_action_ids = set()
                 else:
                     # Exit → reset locks/timer
+                    self.lcu.sessions.clear()
+                    self.model.reset()
                     self.state.hovered_champ_id = None
                     self.state.players_visible = 0
                     self.state.locks_by_cell.clear()
@@ -128,50 +168,39 @@ class WSEventThread(threading.Thread):
                 self.state.hovered_champ_id = cid
         
         elif uri == "/lol-champ-select/v1/session":
+            self.lcu.sessions.put(payload.get("data"))
+            if not self.lcu.sessions.live:
+                # First pushed session: the subscription works, serve readers from memory
+                self.lcu.sessions.set_live(True)
+                log.debug("[ws] session feed live")
             sess = payload.get("data") or {}
             self.state.local_cell_id = sess.get("localPlayerCellId", self.state.local_cell_id)
             
-            # Visible players (distinct cellIds)
-            seen = set()
-            for side in (sess.get("myTeam") or [], sess.get("theirTeam") or []):
-                for p in side or []:
-                    cid = p.get("cellId")
-                    if cid is not None: 
-                        seen.add(int(cid))
-            if not seen:
-                for rnd in (sess.get("actions") or []):
-                    for a in rnd or []:
-                        cid = a.get("actorCellId")
-                        if cid is not None: 
-                            seen.add(int(cid))
-            
-            count_visible = len(seen)
-            if count_visible != self.state.players_visible and count_visible > 0:
-                self.state.players_visible = count_visible
-                log.info(f"[players] #Players: {count_visible}")
-            
-            # Lock counter: diff cellId → championId
-            new_locks = compute_locked(sess)
-            prev_cells = set(self.state.locks_by_cell.keys())
-            curr_cells = set(new_locks.keys())
-            added = sorted(list(curr_cells - prev_cells))
-            removed = sorted(list(prev_cells - curr_cells))
-            
-            for cid in added:
-                ch = new_locks[cid]
-                # Readable label if available
-                champ_label = self.db.champ_name_by_id.get(int(ch), f"#{ch}")
-                log.info(f"[locks] +1 {champ_label} — {len(curr_cells)}/{self.state.players_visible}")
-                if self.state.local_cell_id is not None and cid == int(self.state.local_cell_id):
-                    log.info(f"[lock:champ] {champ_label} (id={ch})")
-                    self.state.locked_champ_id = int(ch)
-            
-            for cid in removed:
-                ch = self.state.locks_by_cell.get(cid, 0)
-                champ_label = self.db.champ_name_by_id.get(int(ch), f"#{ch}")
-                log.info(f"[locks] -1 {champ_label} — {len(curr_cells)}/{self.state.players_visible}")
-            
-            self.state.locks_by_cell = new_locks
+            events = self.model.apply(sess)
+            n_locked = len(self.model.locks)
+            for ev in events:
+                if ev.kind == PLAYERS:
+                    self.state.players_visible = ev.value
+                    log.info(f"[players] #Players: {ev.value}")
+                elif ev.kind == LOCK:
+                    if ev.value is not None:
+                        continue  # lock switched champion: no count change
+                    champ_label = self.db.champ_name_by_id.get(ev.champion_id, f"#{ev.champion_id}")
+                    log.info(f"[locks] +1 {champ_label} — {n_locked}/{self.state.players_visible}")
+                    if self.state.local_cell_id is not None and ev.cell_id == int(self.state.local_cell_id):
+                        log.info(f"[lock:champ] {champ_label} (id={ev.champion_id})")
+                        self.state.locked_champ_id = ev.champion_id
+                elif ev.kind == UNLOCK:
+                    champ_label = self.db.champ_name_by_id.get(ev.champion_id, f"#{ev.champion_id}")
+                    log.info(f"[locks] -1 {champ_label} — {n_locked}/{self.state.players_visible}")
+                elif ev.kind == HOVER and ev.champion_id != self.state.hovered_champ_id:
+                    nm = self.db.champ_name_by_id.get(ev.champion_id) or f"champ_{ev.champion_id}"
+                    log.info(f"[hover:champ] {nm} (id={ev.champion_id})")
+                    self.state.hovered_champ_id = ev.champion_id
+                elif ev.kind == TIMER_PHASE:
+                    log.debug(f"[timer] phase {ev.value}")
+            if events:
+                self.state.locks_by_cell = dict(self.model.locks)
             
             # ALL LOCKED
             total = self.state.players_visible
@@ -189,14 +218,19 @@ class WSEventThread(threading.Thread):
         """WebSocket connection opened"""
         log.info("[ws] connecté")
         try: 
-            ws.send('[5,"OnJsonApiEvent"]')
+            for uri in SUBSCRIBED_URIS:
+                ws.send(f'[5,"{_event_name(uri)}"]')
         except Exception as e: 
             log.debug(f"[ws] subscribe error: {e}")
 
     def _on_message(self, ws, msg):
         """WebSocket message received"""
+        # Drop events for other URIs before paying for a full decode; unreadable ones are decoded
+        uri = _message_uri(msg)
+        if uri is not None and uri not in SUBSCRIBED_URIS:
+            return
         try:
-            data = json.loads(msg)
+            data = _loads(msg)
             if isinstance(data, list) and len(data) >= 3:
                 if data[0] == 8 and isinstance(data[2], dict):
                     self._handle_api_event(data[2])
@@ -212,6 +246,7 @@ class WSEventThread(threading.Thread):
 
     def _on_close(self, ws, status, msg):
         """WebSocket connection closed"""
+        self.lcu.sessions.set_live(False)
         log.debug(f"[ws] fermé: {status} {msg}")
 
     def run(self):
@@ -255,4 +290,5 @@ class WSEventThread(threading.Thread):
                 )
             except Exception as e:
                 log.debug(f"[ws] exception: {e}")
+            self.lcu.sessions.set_live(False)
             time.sleep(1.0)
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Recorded-frame capture source (drop-in for mss) for offline OCR replay
+"""
+
+import os
+import json
+import time
+import glob
+from dataclasses import dataclass
+from typing import List, Optional, Dict, Any
+import numpy as np
+import cv2
+
+FRAME_EXTS = (".png", ".jpg", ".jpeg", ".bmp", ".npz", ".npy")
+
+
+@dataclass
+class ReplayShot:
+    """Minimal mss ScreenShot stand-in (BGRA raw buffer)"""
+    raw: bytearray
+    width: int
+    height: int
+
+
+def load_ground_truth(path: str) -> Dict[str, Any]:
+    """Read ground_truth.json of a recorded/synthetic dataset
+
+    Format: {"lang": "fr_FR", "ocr_lang": "fra", "champion_id": 1, "fps": 30,
+             "video": "clip.mp4" (optional),
+             "frames": [{"file": "000000.png", "t": 0.0, "skin_id": 1001}, ...]}
+    A frame without "file" refers to the video frame at index position.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        gt = json.load(f)
+    frames = gt.get("frames") or []
+    fps = float(gt.get("fps") or 30.0)
+    for i, fr in enumerate(frames):
+        fr.setdefault("t", i / fps)
+    return gt
+
+
+def _read_frame(path: str) -> Optional[np.ndarray]:
+    """Load one frame file as BGRA"""
+    if path.endswith(".npz"):
+        with np.load(path) as z:
+            img = z["frame"] if "frame" in z.files else z[z.files[0]]
+    elif path.endswith(".npy"):
+        img = np.load(path)
+    else:
+        img = cv2.imread(path, cv2.IMREAD_UNCHANGED)
+    if img is None:
+        return None
+    if img.ndim == 2:
+        return cv2.cvtColor(img, cv2.COLOR_GRAY2BGRA)
+    if img.shape[2] == 3:
+        return cv2.cvtColor(img, cv2.COLOR_BGR2BGRA)
+    return img
+
+
+class ReplayCapture:
+    """Serves recorded frames through the mss API (monitors / grab / context manager)
+
+    Frames are played against the wall clock from the first grab (speed > 1 plays faster),
+    so pipeline timing behaves as it would live.
+    """
+
+    def __init__(self, dataset_dir: str, speed: float = 1.0, gt: Optional[Dict[str, Any]] = None):
+        self.dataset_dir = dataset_dir
+        self.speed = max(0.01, float(speed))
+        gt_path = os.path.join(dataset_dir, "ground_truth.json")
+        self.gt = gt if gt is not None else (load_ground_truth(gt_path) if os.path.isfile(gt_path) else {})
+        self.times: List[float] = []
+        self.files: List[Optional[str]] = []
+        self._video = None
+        self._video_pos = -1
+        video = self.gt.get("video")
+        if video:
+            self._video = cv2.VideoCapture(os.path.join(dataset_dir, video))
+        for fr in self.gt.get("frames") or []:
+            self.times.append(float(fr["t"]))
+            self.files.append(os.path.join(dataset_dir, fr["file"]) if fr.get("file") else None)
+        if not self.times and self._video is not None:
+            fps = float(self.gt.get("fps") or self._video.get(cv2.CAP_PROP_FPS) or 30.0)
+            n = int(self._video.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
+            self.files = [None] * n
+            self.times = [i / fps for i in range(n)]
+        if not self.times and self._video is None:
+            # Bare directory of frames: file order, fps from ground truth or 30
+            fps = float(self.gt.get("fps") or 30.0)
+            paths = sorted(p for p in glob.glob(os.path.join(dataset_dir, "*")) if p.lower().endswith(FRAME_EXTS))
+            self.files = paths
+            self.times = [i / fps for i in range(len(paths))]
+        self.t_start: Optional[float] = None
+        self._idx = -1
+        self._img: Optional[np.ndarray] = None
+        first = self._load(0)
+        h, w = (first.shape[:2] if first is not None else (1080, 1920))
+        self.monitors = [{"left": 0, "top": 0, "width": w, "height": h}] * 2
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._video is not None:
+            self._video.release()
+            self._video = None
+
+    @property
+    def finished(self) -> bool:
+        """True once the clock is past the last frame"""
+        return self.t_start is not None and self.clock() > (self.times[-1] if self.times else 0.0)
+
+    def clock(self) -> float:
+        """Replay time (s) of the current wall-clock instant"""
+        if self.t_start is None:
+            return 0.0
+        return (time.time() - self.t_start) * self.speed
+
+    def to_replay_time(self, wall_t: float) -> float:
+        """Map a wall-clock timestamp (time.time()) to replay time"""
+        return (wall_t - (self.t_start or wall_t)) * self.speed
+
+    def _load(self, i: int) -> Optional[np.ndarray]:
+        if i == self._idx:
+            return self._img
+        if self._video is not None and (i >= len(self.files) or self.files[i] is None):
+            if i < self._video_pos:
+                self._video.set(cv2.CAP_PROP_POS_FRAMES, i)
+                self._video_pos = i - 1
+            img = None
+            while self._video_pos < i:
+                ok, img = self._video.read()
+                self._video_pos += 1
+                if not ok:
+                    return self._img
+            img = cv2.cvtColor(img, cv2.COLOR_BGR2BGRA)
+        elif i < len(self.files) and self.files[i]:
+            img = _read_frame(self.files[i])
+        else:
+            return self._img
+        self._idx, self._img = i, img
+        return img
+
+    def current_index(self) -> int:
+        """Index of the frame shown at the current replay time"""
+        if self.t_start is None:
+            self.t_start = time.time()
+        t = self.clock()
+        i = int(np.searchsorted(self.times, t, side="right")) - 1
+        return max(0, min(i, len(self.times) - 1))
+
+    def grab(self, mon: Dict[str, int]) -> ReplayShot:
+        """Crop of the frame shown now"""
+        img = self._load(self.current_index())
+        if img is None:
+            raise RuntimeError("no replay frame")
+        H, W = img.shape[:2]
+        l = max(0, int(mon["left"]))
+        t = max(0, int(mon["top"]))
+        r = min(W, l + int(mon["width"]))
+        b = min(H, t + int(mon["height"]))
+        crop = np.ascontiguousarray(img[t:b, l:r])
+        return ReplayShot(bytearray(crop.tobytes()), r - l, b - t)